@@ -0,0 +1,40 @@
+import time
+
+from surrealist.ql.bulk import AdaptiveBatcher, bulk_insert
+from surrealist.result import SurrealResult
+
+# Benchmark for adaptive batch sizing, it does not need SurrealDB server: a fake connection sleeps for a fixed round
+# trip plus a time for each record and reports the server time like SurrealDB does.
+# Compares small fixed batches (round trips dominate) with AdaptiveBatcher, which starts small and finds the size
+# for the target latency.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/adaptive_batcher_benchmark.py
+
+RECORDS = 50_000
+ROUND_TRIP = 0.005  # seconds per request
+PER_RECORD = 0.00001  # seconds of the server per record
+
+
+class FakeConnection:
+    def query(self, query):
+        server = query.count('{"n"') * PER_RECORD
+        time.sleep(ROUND_TRIP + server)
+        return SurrealResult(result=[], time=f"{server * 1000:.3f}ms")
+
+
+def rows():
+    return ({"n": i, "name": f"John {i}"} for i in range(RECORDS))
+
+
+def run(batch_size) -> float:
+    start = time.perf_counter()
+    stats = bulk_insert(FakeConnection(), "person", rows(), batch_size=batch_size, concurrency=1)
+    assert stats["records"] == RECORDS
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    fixed = run(100)
+    batcher = AdaptiveBatcher(initial_size=100, target_latency=0.05)
+    adaptive = run(batcher)
+    print(f"{RECORDS} records: fixed batches of 100 {fixed:.3f}s, adaptive {adaptive:.3f}s "
+          f"(final size {batcher.size}), speedup x{fixed / adaptive:.2f}")
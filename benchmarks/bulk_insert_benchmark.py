@@ -0,0 +1,52 @@
+import time
+
+from surrealist.ql.bulk import bulk_insert
+from surrealist.ql.statements.insert import Insert
+from surrealist.result import SurrealResult
+
+# Benchmark for the bulk insert without SurrealDB server: each INSERT costs a fixed 10ms round trip, whatever the size
+# of the batch, and batches of different threads are written at the same time.
+# Compares sequential Insert of chunks with bulk_insert of 4 threads, so the gain comes from overlapping round trips.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/bulk_insert_benchmark.py
+
+RECORDS = 20_000
+BATCH_SIZE = 500
+LATENCY = 0.01  # seconds per request
+
+
+class FakeConnection:
+    def query(self, _query):
+        time.sleep(LATENCY)
+        return SurrealResult(result=[])
+
+
+def rows():
+    return ({"name": f"John {i}", "age": i % 90, "tags": ["a", "b"]} for i in range(RECORDS))
+
+
+def with_insert():
+    connection, chunk = FakeConnection(), []
+    for row in rows():
+        chunk.append(row)
+        if len(chunk) == BATCH_SIZE:
+            Insert(connection, "person", chunk).run()
+            chunk = []
+    if chunk:
+        Insert(connection, "person", chunk).run()
+
+
+def with_bulk_insert():
+    stats = bulk_insert(FakeConnection(), "person", rows(), batch_size=BATCH_SIZE, concurrency=4)
+    assert stats["records"] == RECORDS
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    old = min(measure(with_insert) for _ in range(3))
+    new = min(measure(with_bulk_insert) for _ in range(3))
+    print(f"{RECORDS} records: chunked insert {old:.3f}s, bulk_insert {new:.3f}s, speedup x{old / new:.2f}")
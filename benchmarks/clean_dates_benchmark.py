@@ -0,0 +1,24 @@
+import datetime
+from timeit import repeat
+
+from surrealist.ql.statements.insert import Insert
+from surrealist.utils import clean_dates, mask_pass
+
+# Micro-benchmark for the cost of regex post-processing of queries, it does not need SurrealDB server.
+# Before, every query went through clean_dates and every sent message through mask_pass, even without debug logs.
+# Now date literals are rendered by query builders and the regex pass is off by default (clean_dates=True turns it on).
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/clean_dates_benchmark.py
+
+NUMBER = 5
+created = datetime.datetime(2024, 10, 23, 16, 6, 51, 322496)
+
+if __name__ == '__main__':
+    for size in (10, 1_000, 50_000):
+        records = [{"name": f"John {i}", "age": i, "created": created} for i in range(size)]
+        query = Insert(None, "person", records).to_str()
+        assert clean_dates(query) == query
+        build = min(repeat(lambda: Insert(None, "person", records).to_str(), number=NUMBER, repeat=3)) / NUMBER
+        clean = min(repeat(lambda: clean_dates(query), number=NUMBER, repeat=3)) / NUMBER
+        mask = min(repeat(lambda: mask_pass(query), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{len(query):>10,} chars: build {build * 1e3:.2f}ms, clean_dates {clean * 1e3:.2f}ms "
+              f"(+{clean / build:.0%}), mask_pass {mask * 1e3:.3f}ms")
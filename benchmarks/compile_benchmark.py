@@ -0,0 +1,30 @@
+import json
+from timeit import repeat
+
+from surrealist.ql.statements.insert import Insert
+
+# Micro-benchmark for compiled (parameterized) statements, it does not need SurrealDB server.
+# Compares the client cost of INSERT with inline values (to_str) and with variables (compile), both including
+# serialization of the message for the transport, as websocket client does it.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/compile_benchmark.py
+
+NUMBER = 5
+
+
+def inline(records):
+    return json.dumps({"method": "query", "params": [Insert(None, "person", records).to_str()]}, ensure_ascii=False)
+
+
+def compiled(records):
+    return json.dumps({"method": "query", "params": list(Insert(None, "person", records).compile())},
+                      ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    for size in (10, 1_000, 50_000):
+        records = [{"name": f"Jöhn {i}", "age": i, "tags": ["a", "b"], "address": {"city": "Paris"}}
+                   for i in range(size)]
+        old = min(repeat(lambda: inline(records), number=NUMBER, repeat=3)) / NUMBER
+        new = min(repeat(lambda: compiled(records), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{size:>6} records: inline {old * 1e3:.2f}ms ({len(inline(records)):,} bytes), compiled "
+              f"{new * 1e3:.2f}ms ({len(compiled(records)):,} bytes), speedup x{old / new:.1f}")
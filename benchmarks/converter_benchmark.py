@@ -0,0 +1,34 @@
+from timeit import repeat
+
+from surrealist import RecordId, ResultConverter
+from surrealist.utils import to_datetime
+
+# Micro-benchmark for converting datetime and record id fields of records, it does not need SurrealDB server.
+# Compares a per-row loop with to_datetime and RecordId with ResultConverter (with and without NumPy).
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/converter_benchmark.py
+
+NUMBER = 20
+
+
+def records():
+    return [{"id": f"person:{i}", "author": f"user:{i % 10}", "created_at": f"2024-01-24T11:31:{i % 60:02}.347880Z"}
+            for i in range(5000)]
+
+
+def per_row(rows):
+    for row in rows:
+        row["id"] = RecordId(row["id"])
+        row["author"] = RecordId(row["author"])
+        row["created_at"] = to_datetime(row["created_at"])
+    return rows
+
+
+if __name__ == '__main__':
+    loop = min(repeat(lambda: per_row(records()), number=1, repeat=NUMBER))
+    python = min(repeat(lambda: ResultConverter(use_numpy=False, id_fields=["author"]).convert(records()), number=1,
+                        repeat=NUMBER))
+    numpy = min(repeat(lambda: ResultConverter(id_fields=["author"]).convert(records()), number=1, repeat=NUMBER))
+    build = min(repeat(records, number=1, repeat=NUMBER))
+    loop, python, numpy = loop - build, python - build, numpy - build
+    print(f"5000 records: per-row loop {loop * 1e3:.2f}ms, converter {python * 1e3:.2f}ms (x{loop / python:.2f}), "
+          f"converter with NumPy (if installed) {numpy * 1e3:.2f}ms (x{loop / numpy:.2f})")
@@ -0,0 +1,47 @@
+import sys
+import time
+from timeit import repeat
+
+from surrealist import Database, SnowflakeGenerator, get_ulid, get_uuid, get_uuid7
+
+# Benchmark for client-side id generators.
+# Without arguments it measures only the speed of generation, it does not need SurrealDB server.
+# With url of a running SurrealDB (root/root credentials, namespace and database "test") it also inserts records with
+# random (v4) and time-ordered ids and measures insert throughput and a range scan on the latest records.
+# Run it from the root of the repository:
+# PYTHONPATH=src python benchmarks/id_generators_benchmark.py [http://127.0.0.1:8000]
+
+NUMBER = 100_000
+RECORDS = 100_000
+BATCH = 1000
+snowflake = SnowflakeGenerator(1)
+GENERATORS = (("uuid4", get_uuid), ("ulid", get_ulid), ("uuid7", get_uuid7), ("snowflake", snowflake))
+
+
+def generation():
+    for name, generator in GENERATORS:
+        best = min(repeat(generator, number=NUMBER, repeat=5))
+        print(f"{name:10} {best / NUMBER * 1e6:.3f}µs per id")
+
+
+def inserts(url: str):
+    with Database(url, "test", "test", credentials=("root", "root")) as db:
+        for name, generator in GENERATORS:
+            table = db.table(f"bench_{name}")
+            table.remove()
+            start = time.perf_counter()
+            for _ in range(RECORDS // BATCH):
+                table.insert([{"value": i} for i in range(BATCH)], id_generator=generator).run()
+            spent = time.perf_counter() - start
+            start = time.perf_counter()
+            result = table.select("id").order_by("id").limit(BATCH).run()
+            scan = time.perf_counter() - start
+            print(f"{name:10} insert {RECORDS / spent:,.0f} records/s, first {result.count()} records in "
+                  f"{scan * 1e3:.1f}ms")
+            table.remove()
+
+
+if __name__ == '__main__':
+    generation()
+    if len(sys.argv) > 1:
+        inserts(sys.argv[1])
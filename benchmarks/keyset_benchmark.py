@@ -0,0 +1,33 @@
+import sys
+import time
+
+from surrealist import Database
+
+# Benchmark for keyset pagination, it needs a running SurrealDB (root/root credentials, namespace and database "test").
+# Fills a table and scans it page by page with LIMIT ... START AT (offset) and with WHERE id > last (keyset).
+# Offset pagination re-reads all skipped rows on every page, so its time per page grows with the position.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/keyset_benchmark.py http://127.0.0.1:8000
+
+RECORDS = 100_000
+PAGE = 1000
+
+
+def scan(iterator) -> float:
+    start = time.perf_counter()
+    count = sum(result.count() for result in iterator)
+    assert count == RECORDS, count
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    url = sys.argv[1] if len(sys.argv) > 1 else "http://127.0.0.1:8000"
+    with Database(url, "test", "test", credentials=("root", "root")) as db:
+        table = db.table("bench_keyset")
+        table.remove()
+        for i in range(0, RECORDS, PAGE):
+            table.insert([{"id": j, "value": j} for j in range(i, i + PAGE)]).run()
+        offset = scan(table.select().iter(limit=PAGE))
+        keyset = scan(table.select().iter(limit=PAGE, key="id"))
+        print(f"{RECORDS} records by {PAGE}: offset {offset:.2f}s, keyset {keyset:.2f}s, "
+              f"speedup x{offset / keyset:.1f}")
+        table.remove()
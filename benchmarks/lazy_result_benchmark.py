@@ -0,0 +1,30 @@
+import json
+from timeit import repeat
+
+from surrealist.result import to_lazy_result, to_result
+
+# Micro-benchmark for lazy results, it does not need SurrealDB server.
+# Compares full decoding (to_result) with lazy decoding for calls, which need only status, count or ids.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/lazy_result_benchmark.py
+
+NUMBER = 200
+records = [{"id": f"person:{i}", "name": f"John {i}", "age": i, "tags": ["a", "b"],
+            "created_at": "2024-01-24T11:31:06.347880800Z"} for i in range(1000)]
+text = json.dumps({"id": "0d2a1f3a-2a5c-4d3e-9b1c-1c8f0e6b1a11",
+                   "result": [{"result": records, "status": "OK", "time": "32.375µs"}]},
+                  ensure_ascii=False, separators=(",", ":"))
+CASES = (
+    ("is_error", lambda res: res.is_error()),
+    ("count", lambda res: res.count()),
+    ("ids", lambda res: res.ids),
+    ("result", lambda res: res.result),
+)
+
+if __name__ == '__main__':
+    print(f"payload: {len(records)} records, {len(text)} chars")
+    for name, action in CASES:
+        assert action(to_result(text)) == action(to_lazy_result(text))
+        full = min(repeat(lambda: action(to_result(text)), number=NUMBER, repeat=5))
+        lazy = min(repeat(lambda: action(to_lazy_result(text)), number=NUMBER, repeat=5))
+        print(f"{name:>8}: to_result {full / NUMBER * 1e3:.3f}ms, lazy {lazy / NUMBER * 1e3:.3f}ms, "
+              f"speedup x{full / lazy:.2f}")
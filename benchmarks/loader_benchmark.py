@@ -0,0 +1,56 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from surrealist.loader import RecordLoader
+from surrealist.result import SurrealResult
+
+# Benchmark for batching of lookups by id without SurrealDB server: the fake counts requests and answers each select
+# of ids after 2ms, however many ids it has.
+# 500 lookups of 50 authors come from 20 threads like resolvers of GraphQL, a select for each lookup (N+1) is compared
+# with RecordLoader by time and by the number of requests.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/loader_benchmark.py
+
+LOOKUPS = 500
+AUTHORS = 50
+LATENCY = 0.002  # seconds per request
+
+
+class FakeConnection:
+    def __init__(self):
+        self.requests = 0
+
+    def select(self, table, record_id):
+        time.sleep(LATENCY)
+        self.requests += 1
+        return SurrealResult(result={"id": f"{table}:{record_id}"})
+
+    def query(self, query):
+        time.sleep(LATENCY)
+        self.requests += 1
+        ids = query[query.index("[") + 1:query.index("]")].split(", ")
+        return SurrealResult(result=[{"id": e} for e in ids])
+
+
+def one_by_one(connection):
+    with ThreadPoolExecutor(20) as executor:
+        list(executor.map(lambda i: connection.select("author", str(i % AUTHORS)).result, range(LOOKUPS)))
+
+
+def with_loader(connection):
+    loader = RecordLoader(connection)
+    with ThreadPoolExecutor(20) as executor:
+        list(executor.map(lambda i: loader.get(f"author:{i % AUTHORS}"), range(LOOKUPS)))
+
+
+def measure(func):
+    connection = FakeConnection()
+    start = time.perf_counter()
+    func(connection)
+    return time.perf_counter() - start, connection.requests
+
+
+if __name__ == '__main__':
+    old, old_requests = measure(one_by_one)
+    new, new_requests = measure(with_loader)
+    print(f"{LOOKUPS} lookups: select {old:.3f}s ({old_requests} requests), loader {new:.3f}s ({new_requests} "
+          f"requests), speedup x{old / new:.2f}")
@@ -0,0 +1,58 @@
+import re
+import time
+
+from surrealist.ql.parallel_scan import ParallelScan
+from surrealist.ql.statements.select import Select
+from surrealist.result import SurrealResult
+
+# Benchmark for the parallel scan without SurrealDB server: the fake table answers pages of keyset queries and the
+# smallest and the largest key after a fixed delay, requests of partition threads overlap as on a pool.
+# Compares keyset iteration on one thread with the scan of 4 partitions, with given boundaries and with boundaries
+# found by the scan itself (two more requests before the first page).
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/parallel_scan_benchmark.py
+
+RECORDS = 10_000
+PAGE_SIZE = 200
+PARTITIONS = 4
+LATENCY = 0.005  # seconds per request
+
+
+class FakeConnection:
+    def query(self, query):
+        time.sleep(LATENCY)
+        if query.startswith("SELECT VALUE n"):
+            return SurrealResult(result=[RECORDS - 1 if "DESC" in query else 0])
+        low = re.search(r"n >= (\d+)", query)
+        high = re.search(r"n < (\d+)", query)
+        last = re.search(r"n > (\d+)", query)
+        start = max(int(low.group(1)) if low else 0, int(last.group(1)) + 1 if last else 0)
+        stop = min(int(high.group(1)) if high else RECORDS, start + PAGE_SIZE)
+        return SurrealResult(result=[{"n": i} for i in range(start, stop)])
+
+
+def with_iter() -> int:
+    return sum(result.count() for result in Select(FakeConnection(), "person").iter(limit=PAGE_SIZE, key="n"))
+
+
+def with_parallel_scan() -> int:
+    boundaries = [RECORDS * i // PARTITIONS for i in range(1, PARTITIONS)]
+    return sum(1 for _ in ParallelScan(FakeConnection(), "person", PARTITIONS, key="n", page_size=PAGE_SIZE,
+                                       boundaries=boundaries))
+
+
+def with_default_boundaries() -> int:
+    return sum(1 for _ in ParallelScan(FakeConnection(), "person", PARTITIONS, key="n", page_size=PAGE_SIZE))
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    assert func() == RECORDS
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    old = min(measure(with_iter) for _ in range(3))
+    new = min(measure(with_parallel_scan) for _ in range(3))
+    default = min(measure(with_default_boundaries) for _ in range(3))
+    print(f"{RECORDS} records: iter {old:.3f}s, parallel_scan {new:.3f}s (x{old / new:.2f}), with found boundaries "
+          f"{default:.3f}s (x{old / default:.2f})")
@@ -0,0 +1,31 @@
+from timeit import repeat
+
+from surrealist.ql.statements.select import Select
+from surrealist.result import SurrealResult
+
+# Micro-benchmark for prepared statements, it does not need SurrealDB server (a fake connection returns at once).
+# Compares building the same SELECT on every call with running a prepared one with new variables.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/prepared_benchmark.py
+
+NUMBER = 20_000
+RESULT = SurrealResult(result=[])
+
+
+class FakeConnection:
+    def query(self, _query, _variables=None):
+        return RESULT
+
+
+connection = FakeConnection()
+
+
+def build(age):
+    return Select(connection, "person", "id", "name").where(f"age > {age}").order_by("name").limit(10).run()
+
+
+prepared = Select(connection, "person", "id", "name").where("age > $age").order_by("name").limit(10).prepare()
+
+if __name__ == '__main__':
+    old = min(repeat(lambda: build(30), number=NUMBER, repeat=5)) / NUMBER
+    new = min(repeat(lambda: prepared.run(age=30), number=NUMBER, repeat=5)) / NUMBER
+    print(f"build and run {old * 1e6:.2f}µs, prepared run {new * 1e6:.2f}µs, speedup x{old / new:.1f}")
@@ -0,0 +1,41 @@
+import time
+
+from surrealist.query_cache import QueryCache
+from surrealist.result import SurrealResult
+
+# Benchmark for the query cache without SurrealDB server: every SELECT returns the same 20 products after 1ms, live
+# queries are accepted and never fire, so nothing is invalidated.
+# A read-heavy workload of 2000 SELECT queries with 50 distinct texts: all of them go to the connection, or only the
+# first of each text goes there and the rest are hits of the cache.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/query_cache_benchmark.py
+
+QUERIES = 2000
+DISTINCT = 50
+LATENCY = 0.001  # seconds per request
+
+
+class FakeConnection:
+    def query(self, query, variables=None):
+        time.sleep(LATENCY)
+        return SurrealResult(result=[{"id": f"product:{i}", "price": i} for i in range(20)])
+
+    def custom_live(self, query, callback):
+        return SurrealResult(result="live-id")
+
+    def kill(self, live_id):
+        return SurrealResult(result=None)
+
+
+def workload(connection) -> float:
+    start = time.perf_counter()
+    for i in range(QUERIES):
+        connection.query(f"SELECT * FROM product WHERE category = {i % DISTINCT};")
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    old = workload(FakeConnection())
+    cache = QueryCache(FakeConnection())
+    new = workload(cache)
+    print(f"{QUERIES} queries: connection {old:.3f}s, with cache {new:.3f}s ({cache.stats()}), "
+          f"speedup x{old / new:.2f}")
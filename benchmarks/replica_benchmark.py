@@ -0,0 +1,40 @@
+import time
+
+from surrealist.ql.replica import TableReplica
+from surrealist.result import SurrealResult
+
+# Benchmark for the table replica without SurrealDB server: a select of the table of 200 currencies takes 0.5ms, the
+# live query is accepted and never fires.
+# 10000 lookups of a currency by code: a SELECT ... WHERE per lookup against the hash index of the replica, which is
+# loaded once.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/replica_benchmark.py
+
+LOOKUPS = 10_000
+RECORDS = 200
+LATENCY = 0.0005  # seconds per request
+
+
+class FakeConnection:
+    def query(self, query, variables=None):
+        time.sleep(LATENCY)
+        return SurrealResult(result=[{"id": f"currency:c{i}", "code": f"C{i}", "rate": i} for i in range(RECORDS)])
+
+    def custom_live(self, query, callback):
+        return SurrealResult(result="live-id")
+
+    def kill(self, live_id):
+        return SurrealResult(result=None)
+
+
+if __name__ == '__main__':
+    connection = FakeConnection()
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        connection.query(f"SELECT * FROM currency WHERE code = 'C{i % RECORDS}';")
+    old = time.perf_counter() - start
+    start = time.perf_counter()
+    replica = TableReplica(connection, "currency", indexes=["code"]).start()
+    for i in range(LOOKUPS):
+        replica.find_one(code=f"C{i % RECORDS}")
+    new = time.perf_counter() - start
+    print(f"{LOOKUPS} lookups: queries {old:.3f}s, replica {new:.3f}s (with loading), speedup x{old / new:.2f}")
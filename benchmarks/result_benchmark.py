@@ -0,0 +1,43 @@
+import json
+from timeit import repeat, timeit
+
+from surrealist.result import SurrealResult, to_result
+
+# Micro-benchmark for converting SurrealDB responses to SurrealResult objects, it does not need SurrealDB server.
+# Compares to_result (fast constructor) with the generic keyword-arguments constructor.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/result_benchmark.py
+
+NUMBER = 50_000
+record = {"id": "person:john", "name": "John", "age": 33, "created_at": "2024-01-24T11:31:06.347880800Z"}
+single = {"id": "0d2a1f3a-2a5c-4d3e-9b1c-1c8f0e6b1a11",
+          "result": [{"result": [record], "status": "OK", "time": "32.375µs"}]}
+multi = [{"result": [record], "status": "OK", "time": "32.375µs"} for _ in range(5)]
+error = {"id": "0d2a1f3a-2a5c-4d3e-9b1c-1c8f0e6b1a11",
+         "error": {"code": -32000, "message": "There was a problem with the database: Parse error"}}
+
+
+def generic(content):
+    """ to_result as it was before the fast constructor """
+    if isinstance(content, list):
+        if len(content) == 1:
+            return SurrealResult(**content[0])
+        return SurrealResult(result=[SurrealResult(**e) for e in content])
+    if len(content) in (1, 2) and "result" in content and isinstance(content["result"], list) \
+            and len(content["result"]) == 1 and set(content["result"][0].keys()) == {"time", "status", "result"}:
+        res = SurrealResult(**content["result"][0])
+        if "id" in content:
+            res.ws_id = content["id"]
+        return res
+    return SurrealResult(**content)
+
+
+if __name__ == '__main__':
+    for name, content in (("single statement", single), ("multi statement", multi), ("rpc error", error)):
+        assert generic(content).to_dict() == to_result(content).to_dict()
+        old = min(repeat(lambda: generic(content), number=NUMBER, repeat=5))
+        new = min(repeat(lambda: to_result(content), number=NUMBER, repeat=5))
+        print(f"{name:>17}: generic {old / NUMBER * 1e6:.2f}µs, to_result {new / NUMBER * 1e6:.2f}µs, "
+              f"speedup x{old / new:.2f}")
+    text = json.dumps(single)
+    decoded = timeit(lambda: to_result(text), number=NUMBER)
+    print(f"{'from json text':>17}: to_result {decoded / NUMBER * 1e6:.2f}µs")
@@ -0,0 +1,96 @@
+import json
+from timeit import repeat
+from typing import Any, Dict, List, Tuple
+
+from surrealist import RecordId
+from surrealist.utils import safe_dumps
+
+# Micro-benchmark for safe_dumps (rendering of CONTENT, MERGE, INSERT payloads), it does not need SurrealDB server.
+# Compares the current one-pass encoder with the legacy implementation (copied below) on bulk payloads.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/safe_dumps_benchmark.py
+
+NUMBER = 3
+
+
+def legacy_dumps(data: Any) -> str:
+    if isinstance(data, RecordId):
+        return data.to_valid_string()
+    if isinstance(data, List):
+        return legacy_list(data)
+    if isinstance(data, Tuple):
+        return legacy_tuple(data)
+    if isinstance(data, Dict):
+        return legacy_dict(data)
+    return json.dumps(data)
+
+
+def legacy_dict(data: Dict) -> str:
+    ids = {k: v for k, v in data.items() if isinstance(v, (RecordId, List, Dict))}
+    if not ids:
+        return json.dumps(data)
+    without_ids = {k: v for k, v in data.items() if k not in ids}
+    first = json.dumps(without_ids) if without_ids else ""
+    join = ", ".join([f'"{k}": {legacy_dumps(v)}' for k, v in ids.items()])
+    if first:
+        first = first.rstrip("}")
+        first = f"{first}, "
+    else:
+        first = "{"
+    return f"{first}{join}}}"
+
+
+def legacy_list(data: List) -> str:
+    ids = [e for e in data if isinstance(e, (RecordId, List, Dict, Tuple))]
+    if not ids:
+        return json.dumps(data)
+    without_ids = [e for e in data if e not in ids]
+    first = json.dumps(without_ids) if without_ids else ""
+    join = ", ".join(legacy_dumps(e) for e in ids)
+    if first:
+        first = first.rstrip("]")
+        first = f"{first}, "
+    else:
+        first = "["
+    return f"{first}{join}]"
+
+
+def legacy_tuple(values: Tuple) -> str:
+    ids = [e for e in values if isinstance(e, (RecordId, List, Dict, Tuple))]
+    if not ids:
+        return f'({json.dumps(values).lstrip("[").rstrip("]")})'
+    without_ids = [e for e in values if e not in ids]
+    first = json.dumps(without_ids)
+    first = first.lstrip("[").rstrip("]")
+    if first:
+        first = f"{first}, "
+    join = ", ".join(f'{legacy_dumps(e)}' for e in ids)
+    return f"({first}{join})"
+
+
+def plain(size):
+    return [{"name": f"John {i}", "age": i, "active": True, "tags": ["a", "b"]} for i in range(size)]
+
+
+def with_ids(size):
+    return [{"name": f"John {i}", "age": i, "author": RecordId(f"user:{i}"), "friends": [RecordId("user:tobie")]}
+            for i in range(size)]
+
+
+def values(size):
+    return [(f"John {i}", i, RecordId(f"user:{i}")) for i in range(size)]
+
+
+CASES = (("plain records", plain), ("records with RecordId", with_ids), ("INSERT VALUES tuples", values))
+
+if __name__ == '__main__':
+    for name, factory in CASES:
+        for size in (1_000, 5_000):
+            data = factory(size)
+            assert legacy_dumps(data) == safe_dumps(data)
+            old = min(repeat(lambda: legacy_dumps(data), number=NUMBER, repeat=3))
+            new = min(repeat(lambda: safe_dumps(data), number=NUMBER, repeat=3))
+            print(f"{name}, {size} items: legacy {old / NUMBER * 1e3:.1f}ms, safe_dumps {new / NUMBER * 1e3:.1f}ms, "
+                  f"speedup x{old / new:.1f}")
+    data = plain(100_000)
+    new = min(repeat(lambda: safe_dumps(data), number=1, repeat=3))
+    print(f"plain records, 100000 items: safe_dumps {new * 1e3:.1f}ms (legacy is quadratic here)")
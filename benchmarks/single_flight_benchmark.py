@@ -0,0 +1,53 @@
+import threading
+import time
+
+from surrealist.connections.pool import Pool
+from surrealist.connections.single_flight import SingleFlight
+from surrealist.result import SurrealResult
+
+# Benchmark for single-flight, it does not need SurrealDB server: a pool of 4 fake connections, each of them sleeps
+# to imitate network and server time and serves one request at a time.
+# 40 threads send the same dashboard query at once (a stampede), compares the pool with and without single-flight.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/single_flight_benchmark.py
+
+THREADS = 40
+CONNECTIONS = 4
+LATENCY = 0.02  # seconds per request
+
+
+class FakeConnection:
+    def query(self, query, variables=None):
+        time.sleep(LATENCY)
+        return SurrealResult(result=[query])
+
+    def close(self):
+        pass
+
+
+class FixedPool(Pool):
+    def _start(self):
+        for _ in range(CONNECTIONS - 1):
+            self._main.put_nowait(FakeConnection())
+
+    def _create_new_connection(self):
+        pass  # the pool has a fixed number of connections
+
+
+def stampede(single_flight) -> float:
+    pool = FixedPool(FakeConnection(), "http://127.0.0.1:8000", single_flight=single_flight)
+    threads = [threading.Thread(target=pool.query, args=("SELECT count() FROM order GROUP ALL;",))
+               for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    old = min(stampede(None) for _ in range(3))
+    flight = SingleFlight()
+    new = min(stampede(flight) for _ in range(3))
+    print(f"{THREADS} identical queries: pool {old:.3f}s, with single-flight {new:.3f}s ({flight.stats()}), "
+          f"speedup x{old / new:.2f}")
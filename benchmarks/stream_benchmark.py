@@ -0,0 +1,48 @@
+import time
+
+from surrealist.ql.statements.select import Select
+from surrealist.result import SurrealResult
+
+# Benchmark for streaming with prefetch, it does not need SurrealDB server: a fake connection sleeps to imitate
+# network and server time for each page, the consumer sleeps to imitate processing of each page.
+# Compares iter (fetch, then process) with stream (fetch next pages while processing).
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/stream_benchmark.py
+
+PAGES = 50
+PAGE_SIZE = 100
+LATENCY = 0.005  # seconds per request
+PROCESSING = 0.005  # seconds per page
+
+
+class FakeConnection:
+    def __init__(self):
+        self.left = PAGES
+
+    def query(self, _query):
+        time.sleep(LATENCY)
+        self.left -= 1
+        return SurrealResult(result=[{"id": i} for i in range(PAGE_SIZE if self.left >= 0 else 0)])
+
+
+def with_iter():
+    for result in Select(FakeConnection(), "person").iter(limit=PAGE_SIZE):
+        if result.count():
+            time.sleep(PROCESSING)
+
+
+def with_stream():
+    for i, _ in enumerate(Select(FakeConnection(), "person").stream(page_size=PAGE_SIZE, prefetch=2)):
+        if i % PAGE_SIZE == 0:
+            time.sleep(PROCESSING)
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    old = min(measure(with_iter) for _ in range(3))
+    new = min(measure(with_stream) for _ in range(3))
+    print(f"{PAGES} pages: iter {old:.3f}s, stream {new:.3f}s, speedup x{old / new:.2f}")
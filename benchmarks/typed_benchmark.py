@@ -0,0 +1,43 @@
+import datetime
+from dataclasses import dataclass
+from timeit import repeat
+
+from surrealist import RecordId
+from surrealist.result import SurrealResult
+from surrealist.utils import to_datetime
+
+# Micro-benchmark for typed decoding of records, it does not need SurrealDB server.
+# Compares as_type (cached generated decoder) with manual conversion of dicts to dataclasses.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/typed_benchmark.py
+
+NUMBER = 50
+
+
+@dataclass
+class Person:
+    id: RecordId
+    name: str
+    age: int
+    created_at: datetime.datetime
+
+
+records = [{"id": f"person:{i}", "name": f"John {i}", "age": i, "created_at": "2024-01-24T11:31:06.347880Z"}
+           for i in range(1000)]
+result = SurrealResult(result=records)
+
+
+def manual():
+    return [Person(id=RecordId(record["id"]), name=record["name"], age=record["age"],
+                   created_at=to_datetime(record["created_at"])) for record in result.result]
+
+
+def as_tuples(people):
+    return [(person.id.naive_id, person.name, person.age, person.created_at) for person in people]
+
+
+if __name__ == '__main__':
+    assert as_tuples(manual()) == as_tuples(result.as_type(Person))
+    old = min(repeat(manual, number=NUMBER, repeat=5))
+    new = min(repeat(lambda: result.as_type(Person), number=NUMBER, repeat=5))
+    print(f"{len(records)} records: manual {old / NUMBER * 1e3:.3f}ms, as_type {new / NUMBER * 1e3:.3f}ms, "
+          f"speedup x{old / new:.2f}")
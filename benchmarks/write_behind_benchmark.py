@@ -0,0 +1,57 @@
+import random
+import time
+
+from surrealist.result import SurrealResult
+from surrealist.write_behind import WriteBehindBuffer
+
+# Benchmark for the write-behind buffer, it does not need SurrealDB server: a fake connection sleeps to imitate
+# network and server time for each request.
+# Compares a merge request for each update with the buffer, which coalesces updates of the same records.
+# Run it from the root of the repository: PYTHONPATH=src python benchmarks/write_behind_benchmark.py
+
+UPDATES = 2000
+RECORDS = 50
+LATENCY = 0.001  # seconds per request
+
+
+class FakeConnection:
+    def __init__(self):
+        self.requests = 0
+
+    def merge(self, _table, _data, _record_id=None):
+        time.sleep(LATENCY)
+        self.requests += 1
+        return SurrealResult(result=[])
+
+    def query(self, _query):
+        time.sleep(LATENCY)
+        self.requests += 1
+        return SurrealResult(result=[])
+
+
+updates = [(f"counter:{random.randrange(RECORDS)}", {"views": i}) for i in range(UPDATES)]
+
+
+def direct(connection):
+    for record_id, data in updates:
+        connection.merge("counter", data, record_id.split(":")[1])
+
+
+def buffered(connection):
+    with WriteBehindBuffer(connection, max_delay=0.01) as buffer:
+        for record_id, data in updates:
+            buffer.merge(record_id, data)
+
+
+def measure(func):
+    connection = FakeConnection()
+    start = time.perf_counter()
+    func(connection)
+    return time.perf_counter() - start, connection.requests
+
+
+if __name__ == '__main__':
+    old, old_requests = measure(direct)
+    new, new_requests = measure(buffered)
+    print(f"{UPDATES} updates of {RECORDS} records: merge {old:.3f}s ({old_requests} requests), "
+          f"buffer {new:.3f}s ({new_requests} requests), speedup x{old / new:.2f}")
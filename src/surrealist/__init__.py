@@ -1,14 +1,26 @@
-from .connections import Connection, HttpConnection, WebSocketConnection
-from .enums import Algorithm, AutoOrNone
+from .connections import (AimdLimiter, CircuitBreaker, Connection, GradientLimiter, HttpConnection, Lane,
+                          SingleFlight, WebSocketConnection)
+from .converters import ResultConverter
+from .enums import Algorithm, AutoOrNone, CircuitState
 from .errors import *
+from .ids import SnowflakeGenerator, UlidGenerator, Uuid7Generator, get_ulid, get_uuid7
+from .loader import RecordLoader
 from .ql import Database, DatabaseConnectionsPool, Table, Where
+from .ql.bulk import AdaptiveBatcher
+from .query_cache import QueryCache
 from .record_id import RecordId
-from .result import SurrealResult
+from .record_id_array import RecordIdArray
+from .result import LazySurrealResult, SurrealResult
 from .surreal import Surreal
 from .utils import LOG_FORMAT, get_uuid, to_datetime, to_surreal_datetime_str
+from .write_behind import WriteBehindBuffer
 
 __all__ = ("Surreal", "SurrealResult", "WebSocketConnection", "HttpConnection", "PySurrealError", "HttpConnectionError",
            "HttpClientError", "SurrealConnectionError", "WebSocketConnectionError", "WebSocketConnectionClosedError",
            "ConnectionParametersError", "CompatibilityError", "OperationOnClosedConnectionError", "WrongCallError",
            "Connection", "get_uuid", "Database", "Table", "Where", "DatabaseConnectionsPool", "AutoOrNone",
-           "to_surreal_datetime_str", "to_datetime", "LOG_FORMAT", "Algorithm", "RecordId", "SurrealRecordIdError")
+           "to_surreal_datetime_str", "to_datetime", "LOG_FORMAT", "Algorithm", "RecordId", "SurrealRecordIdError",
+           "AimdLimiter", "GradientLimiter", "CircuitBreaker", "CircuitState", "CircuitOpenError",
+           "ConcurrencyLimitError", "Lane", "LazySurrealResult", "ResultConverter",
+           "RecordIdArray", "UlidGenerator", "Uuid7Generator", "SnowflakeGenerator", "get_ulid", "get_uuid7",
+           "AdaptiveBatcher", "WriteBehindBuffer", "RecordLoader", "SingleFlight", "QueryCache")
@@ -2,7 +2,7 @@ import json
 import urllib.parse
 import urllib.request
 from http.client import HTTPResponse, RemoteDisconnected
-from logging import getLogger
+from logging import DEBUG, getLogger
 from typing import BinaryIO, Dict, Optional, Tuple, Union
 from urllib.error import HTTPError, URLError
 
@@ -110,7 +110,8 @@ class HttpClient:
             options['data'] = data_to_send
         try:
             req = urllib.request.Request(url, **options)
-            logger.debug("Request to %s, options: %s, timeout: %d", url, mask_opts(options), self._timeout)
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Request to %s, options: %s, timeout: %d", url, mask_opts(options), self._timeout)
             response = urllib.request.urlopen(req, timeout=self._timeout)
             return response
         except HTTPError as e:
@@ -2,15 +2,16 @@ import json
 import threading
 import time
 from json import JSONDecodeError
-from logging import getLogger
-from queue import Empty, Queue
-from typing import Callable, Dict, Optional
+from logging import DEBUG, getLogger
+from queue import Empty, Full, Queue
+from typing import Callable, Dict, Optional, Union
 
 import websocket
 
 from surrealist.errors import (TooManyNestedLevelsError,
                                WebSocketConnectionClosedError)
-from surrealist.result import SurrealResult, to_result
+from surrealist.result import (SurrealResult, response_id, to_lazy_result,
+                               to_result)
 from surrealist.utils import DEFAULT_TIMEOUT, get_uuid, mask_pass
 
 logger = getLogger("surrealist.clients.websocket")
@@ -22,8 +23,9 @@ class WebSocketClient:
     Every client creates at least two threads (in and out)
     """
 
-    def __init__(self, base_url: str, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, base_url: str, timeout: int = DEFAULT_TIMEOUT, lazy_results: bool = False):
         self._ws = None
+        self._lazy_results = lazy_results
         self._connected = None
         self._timeout = timeout
         self._base_url = base_url
@@ -44,6 +46,12 @@ class WebSocketClient:
         :param message: string message
         """
         logger.debug("Get message %s", message)
+        if self._lazy_results:
+            id_ = response_id(message)
+            if id_ is not None:
+                # the raw message is decoded later, only if the result is needed
+                self._messages[id_].put_nowait(message)
+                return
         try:
             mess = json.loads(message)
         except JSONDecodeError as je:
@@ -125,11 +133,17 @@ class WebSocketClient:
         except RecursionError as e:
             logger.error("Cant serialize object, too many nested levels")
             raise TooManyNestedLevelsError("Cant serialize object, too many nested levels") from e
-        logger.debug("Send data: %s", mask_pass(data_string))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Send data: %s", mask_pass(data_string))
         self._messages[id_] = Queue(maxsize=1)
         self._ws.send(data_string)
         res = self._get_by_id(id_)
-        if data['method'] in ('live', 'kill') or "additional" in data:
+        is_live = data['method'] in ('live', 'kill') or "additional" in data
+        if isinstance(res, str):
+            if not is_live:
+                return to_lazy_result(res)
+            res = json.loads(res)
+        if is_live:
             if 'error' not in res:
                 # now we know live or kill was successful, so now we need to manage callbacks
                 self._on_success(data, callback, res)
@@ -145,13 +159,17 @@ class WebSocketClient:
             logger.debug("Set callback for %s", result['result'])
             self._callbacks[key] = callback
 
-    def _get_by_id(self, id_) -> Dict:
+    def _get_by_id(self, id_) -> Union[Dict, str]:
         try:
             result = self._messages[id_].get(timeout=self._timeout)
         except Empty as exc:
             raise TimeoutError(f"Time exceeded: {self._timeout} seconds, no response received") from exc
         finally:
-            del self._messages[id_]
+            self._messages.pop(id_, None)
+        if result is None:
+            # the connection was closed while we were waiting for the response
+            logger.error("Connection %s closed while a client waits on it", self._base_url)
+            raise WebSocketConnectionClosedError("Connection closed while a client waits on it")
         return result
 
     def _wait_until(self, predicate, timeout, period=0.0005):
@@ -189,6 +207,12 @@ class WebSocketClient:
         self._connected = False
         self._ws.close()
         del self._ws
+        for queue in list(self._messages.values()):
+            # wake up all clients, which are still waiting for responses
+            try:
+                queue.put_nowait(None)
+            except Full:
+                pass  # the response is already there
         self._messages.clear()
         self._callbacks.clear()
         logger.debug("Client is closed connection to %s", self._base_url)
@@ -0,0 +1,192 @@
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+STR = "str"
+OBJECT = "object"
+TYPES = (INT, FLOAT, BOOL, STR, OBJECT)
+_ARRAY_CODES = {INT: "q", FLOAT: "d", BOOL: "b"}
+_NUMPY_TYPES = {INT: "int64", FLOAT: "float64", BOOL: "bool", STR: "object", OBJECT: "object"}
+_NAN = float("nan")
+
+
+def infer_type(values: Sequence[Any]) -> str:
+    """
+    Infers the type of the column by its non-null values
+
+    :param values: values of the column
+    :return: one of "int", "float", "bool", "str", "object"
+    """
+    kinds = {value.__class__ for value in values if value is not None}
+    if not kinds:
+        return OBJECT
+    if kinds == {bool}:
+        return BOOL
+    if kinds == {int}:
+        return INT
+    if kinds <= {int, float}:
+        return FLOAT
+    if kinds == {str}:
+        return STR
+    return OBJECT
+
+
+def infer_schema(records: Sequence[Dict], fields: Optional[Sequence[str]] = None) -> Dict[str, str]:
+    """
+    Infers types of all fields (or only given fields) of the records
+
+    :param records: list of dicts
+    :param fields: optional list of fields to use, all fields of records are used by default
+    :return: dict with names of the fields and their types
+    """
+    fields = fields or field_names(records)
+    return {field: infer_type(_column(records, field)) for field in fields}
+
+
+def field_names(records: Sequence[Dict]) -> List[str]:
+    """
+    Returns names of all fields of the records in order of their appearance
+
+    :param records: list of dicts
+    :return: list of names
+    """
+    names = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+    return list(names)
+
+
+def to_columns(records: Sequence[Dict], fields: Optional[Sequence[str]] = None,
+               schema: Optional[Dict[str, str]] = None, fill: Optional[Any] = None) -> Dict[str, Sequence]:
+    """
+    Converts records (list of dicts) to columns: a dict with field names as keys and typed arrays (array.array) as
+    values. Columns of int, float and bool become arrays, all other columns become lists.
+
+    Missing fields and nulls become **fill** value, if fill is None: float columns get NaN, int and bool columns with
+    nulls stay lists with None inside. Int columns with floats (for example with a schema from another page) become
+    float arrays, other values, which do not fit the type of the column, keep the column a list.
+
+    Fields can be nested, like "address.city"
+
+    :param records: list of dicts
+    :param fields: projection, list of fields to use, all fields of records are used by default
+    :param schema: types of the fields ("int", "float", "bool", "str", "object"), inferred if not specified
+    :param fill: value for nulls and missing fields
+    :return: dict of columns
+    """
+    raw = _raw_columns(records, fields, schema)
+    return {field: _typed(values, kind, fill) for field, (values, kind) in raw.items()}
+
+
+def to_numpy(records: Sequence[Dict], fields: Optional[Sequence[str]] = None,
+             schema: Optional[Dict[str, str]] = None, fill: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Converts records (list of dicts) to a dict of NumPy arrays. Int columns with nulls become float64 with NaN
+    (if fill is None), int columns with fractional values (a schema from another page, a float fill) become float64,
+    bool columns with nulls, str and object columns become arrays with object dtype.
+
+    NumPy should be installed for this method
+
+    :param records: list of dicts
+    :param fields: projection, list of fields to use, all fields of records are used by default
+    :param schema: types of the fields ("int", "float", "bool", "str", "object"), inferred if not specified
+    :param fill: value for nulls and missing fields
+    :return: dict of NumPy arrays
+    :raise ImportError: if NumPy is not installed
+    """
+    np = _import("numpy")
+    result = {}
+    for field, (values, kind) in _raw_columns(records, fields, schema).items():
+        has_nulls = any(value is None for value in values)
+        if has_nulls and fill is not None:
+            values = [fill if value is None else value for value in values]
+            has_nulls = False
+        if kind == INT and any(isinstance(value, float) and not value.is_integer() for value in values):
+            kind = FLOAT  # int64 would truncate them
+        if has_nulls and kind in (INT, FLOAT):
+            result[field] = np.array([_NAN if value is None else value for value in values], dtype="float64")
+        elif has_nulls:
+            result[field] = np.array(values, dtype="object")
+        else:
+            result[field] = np.array(values, dtype=_NUMPY_TYPES[kind])
+    return result
+
+
+def to_pandas(records: Sequence[Dict], fields: Optional[Sequence[str]] = None,
+              schema: Optional[Dict[str, str]] = None, fill: Optional[Any] = None):
+    """
+    Converts records (list of dicts) to a pandas DataFrame, built from NumPy columns (see to_numpy).
+
+    pandas should be installed for this method
+
+    :param records: list of dicts
+    :param fields: projection, list of fields to use, all fields of records are used by default
+    :param schema: types of the fields ("int", "float", "bool", "str", "object"), inferred if not specified
+    :param fill: value for nulls and missing fields
+    :return: pandas DataFrame
+    :raise ImportError: if pandas or NumPy is not installed
+    """
+    pd = _import("pandas")
+    return pd.DataFrame(to_numpy(records, fields, schema, fill))
+
+
+def _raw_columns(records: Sequence[Dict], fields: Optional[Sequence[str]],
+                 schema: Optional[Dict[str, str]]) -> Dict[str, Tuple[List, str]]:
+    if any(not isinstance(record, Dict) for record in records):
+        raise ValueError("Columnar conversion works only with records (dicts)")
+    fields = list(fields) if fields else (list(schema) if schema else field_names(records))
+    schema = schema or {}
+    wrong = {kind for kind in schema.values() if kind not in TYPES}
+    if wrong:
+        raise ValueError(f"Unknown types in schema: {wrong}, expected one of {TYPES}")
+    result = {}
+    for field in fields:
+        values = _column(records, field)
+        result[field] = (values, schema.get(field) or infer_type(values))
+    return result
+
+
+def _column(records: Sequence[Dict], field: str) -> List:
+    if "." not in field:
+        return [record.get(field) for record in records]
+    path = field.split(".")
+    values = []
+    for record in records:
+        value = record
+        for part in path:
+            value = value.get(part) if isinstance(value, Dict) else None
+        values.append(value)
+    return values
+
+
+def _typed(values: List, kind: str, fill: Optional[Any]) -> Sequence:
+    code = _ARRAY_CODES.get(kind)
+    if code is None:
+        return values if fill is None else [fill if value is None else value for value in values]
+    if fill is not None:
+        values = [fill if value is None else value for value in values]
+    elif kind == FLOAT:
+        values = [_NAN if value is None else value for value in values]
+    elif None in values:
+        return values
+    try:
+        return array(code, values)
+    except (TypeError, OverflowError):
+        pass
+    # values do not fit the type (a page after the inferred schema, a float fill): ints are widened to floats if the
+    # data has floats, other columns stay lists
+    if kind == INT and any(isinstance(value, float) for value in values):
+        try:
+            return array(_ARRAY_CODES[FLOAT], values)
+        except (TypeError, OverflowError):
+            pass
+    return values
+
+
+def _import(name: str):
+    try:
+        return __import__(name)
+    except ImportError as e:
+        raise ImportError(f"{name} is required for this conversion, install it with: pip install {name}") from e
@@ -1,5 +1,9 @@
 from .connection import Connection
 from .http_connection import HttpConnection
+from .lanes import Lane
+from .limits import AimdLimiter, CircuitBreaker, GradientLimiter
+from .single_flight import SingleFlight
 from .ws_connection import WebSocketConnection
 
-__all__ = ("Connection", "WebSocketConnection", "HttpConnection")
+__all__ = ("Connection", "WebSocketConnection", "HttpConnection", "AimdLimiter", "GradientLimiter", "CircuitBreaker",
+           "Lane", "SingleFlight")
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from functools import wraps
-from logging import getLogger
+from logging import INFO, getLogger
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from surrealist.enums import Transport
@@ -9,7 +9,7 @@ from surrealist.errors import (OperationOnClosedConnectionError,
 from surrealist.record_id import RecordId
 from surrealist.result import SurrealResult
 from surrealist.utils import (AC, DB, DEFAULT_TIMEOUT, NS, StrOrRecord,
-                              clean_dates, get_table_or_record_id, mask_pass)
+                              clean_dates as clean_query_dates, get_table_or_record_id, mask_pass)
 
 logger = getLogger("surrealist.connection")
 LINK = "https://github.com/kotolex/surrealist?tab=readme-ov-file#recursion-and-json-in-python"
@@ -41,17 +41,23 @@ class Connection(ABC):
     """
 
     def __init__(self, db_params: Optional[Dict] = None, credentials: Tuple[str, str] = None,
-                 timeout: int = DEFAULT_TIMEOUT):
+                 timeout: int = DEFAULT_TIMEOUT, lazy_results: bool = False, clean_dates: bool = False):
         """
         Init any connection to use
         :param db_params: optional parameter, if it is not None, should be like {"NS": "test", "DB": "test"}
         :param credentials: optional pair of user and pass for auth, like ("root", "root")
         :param timeout: timeout in seconds to wait connection results and responses
+        :param lazy_results: if True, results keep raw JSON and decode it only on access (see LazySurrealResult)
+        :param clean_dates: if True, every query is cleaned from quoted date strings like "d'2024-01-01T00:00:00Z'",
+        it is needed only for hand-made queries with such strings, query builders render datetime objects and
+        DatetimeLiteral (to_surreal_datetime_str) correctly, so it is False by default
         """
         self._db_params = db_params
         self._credentials = credentials
         self._connected = False
         self._timeout = timeout
+        self._lazy_results = lazy_results
+        self._clean_dates = clean_dates
         self._token = None
 
     def close(self):
@@ -285,7 +291,8 @@ class Connection(ABC):
         if access is not None:
             params[AC] = access
         data = {"method": "signin", "params": [params]}
-        logger.info("Operation: SIGNIN. Data: %s", mask_pass(str(params)))
+        if logger.isEnabledFor(INFO):
+            logger.info("Operation: SIGNIN. Data: %s", mask_pass(str(params)))
         return self._use_rpc(data)
 
     @abstractmethod
@@ -474,7 +481,7 @@ class Connection(ABC):
         data = {"method": "select", "params": [table_name]}
         logger.info("Operation: SELECT. Table: %s", table_name)
         result = self._use_rpc(data)
-        if not isinstance(result.result, List) and not result.is_error():
+        if not result.is_error() and not result._is_list():  # pylint: disable=protected-access
             result.result = [result.result] if result.result else []
         return result
 
@@ -726,7 +733,8 @@ class Connection(ABC):
         :param variables: a set of variables used by the query
         :return: result of request
         """
-        query = clean_dates(query)
+        if self._clean_dates:
+            query = clean_query_dates(query)
         params = [query]
         if variables is not None:
             params.append(variables)
@@ -7,7 +7,7 @@ from surrealist.connections.connection import Connection, connected
 from surrealist.enums import Transport
 from surrealist.errors import (CompatibilityError, HttpClientError,
                                HttpConnectionError, SurrealConnectionError)
-from surrealist.result import SurrealResult, to_result
+from surrealist.result import SurrealResult, to_lazy_result, to_result
 from surrealist.utils import AC, DB, DEFAULT_TIMEOUT, ENCODING, HTTP_OK, NS
 
 logger = getLogger("surrealist.connections.http")
@@ -28,8 +28,8 @@ class HttpConnection(Connection):
     """
 
     def __init__(self, url: str, db_params: Optional[Dict] = None, credentials: Tuple[str, str] = None,
-                 timeout: int = DEFAULT_TIMEOUT):
-        super().__init__(db_params, credentials, timeout)
+                 timeout: int = DEFAULT_TIMEOUT, lazy_results: bool = False, clean_dates: bool = False):
+        super().__init__(db_params, credentials, timeout, lazy_results, clean_dates)
         self._url = url
         self._http_client = HttpClient(url, headers=db_params, credentials=credentials, timeout=timeout)
         self._sign(credentials, db_params, url)
@@ -39,7 +39,7 @@ class HttpConnection(Connection):
 
     def _use_rpc(self, data) -> SurrealResult:
         _, text = self._rpc(data)
-        return to_result(text)
+        return to_lazy_result(text) if self._lazy_results else to_result(text)
 
     def _sign(self, credentials, db_params, url):
         user, password, ns, db, ac = None, None, None, None, None
@@ -0,0 +1,199 @@
+from collections import deque
+from contextlib import nullcontext
+from logging import getLogger
+from threading import Condition
+from typing import Any, ContextManager, Deque, Dict, List, Optional
+
+from surrealist.errors import WrongParameterError
+
+logger = getLogger("surrealist.connection.lanes")
+DEFAULT_LANE = "default"
+
+
+class Lane:
+    """
+    Represents a named lane (priority class) of the pool. Lanes share the connections of the pool using weighted fair
+    scheduling: when there are waiting requests in several lanes, a lane with weight 3 gets about three times more
+    connections than a lane with weight 1. Reserved connections of a lane can never be taken by other lanes, so
+    latency-critical requests always have some capacity, even when batch work is running
+    """
+
+    def __init__(self, name: str, weight: int = 1, reserved: int = 0):
+        """
+        :param name: name of the lane, used to choose it on calls
+        :param weight: share of the connections for the lane, should be positive
+        :param reserved: number of connections which only this lane can use
+        """
+        if weight < 1:
+            raise ValueError("Weight of the lane should be positive")
+        if reserved < 0:
+            raise ValueError("Reserved capacity cannot be negative")
+        self.name = name
+        self.weight = weight
+        self.reserved = reserved
+
+    def __repr__(self):
+        return f"Lane(name={self.name}, weight={self.weight}, reserved={self.reserved})"
+
+
+def current_lane(connection: Any) -> Optional[str]:
+    """
+    Returns the lane of the current thread on the pool, to use it in other threads (see use_lane)
+
+    :param connection: pool or connection
+    :return: name of the lane, None for connections and pools without lanes
+    """
+    getter = getattr(connection, "current_lane", None)
+    return getter() if getter is not None else None
+
+
+def use_lane(connection: Any, name: Optional[str]) -> ContextManager:
+    """
+    Returns a context manager to send requests of the current thread in the lane of the pool
+
+    :param connection: pool or connection
+    :param name: name of the lane, None means the lane is not changed
+    :return: context manager
+    :raise WrongParameterError: if the lane is specified, but the connection is not a pool with lanes
+    """
+    if name is None:
+        return nullcontext()
+    lane = getattr(connection, "lane", None)
+    if lane is None:
+        raise WrongParameterError("Lanes can be used only with a pool")
+    return lane(name)
+
+
+class _Ticket:
+    """
+    Place of one waiting request in the queue of a lane, tickets are compared by identity
+    """
+    __slots__ = ("granted",)
+
+    def __init__(self):
+        self.granted = False
+
+
+class _LaneState:
+    def __init__(self, lane: Lane):
+        self.lane = lane
+        self.waiting: Deque[_Ticket] = deque()
+        self.in_use = 0
+        self.passed = 0.0
+        self.served = 0
+
+
+class LaneScheduler:
+    """
+    Decides which lane gets the next free slot of the pool. Each slot corresponds to one connection, so the number of
+    slots is equal to the maximum number of connections in the pool
+    """
+
+    def __init__(self, lanes: List[Lane], capacity: int):
+        """
+        :param lanes: list of lanes, lane with name "default" is added if it is absent
+        :param capacity: total number of slots (connections)
+        """
+        names = [lane.name for lane in lanes]
+        if len(names) != len(set(names)):
+            raise ValueError("Names of the lanes should be unique")
+        if DEFAULT_LANE not in names:
+            lanes = [*lanes, Lane(DEFAULT_LANE)]
+        if sum(lane.reserved for lane in lanes) > capacity:
+            raise ValueError(f"Reserved capacity of all lanes is more than capacity of the pool({capacity})")
+        self._capacity = capacity
+        self._states: Dict[str, _LaneState] = {lane.name: _LaneState(lane) for lane in lanes}
+        self._in_use = 0
+        self._condition = Condition()
+
+    @property
+    def lanes(self) -> List[str]:
+        """
+        Returns names of all lanes
+        """
+        return list(self._states)
+
+    def check(self, name: str):
+        """
+        Checks the lane exists
+
+        :param name: name of the lane
+        :raise WrongParameterError: if there is no such lane
+        """
+        if name not in self._states:
+            raise WrongParameterError(f"No such lane: {name}, expected one of {self.lanes}")
+
+    def acquire(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the lane gets a slot
+
+        :param name: name of the lane
+        :param timeout: seconds to wait, None means waiting forever
+        :return: True if slot was granted, False on timeout
+        """
+        self.check(name)
+        state = self._states[name]
+        ticket = _Ticket()
+        with self._condition:
+            if not state.waiting and not state.in_use:
+                # an idle lane should not get a burst of slots for the time it was idle
+                active = [e.passed for e in self._states.values() if e.waiting or e.in_use]
+                state.passed = max(state.passed, min(active, default=0.0))
+            state.waiting.append(ticket)
+            self._dispatch()
+            if not self._condition.wait_for(lambda: ticket.granted, timeout):
+                state.waiting.remove(ticket)
+                return False
+            return True
+
+    def release(self, name: str):
+        """
+        Returns the slot of the lane back
+
+        :param name: name of the lane
+        """
+        with self._condition:
+            self._states[name].in_use -= 1
+            self._in_use -= 1
+            self._dispatch()
+
+    def _is_eligible(self, state: _LaneState) -> bool:
+        free = self._capacity - self._in_use
+        if free <= 0:
+            return False
+        if state.in_use < state.lane.reserved:
+            return True
+        unused_by_others = sum(max(0, other.lane.reserved - other.in_use) for other in self._states.values()
+                               if other is not state)
+        return free > unused_by_others
+
+    def _dispatch(self):
+        granted = False
+        while True:
+            candidates = [state for state in self._states.values() if state.waiting and self._is_eligible(state)]
+            if not candidates:
+                break
+            state = min(candidates, key=lambda e: e.passed)
+            ticket = state.waiting.popleft()
+            ticket.granted = True
+            state.in_use += 1
+            state.served += 1
+            state.passed += 1 / state.lane.weight
+            self._in_use += 1
+            granted = True
+        if granted:
+            self._condition.notify_all()
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the lanes
+
+        :return: dict with lane names as keys and dicts with numbers of used slots, waiting and served requests
+        """
+        with self._condition:
+            return {name: {"in_use": state.in_use, "waiting": len(state.waiting), "served": state.served,
+                           "weight": state.lane.weight, "reserved": state.lane.reserved}
+                    for name, state in self._states.items()}
+
+    def __repr__(self):
+        return f"LaneScheduler(capacity={self._capacity}, lanes={self.lanes})"
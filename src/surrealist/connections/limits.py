@@ -0,0 +1,331 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from logging import getLogger
+from threading import Condition, Lock
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from surrealist.enums import CircuitState
+from surrealist.errors import CircuitOpenError
+
+logger = getLogger("surrealist.connection.limits")
+
+
+class ConcurrencyLimiter(ABC):
+    """
+    Parent for adaptive concurrency limiters. A limiter allows only **limit** requests to be in flight at the same time,
+    and changes this limit on the fly using observed latency of the requests. So, when SurrealDB slows down, the number
+    of simultaneous requests goes down too, instead of queueing more and more of them
+    """
+
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 50,
+                 on_change: Optional[Callable[[int, int], None]] = None):
+        """
+        :param initial_limit: limit to start with
+        :param min_limit: limit will never be less than this value
+        :param max_limit: limit will never be more than this value
+        :param on_change: optional function to call on each change of the limit, it gets old and new limit
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Limits should satisfy 1 <= min_limit <= max_limit")
+        self._min = min_limit
+        self._max = max_limit
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._on_change = on_change
+        self._in_flight = 0
+        self._condition = Condition()
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._last_latency = 0.0
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns current limit of requests in flight
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns number of requests in flight now
+        """
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for a free slot
+
+        :param timeout: seconds to wait, None means waiting forever
+        :return: True if slot was acquired, False on timeout
+        """
+        with self._condition:
+            if self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                self._in_flight += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def release(self, latency: float, failed: bool = False):
+        """
+        Frees the slot and adapts the limit with a sample of the request
+
+        :param latency: duration of the request in seconds
+        :param failed: True if request failed
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._last_latency = latency
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            old = int(self._limit)
+            self._limit = min(max(self._update(latency, failed), self._min), self._max)
+            new = int(self._limit)
+            self._condition.notify_all()
+        if old != new:
+            logger.debug("Concurrency limit changed from %s to %s", old, new)
+            if self._on_change:
+                self._on_change(old, new)
+
+    @abstractmethod
+    def _update(self, latency: float, failed: bool) -> float:
+        """
+        Calculates a new limit using one sample, called under lock
+
+        :param latency: duration of the request in seconds
+        :param failed: True if request failed
+        :return: new limit (not rounded)
+        """
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the limiter
+
+        :return: dict with current limit, requests in flight, completed, failed and rejected counters
+        """
+        return {"limit": self.limit, "in_flight": self._in_flight, "completed": self._completed,
+                "failed": self._failed, "rejected": self._rejected, "last_latency": self._last_latency}
+
+
+class AimdLimiter(ConcurrencyLimiter):
+    """
+    Additive increase, multiplicative decrease limiter: on each fast and successful request the limit grows by
+    **increase** (divided by the current limit, so it grows by about **increase** per full window), on a slow or failed
+    request the limit is multiplied by **backoff_ratio**
+    """
+
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 50,
+                 target_latency: float = 0.5, increase: float = 1.0, backoff_ratio: float = 0.9,
+                 on_change: Optional[Callable[[int, int], None]] = None):
+        """
+        :param target_latency: requests slower than this (in seconds) are considered as overload
+        :param increase: how much the limit grows per window of successful requests
+        :param backoff_ratio: multiplier for the limit on overload, should be between 0 and 1
+        """
+        super().__init__(initial_limit, min_limit, max_limit, on_change)
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("Backoff ratio should be between 0 and 1")
+        self._target = target_latency
+        self._increase = increase
+        self._backoff = backoff_ratio
+
+    def _update(self, latency: float, failed: bool) -> float:
+        if failed or latency > self._target:
+            return self._limit * self._backoff
+        return self._limit + self._increase / self._limit
+
+    def __repr__(self):
+        return f"AimdLimiter(limit={self.limit}, min={self._min}, max={self._max}, target_latency={self._target})"
+
+
+class GradientLimiter(ConcurrencyLimiter):
+    """
+    Gradient limiter: compares short-term (last sample) latency with the long-term smoothed one. When the latency
+    grows, gradient falls below 1 and the limit shrinks proportionally, when the latency is stable, the limit grows
+    by a small queue allowance (square root of the limit)
+    """
+
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 50, tolerance: float = 1.5,
+                 smoothing: float = 0.2, on_change: Optional[Callable[[int, int], None]] = None):
+        """
+        :param tolerance: how much the short latency can exceed the long one before limit starts to shrink
+        :param smoothing: weight of the new limit in the smoothed value, between 0 and 1
+        """
+        super().__init__(initial_limit, min_limit, max_limit, on_change)
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._long_latency = None
+
+    def _update(self, latency: float, failed: bool) -> float:
+        if self._long_latency is None:
+            self._long_latency = latency
+        # long-term latency follows the samples slowly
+        self._long_latency = self._long_latency * 0.95 + latency * 0.05
+        if failed:
+            gradient = 0.5
+        else:
+            gradient = max(0.5, min(1.0, self._tolerance * self._long_latency / max(latency, 1e-9)))
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+        return self._limit * (1 - self._smoothing) + new_limit * self._smoothing
+
+    def __repr__(self):
+        return f"GradientLimiter(limit={self.limit}, min={self._min}, max={self._max}, tolerance={self._tolerance})"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the pool. It watches the last **window_size** requests, and if the rate of failed requests
+    or the rate of slow requests exceeds the threshold, it opens: all requests are rejected immediately with
+    CircuitOpenError for **open_timeout** seconds. After that, breaker lets **half_open_calls** trial requests pass, if
+    all of them are good - breaker closes, otherwise opens again
+    """
+
+    def __init__(self, failure_rate_threshold: float = 0.5, slow_call_threshold: Optional[float] = None,
+                 slow_call_rate_threshold: float = 0.5, window_size: int = 50, min_calls: int = 10,
+                 open_timeout: float = 30.0, half_open_calls: int = 3,
+                 on_state_change: Optional[Callable[[CircuitState, CircuitState], None]] = None):
+        """
+        :param failure_rate_threshold: rate of failed requests (0..1) to open the circuit
+        :param slow_call_threshold: duration in seconds, slower requests are considered slow, None to ignore latency
+        :param slow_call_rate_threshold: rate of slow requests (0..1) to open the circuit
+        :param window_size: number of last requests to calculate rates
+        :param min_calls: minimum number of requests in the window before the circuit can open
+        :param open_timeout: seconds to stay open before trying requests again
+        :param half_open_calls: number of trial requests in half-open state
+        :param on_state_change: optional function to call on each state change, it gets old and new state
+        """
+        self._failure_rate = failure_rate_threshold
+        self._slow_call = slow_call_threshold
+        self._slow_rate = slow_call_rate_threshold
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._min_calls = min_calls
+        self._open_timeout = open_timeout
+        self._half_open_calls = half_open_calls
+        self._on_state_change = on_state_change
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._lock = Lock()
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        Returns current state of the breaker
+        """
+        with self._lock:
+            self._check_timeout()
+            return self._state
+
+    def before_call(self):
+        """
+        Checks the request is allowed, should be called before each request
+
+        :raise CircuitOpenError: if circuit is open
+        """
+        with self._lock:
+            changed = self._check_timeout()
+            allowed = self._state == CircuitState.CLOSED
+            if self._state == CircuitState.HALF_OPEN and self._trials < self._half_open_calls:
+                self._trials += 1
+                allowed = True
+            if not allowed:
+                self._rejected += 1
+        self._notify(changed)
+        if not allowed:
+            raise CircuitOpenError("Circuit breaker is open, SurrealDB is overloaded or unavailable, try later")
+
+    def record(self, latency: float, failed: bool = False):
+        """
+        Saves the outcome of the request, should be called after each allowed request
+
+        :param latency: duration of the request in seconds
+        :param failed: True if request failed
+        """
+        slow = self._slow_call is not None and latency > self._slow_call
+        changed = None
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                if failed or slow:
+                    changed = self._switch(CircuitState.OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self._half_open_calls:
+                        changed = self._switch(CircuitState.CLOSED)
+            elif self._state == CircuitState.CLOSED:
+                self._window.append((failed, slow))
+                if self._is_unhealthy():
+                    changed = self._switch(CircuitState.OPEN)
+        self._notify(changed)
+
+    def reset(self):
+        """
+        Force the breaker to the closed state and clears the statistics window
+        """
+        with self._lock:
+            changed = self._switch(CircuitState.CLOSED)
+        self._notify(changed)
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the breaker
+
+        :return: dict with current state, rates of failed and slow requests in the window, counters of rejected
+        requests and openings
+        """
+        with self._lock:
+            self._check_timeout()
+            failure_rate, slow_rate = self._rates()
+            return {"state": self._state.value, "calls_in_window": len(self._window), "failure_rate": failure_rate,
+                    "slow_call_rate": slow_rate, "rejected": self._rejected, "times_opened": self._times_opened}
+
+    def _rates(self) -> Tuple[float, float]:
+        total = len(self._window)
+        if not total:
+            return 0.0, 0.0
+        failed = sum(1 for fail, _ in self._window if fail)
+        slow = sum(1 for _, is_slow in self._window if is_slow)
+        return failed / total, slow / total
+
+    def _is_unhealthy(self) -> bool:
+        if len(self._window) < self._min_calls:
+            return False
+        failure_rate, slow_rate = self._rates()
+        return failure_rate >= self._failure_rate or (self._slow_call is not None and slow_rate >= self._slow_rate)
+
+    def _check_timeout(self) -> Optional[Tuple[CircuitState, CircuitState]]:
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self._open_timeout:
+            return self._switch(CircuitState.HALF_OPEN)
+        return None
+
+    def _switch(self, state: CircuitState) -> Optional[Tuple[CircuitState, CircuitState]]:
+        old = self._state
+        if old == state:
+            return None
+        self._state = state
+        self._trials = 0
+        self._trial_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self._times_opened += 1
+        if state == CircuitState.CLOSED:
+            self._window.clear()
+        return old, state
+
+    def _notify(self, changed: Optional[Tuple[CircuitState, CircuitState]]):
+        if not changed:
+            return
+        old, new = changed
+        logger.warning("Circuit breaker state changed from %s to %s", old.value, new.value)
+        if self._on_state_change:
+            self._on_state_change(old, new)
+
+    def __repr__(self):
+        return f"CircuitBreaker(state={self.state.value}, failure_rate_threshold={self._failure_rate}, " \
+               f"slow_call_threshold={self._slow_call}, open_timeout={self._open_timeout})"
@@ -1,13 +1,20 @@
 from functools import wraps
 from logging import getLogger
 from os import cpu_count
+from contextlib import contextmanager
 from queue import Queue
-from threading import Thread
-from typing import Any, Callable, Dict, Optional, Tuple
+from threading import Condition, Thread, current_thread, local
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from surrealist.connections.connection import Connection
+from surrealist.connections.lanes import DEFAULT_LANE, Lane, LaneScheduler
+from surrealist.connections.limits import CircuitBreaker, ConcurrencyLimiter
+from surrealist.connections.single_flight import SingleFlight
 from surrealist.enums import Transport
-from surrealist.errors import OperationOnClosedConnectionError
+from surrealist.errors import (ConcurrencyLimitError,
+                               OperationOnClosedConnectionError,
+                               WrongParameterError)
 from surrealist.result import SurrealResult
 from surrealist.surreal import Surreal
 from surrealist.utils import DEFAULT_TIMEOUT
@@ -40,15 +47,32 @@ class Pool:
     tasks to the first non-busy connection. So, if there are no more connections in the pool, it tries to create a new
     one if the maximum is not exceeded. If the maximum of connections is reached and no more connections to work with -
     client will be blocked until the first connection finishes the task and appears at the pool.
+
+    Optionally, pool can use an adaptive concurrency limiter (to bound requests in flight using observed latency) and
+    a circuit breaker (to reject requests immediately, when SurrealDB is overloaded or unavailable).
+
+    Pool also can use lanes (priority classes) to share connections between different kinds of traffic, for example,
+    interactive lookups and batch scans. Lane for the requests is chosen with **lane** context manager or with the
+    lane parameter of Statement.run, iter and stream. A request waits for a slot of its lane no longer than the pool
+    timeout.
+
+    With single-flight (see SingleFlight) identical read queries of different threads, which are in flight at the same
+    time, share one request.
+
+    On close pool stops accepting new requests, waits for requests in flight until the deadline, and then closes all
+    connections, including those, which are still busy
     """
 
     def __init__(self, first_connection: Connection, url: str, namespace: Optional[str] = None,
                  database: Optional[str] = None, access: Optional[str] = None, credentials: Tuple[str, str] = None,
                  use_http: bool = False, timeout: int = DEFAULT_TIMEOUT, min_connections: int = CORES_COUNT,
-                 max_connections: int = 50):
+                 max_connections: int = 50, limiter: Optional[ConcurrencyLimiter] = None,
+                 breaker: Optional[CircuitBreaker] = None, lanes: Optional[List[Lane]] = None,
+                 lazy_results: bool = False, clean_dates: bool = False,
+                 single_flight: Optional[SingleFlight] = None):
         self._options = {
             "url": url, "namespace": namespace, "database": database, "access": access, "credentials": credentials,
-            "use_http": use_http, "timeout": timeout
+            "use_http": use_http, "timeout": timeout, "lazy_results": lazy_results, "clean_dates": clean_dates
         }
         self._timeout = timeout
         self._url = url
@@ -56,8 +80,17 @@ class Pool:
         self._max = max_connections if max_connections <= 50 else 50
         self._main = Queue(maxsize=self._max)
         self._main.put_nowait(first_connection)
+        self._connections: List[Connection] = [first_connection]
         self._counter = 1
         self._connected = True
+        self._state = Condition()
+        self._running: Dict[int, Tuple[str, str, float]] = {}
+        self._request_number = 0
+        self._limiter = limiter
+        self._breaker = breaker
+        self._lanes = LaneScheduler(lanes, self._max) if lanes else None
+        self._single_flight = single_flight
+        self._local = local()
         self._start()
 
     def transport(self) -> Transport:
@@ -76,28 +109,124 @@ class Pool:
         """
         return self._counter
 
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the pool, including metrics of the limiter, the circuit breaker, lanes and single-flight if
+        they are used
+
+        :return: dict with metrics
+        """
+        result = {"connections": self._counter, "idle_connections": self._main.qsize()}
+        if self._limiter:
+            result["limiter"] = self._limiter.stats()
+        if self._breaker:
+            result["breaker"] = self._breaker.stats()
+        if self._lanes:
+            result["lanes"] = self._lanes.stats()
+        if self._single_flight:
+            result["single_flight"] = self._single_flight.stats()
+        return result
+
+    @contextmanager
+    def lane(self, name: str) -> Iterator["Pool"]:
+        """
+        Context manager to run all requests of the current thread inside it in the specified lane, for example:
+
+        with pool.lane("batch"):
+            pool.query("SELECT * FROM person;")
+
+        :param name: name of the lane
+        :raise WrongParameterError: if there is no such lane, or pool has no lanes
+        """
+        if not self._lanes:
+            raise WrongParameterError("The pool was created without lanes")
+        self._lanes.check(name)
+        previous = getattr(self._local, "lane", DEFAULT_LANE)
+        self._local.lane = name
+        try:
+            yield self
+        finally:
+            self._local.lane = previous
+
+    def current_lane(self) -> Optional[str]:
+        """
+        Returns the lane of requests of the current thread
+
+        :return: name of the lane, None if the pool has no lanes
+        """
+        return getattr(self._local, "lane", DEFAULT_LANE) if self._lanes else None
+
     def _start(self):
         for _ in range(self._min - 1):
             self._create_new_connection()
         logger.info("Created %s connections", self._min)
 
     def _create_new_connection(self):
-        if self._counter < self._max:
-            conn = Surreal(**self._options).connect()
-            self._main.put_nowait(conn)
+        with self._state:
+            if self._counter >= self._max or not self._connected:
+                return
+            # reserve the place before connecting, so parallel calls never exceed the maximum
             self._counter += 1
-
-    def close(self):
+        try:
+            conn = Surreal(**self._options).connect()
+        except Exception:
+            with self._state:
+                self._counter -= 1
+            raise
+        with self._state:
+            if not self._connected:
+                # pool was closed while we were connecting
+                conn.close()
+                return
+            self._connections.append(conn)
+        self._main.put_nowait(conn)
+
+    def close(self, timeout: Optional[float] = None) -> Dict:
         """
-        Closes the pool. You cannot and should not use a Pool object after that
+        Closes the pool gracefully: stops accepting new requests, waits for the requests in flight no longer than
+        timeout, then closes all connections, including connections, which are still used by unfinished requests.
+        You cannot and should not use a Pool object after that
+
+        :param timeout: seconds to wait for requests in flight, pool timeout is used if it is None
+        :return: report, a dict with "drained" flag (True if all requests were finished in time), number of closed
+        connections and a list of still running requests, each as a dict with method, thread and duration in seconds
         """
-        self._connected = False
-        logger.info("Signal to close pool")
-        while not self._main.empty():
-            # we need to gently wait for connection to finish the task
-            conn = self._main.get(timeout=self._timeout)
-            conn.close()
-        logger.info("The Pool was closed")
+        timeout = self._timeout if timeout is None else timeout
+        with self._state:
+            if not self._connected and not self._connections:
+                return {"drained": True, "closed_connections": 0, "running": []}
+            self._connected = False
+            logger.info("Signal to close pool, %s requests in flight", len(self._running))
+            drained = self._state.wait_for(lambda: not self._running, timeout)
+            now = monotonic()
+            running = [{"method": method, "thread": thread, "duration": now - started}
+                       for method, thread, started in self._running.values()]
+            connections, self._connections = self._connections, []
+        if not drained:
+            logger.warning("Pool is closing, but %s requests are still running: %s", len(running), running)
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:  # we have to close all connections anyway
+                logger.error("Error on closing connection: %s", e)
+        logger.info("The Pool was closed, %s connections closed", len(connections))
+        return {"drained": drained, "closed_connections": len(connections), "running": running}
+
+    def _begin(self, name: str) -> int:
+        with self._state:
+            if not self._connected:
+                message = "Your pool is already closed"
+                logger.error(message, exc_info=False)
+                raise OperationOnClosedConnectionError(message)
+            self._request_number += 1
+            self._running[self._request_number] = (name, current_thread().name, monotonic())
+            return self._request_number
+
+    def _end(self, number: int):
+        with self._state:
+            del self._running[number]
+            if not self._running:
+                self._state.notify_all()
 
     def __enter__(self):
         return self
@@ -119,18 +248,74 @@ class Pool:
         connection. Then it waits until the first non-busy connection and delegates work to it, calling in method.
         After that - always put connection back to pool
 
+        If circuit breaker is used, the request is rejected immediately while it is open. If limiter is used, the
+        request waits for a free slot no longer than the pool timeout. Request is considered failed if it raises or
+        returns an error result. With single-flight a request, which joins the same query of another thread, sends
+        nothing, so it takes no slot of the limiter or lane, but it waits no longer than the pool timeout
+
         :param name: name of the connection method to call, for example, "query"
         :param args: args to call
         :param kwargs: keyword args to call
         :return: result of the query
+        :raise CircuitOpenError: if circuit breaker is open
+        :raise ConcurrencyLimitError: if there is no free slot in the limiter or in the lane in time
+        :raise OperationOnClosedConnectionError: if pool is closed or closing
+        :raise TimeoutError: if the same query of another thread is not finished in time (with single-flight)
         """
-        if self._main.empty():
-            Thread(target=self._create_new_connection, daemon=True).start()
-        connection = self._main.get()
+        number = self._begin(name)  # requests, which join the same query in flight, are counted too
+        try:
+            if self._single_flight and name == "query":
+                # identical read queries in flight share one request
+                return self._single_flight.call(lambda: self._execute_guarded(name, *args, **kwargs), *args,
+                                                **kwargs, timeout=self._timeout)
+            return self._execute_guarded(name, *args, **kwargs)
+        finally:
+            self._end(number)
+
+    def _execute_guarded(self, name, *args, **kwargs) -> SurrealResult:
+        if not self._limiter and not self._breaker:
+            return self._execute_on_connection(name, *args, **kwargs)
+        if self._breaker:
+            self._breaker.before_call()
+        if self._limiter and not self._limiter.acquire(self._timeout):
+            if self._breaker:
+                # waiting for a slot too long is an overload signal as well
+                self._breaker.record(self._timeout, failed=True)
+            message = f"No free slot in the concurrency limiter for {self._timeout} seconds"
+            logger.error(message)
+            raise ConcurrencyLimitError(message)
+        start = perf_counter()
+        failed = True
+        try:
+            result = self._execute_on_connection(name, *args, **kwargs)
+            failed = isinstance(result, SurrealResult) and result.is_error()
+            return result
+        finally:
+            latency = perf_counter() - start
+            if self._limiter:
+                self._limiter.release(latency, failed)
+            if self._breaker:
+                self._breaker.record(latency, failed)
+
+    def _execute_on_connection(self, name, *args, **kwargs) -> SurrealResult:
+        if self._lanes:
+            lane = getattr(self._local, "lane", DEFAULT_LANE)
+            # each slot of the lanes is one connection, so we wait for a slot first
+            if not self._lanes.acquire(lane, self._timeout):
+                message = f"No free connection in the lane {lane} for {self._timeout} seconds"
+                logger.error(message)
+                raise ConcurrencyLimitError(message)
         try:
-            result = getattr(connection, name)(*args, **kwargs)
+            if self._main.empty():
+                Thread(target=self._create_new_connection, daemon=True).start()
+            connection = self._main.get()
+            try:
+                result = getattr(connection, name)(*args, **kwargs)
+            finally:
+                self._main.put_nowait(connection)
         finally:
-            self._main.put_nowait(connection)
+            if self._lanes:
+                self._lanes.release(lane)
         return result
 
     @connected_and_pooled
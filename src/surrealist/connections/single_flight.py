@@ -0,0 +1,124 @@
+import json
+import re
+from concurrent.futures import Future, wait
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from surrealist.result import SurrealResult
+
+_TOKENS = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`|⟨[^⟩]*⟩|\s+")
+_READS = ("SELECT ", "INFO ", "SHOW ")
+
+
+def normalize(query: str) -> str:
+    """
+    Collapses whitespace outside of strings and escaped names, removes the trailing semicolon
+
+    :param query: text of a query
+    :return: normalized text
+    """
+    text = _TOKENS.sub(lambda m: " " if m.group(0)[0].isspace() else m.group(0), query).strip()
+    return text[:-1].rstrip() if text.endswith(";") else text
+
+
+def is_read(query: str) -> bool:
+    """
+    Checks that a normalized query is one SELECT, INFO or SHOW statement
+
+    :param query: normalized text of a query
+    :return: True for a read query
+    """
+    return query.upper().startswith(_READS) and ";" not in _TOKENS.sub("", query)
+
+
+class SingleFlight:
+    """
+    Deduplication of identical concurrent read queries: while a query (the same normalized text and variables) is in
+    flight, other threads with the same query do not send it again, they wait for the first one and get the same
+    SurrealResult object (do not change it). Only queries of one SELECT, INFO or SHOW statement are shared,
+    nothing is cached after the query is finished.
+
+    Example:
+    pool = DatabaseConnectionsPool(url, "test", "test", credentials=creds, single_flight=SingleFlight())
+    """
+
+    def __init__(self, is_shared: Callable[[str], bool] = is_read):
+        """
+        :param is_shared: predicate for the normalized text of a query, only queries with True are shared
+        """
+        self._is_shared = is_shared
+        self._lock = Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._calls = 0
+        self._shared = 0
+        self._executed = 0
+
+    def key(self, query: str, variables: Optional[Dict] = None) -> Optional[str]:
+        """
+        Returns the key of the query, or None if it cannot be shared
+
+        :param query: text of the query
+        :param variables: variables of the query
+        :return: key or None
+        """
+        text = normalize(query)
+        if not self._is_shared(text):
+            return None
+        if not variables:
+            return text
+        try:
+            return f"{text}\n{json.dumps(variables, sort_keys=True)}"
+        except (TypeError, ValueError):
+            return None
+
+    def call(self, func: Callable[[], SurrealResult], query: str, variables: Optional[Dict] = None,
+             timeout: Optional[float] = None) -> SurrealResult:
+        """
+        Runs the function for the query, or waits for the same query of another thread
+
+        :param func: function to send the query
+        :param query: text of the query
+        :param variables: variables of the query
+        :param timeout: seconds to wait for the same query of another thread, None means no limit
+        :return: result of the query
+        :raise TimeoutError: if the query of another thread is not finished in time
+        """
+        key = self.key(query, variables)
+        leader = None
+        with self._lock:
+            self._calls += 1
+            future = None if key is None else self._in_flight.get(key)
+            if future is not None:
+                self._shared += 1
+            elif key is not None:
+                leader = self._in_flight[key] = Future()
+            self._executed += future is None
+        if future is not None:
+            if not wait([future], timeout).done:
+                raise TimeoutError(f"Time exceeded: {timeout} seconds, the same query is still running")
+            return future.result()
+        if leader is None:
+            return func()
+        try:
+            result = func()
+        except BaseException as e:
+            leader.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        leader.set_result(result)
+        return result
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of single-flight
+
+        :return: dict with numbers of calls, shared calls (hits), executed queries and queries in flight
+        """
+        with self._lock:
+            return {"calls": self._calls, "shared": self._shared, "executed": self._executed,
+                    "in_flight": len(self._in_flight)}
+
+    def __repr__(self):
+        return f"SingleFlight(in_flight={len(self._in_flight)})"
@@ -32,8 +32,8 @@ class WebSocketConnection(Connection):
     """
 
     def __init__(self, url: str, db_params: Optional[Dict] = None, credentials: Optional[Tuple[str, str]] = None,
-                 timeout: int = DEFAULT_TIMEOUT):
-        super().__init__(db_params, credentials, timeout)
+                 timeout: int = DEFAULT_TIMEOUT, lazy_results: bool = False, clean_dates: bool = False):
+        super().__init__(db_params, credentials, timeout, lazy_results, clean_dates)
         self._url = url
         base_url = urllib.parse.urlparse(url.lower())
         self._db_params = {}
@@ -49,7 +49,7 @@ class WebSocketConnection(Connection):
         if base_url.scheme in ("http", "https"):
             self._base_url = f"{base_url.scheme.replace('http', 'ws')}://{base_url.netloc}/rpc"
         try:
-            self._client = WebSocketClient(self._base_url, timeout)
+            self._client = WebSocketClient(self._base_url, timeout, lazy_results)
         except TimeoutError:
             logger.error("Cant connect to %s in %s seconds", self._base_url, self._timeout)
             raise SurrealConnectionError(f"Cant connect to {self._base_url} in {timeout} seconds.\n"
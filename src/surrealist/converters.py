@@ -0,0 +1,196 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from surrealist.errors import SurrealRecordIdError
+from surrealist.record_id import RecordId
+from surrealist.utils import parse_datetime
+
+DATETIME = "datetime"
+RECORD_ID = "record_id"
+RECORD_IDS = "record_ids"  # list of record ids, like links to other records
+KINDS = (DATETIME, RECORD_ID, RECORD_IDS)
+_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
+_RECORD_ID = re.compile(r"[A-Za-z_]\w*:(\w+|⟨[^⟩:]*⟩|`[^`:]*`)$")
+ID_FIELDS = ("id", "in", "out")  # fields, which always hold record ids
+
+
+class ResultConverter:
+    """
+    Post-processor for records of results: it finds fields with datetime strings and record ids (by a sample of the
+    records) and converts them in bulk, column by column: datetimes with a fast ISO-8601 parser (or NumPy if it is
+    installed), record ids with a cache of RecordId objects, so the same links are parsed only once.
+
+    Any text can look like a record id ("en:US"), so record ids are detected only in id, in and out fields and in
+    fields listed in **id_fields**. Values which cannot be converted stay as they are.
+
+    Example:
+    converter = ResultConverter()
+    result.convert(converter)
+    result.result[0]["created_at"]  # datetime object
+    """
+
+    def __init__(self, fields: Optional[Dict[str, str]] = None, detect: bool = True, sample_size: int = 10,
+                 use_numpy: bool = True, cache_size: int = 100_000, id_fields: Sequence[str] = ()):
+        """
+        :param fields: known fields and their kinds ("datetime", "record_id", "record_ids"), they are not detected
+        :param detect: if True, kinds of all other fields are detected on the sample of records
+        :param sample_size: number of records to look at for detection
+        :param use_numpy: use NumPy to parse datetimes if it is installed
+        :param cache_size: maximum number of cached RecordId objects
+        :param id_fields: fields (besides id, in and out) to detect record ids or lists of them, like links
+        """
+        fields = fields or {}
+        wrong = {kind for kind in fields.values() if kind not in KINDS}
+        if wrong:
+            raise ValueError(f"Unknown kinds of fields: {wrong}, expected one of {KINDS}")
+        self._fields = fields
+        self._detect = detect
+        self._sample_size = sample_size
+        self._numpy = _numpy() if use_numpy else None
+        self._cache_size = cache_size
+        self._id_fields = set(ID_FIELDS).union(id_fields)
+        self._ids: Dict[str, RecordId] = {}
+
+    def detect(self, records: Sequence[Dict]) -> Dict[str, str]:
+        """
+        Finds fields to convert, known fields are always in result
+
+        :param records: list of dicts
+        :return: dict with names of the fields and their kinds
+        """
+        result = dict(self._fields)
+        if not self._detect:
+            return result
+        sample = [record for record in records[:self._sample_size] if isinstance(record, Dict)]
+        names = dict.fromkeys(name for record in sample for name in record if name not in result)
+        for name in names:
+            kind = _detect_kind([record.get(name) for record in sample], name in self._id_fields)
+            if kind:
+                result[name] = kind
+        return result
+
+    def convert(self, records: List[Dict], kinds: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """
+        Converts records in place
+
+        :param records: list of dicts
+        :param kinds: fields to convert and their kinds, detected if not specified
+        :return: the same list of records
+        """
+        kinds = self.detect(records) if kinds is None else kinds
+        for name, kind in kinds.items():
+            rows = [record for record in records if record.__class__ is dict and record.get(name) is not None]
+            values = self._convert_values([record[name] for record in rows], kind)
+            for record, value in zip(rows, values):
+                record[name] = value
+        return records
+
+    def convert_columns(self, columns: Dict[str, Sequence], kinds: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        Converts columns (see SurrealResult.to_columns, to_numpy) in place. For NumPy arrays datetime columns become
+        arrays of datetime64[us], record id columns become arrays with RecordId objects
+
+        :param columns: dict of columns
+        :param kinds: fields to convert and their kinds, detected on the first values if not specified
+        :return: the same dict of columns
+        """
+        if kinds is None:
+            size = min((len(column) for column in columns.values()), default=0)
+            sample = [{name: column[i] for name, column in columns.items()} for i in range(min(size,
+                                                                                                self._sample_size))]
+            kinds = self.detect(sample)
+        for name, kind in kinds.items():
+            column = columns.get(name)
+            if column is None:
+                continue
+            is_array = self._numpy is not None and isinstance(column, self._numpy.ndarray)
+            values = column.tolist() if is_array else list(column)
+            if is_array and kind == DATETIME:
+                parsed = self._numpy_datetimes(values, as_array=True)
+                if parsed is not None:
+                    columns[name] = parsed
+                    continue
+            converted = self._convert_values([e for e in values if e is not None], kind)
+            iterator = iter(converted)
+            values = [None if e is None else next(iterator) for e in values]
+            columns[name] = self._numpy.array(values, dtype="object") if is_array else values
+        return columns
+
+    def record_id(self, value: str) -> Any:
+        """
+        Returns cached RecordId for the string, or the string itself if it is not a valid record id
+
+        :param value: string like "person:john"
+        :return: RecordId object or value
+        """
+        cached = self._ids.get(value)
+        if cached is None:
+            try:
+                cached = RecordId(value)
+            except (SurrealRecordIdError, ValueError):
+                return value
+            if len(self._ids) >= self._cache_size:
+                self._ids.clear()
+            self._ids[value] = cached
+        return cached
+
+    def _convert_values(self, values: List, kind: str) -> List:
+        if kind == DATETIME:
+            parsed = self._numpy_datetimes(values)
+            return parsed if parsed is not None else [_to_datetime(value) for value in values]
+        get = self._ids.get
+        if kind == RECORD_ID:
+            return [(get(value) or self.record_id(value)) if value.__class__ is str else value for value in values]
+        return [[(get(e) or self.record_id(e)) if e.__class__ is str else e for e in value]
+                if value.__class__ is list else value for value in values]
+
+    def _numpy_datetimes(self, values: List, as_array: bool = False) -> Optional[Any]:
+        """
+        Parses datetimes with NumPy, only for UTC datetimes (with Z at the end), returns None if it is not possible.
+        Nulls become NaT
+        """
+        if self._numpy is None or not values:
+            return None
+        if any(value is not None and (value.__class__ is not str or value[-1:] != "Z" or len(value) < 20)
+               for value in values):
+            return None
+        try:
+            parsed = self._numpy.array(["NaT" if value is None else value[:-1] for value in values],
+                                       dtype="datetime64[us]")
+        except ValueError:
+            return None
+        return parsed if as_array else parsed.tolist()
+
+
+def _to_datetime(value: Any) -> Any:
+    if value.__class__ is not str:
+        return value
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return value
+
+
+def _detect_kind(values: List, ids: bool) -> Optional[str]:
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    if all(value.__class__ is str for value in values):
+        if all(_DATETIME.match(value) for value in values):
+            return DATETIME
+        if ids and all(_RECORD_ID.match(value) for value in values):
+            return RECORD_ID
+        return None
+    if ids and all(value.__class__ is list for value in values):
+        items = [item for value in values for item in value]
+        if items and all(item.__class__ is str and _RECORD_ID.match(item) for item in items):
+            return RECORD_IDS
+    return None
+
+
+def _numpy():
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+        return numpy
+    except ImportError:
+        return None
@@ -34,3 +34,12 @@ class AutoOrNone(Enum):
     """
     AUTO = auto()
     NONE = auto()
+
+
+class CircuitState(Enum):
+    """
+    Represents the state of a circuit breaker in a pool
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
@@ -90,3 +90,16 @@ class WrongCallError(PySurrealError):
     Raises on an attempt to call a Table object; in most cases it is mean you misspelled the method name of Database,
     for example, **live** instead of **live_query**
     """
+
+
+class CircuitOpenError(PySurrealError):
+    """
+    Raises on an attempt to use a pool while its circuit breaker is open, it means SurrealDB was too slow or returned
+    too many errors recently, so requests are rejected immediately for a while
+    """
+
+
+class ConcurrencyLimitError(PySurrealError):
+    """
+    Raises when a request cannot get a slot from the concurrency limiter of a pool in time
+    """
@@ -0,0 +1,137 @@
+import os
+import time
+import uuid
+from threading import Lock
+from typing import Callable, Tuple, Union
+
+IdGenerator = Callable[[], Union[str, int]]  # any function without arguments, which returns a new id
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DEFAULT_EPOCH = 1577836800000  # 2020-01-01T00:00:00Z in milliseconds
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class _MonotonicRandom:
+    """
+    Timestamp in milliseconds plus random bits. Within the same millisecond (or if clock goes back) random bits of the
+    previous id are incremented, so ids of one generator are always strictly increasing
+    """
+
+    def __init__(self, random_bits: int):
+        self._bits = random_bits
+        self._lock = Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def next(self) -> Tuple[int, int]:
+        """
+        Returns the timestamp in milliseconds and the random part, pairs are strictly increasing
+
+        :return: pair of milliseconds and random bits
+        """
+        with self._lock:
+            ms = _now_ms()
+            if ms > self._last_ms:
+                random = int.from_bytes(os.urandom((self._bits + 7) // 8), "big") >> (-self._bits % 8)
+            else:
+                ms, random = self._last_ms, self._last_random + 1
+                if random >> self._bits:
+                    # overflow of random part, borrow the next millisecond
+                    ms, random = ms + 1, 0
+            self._last_ms, self._last_random = ms, random
+            return ms, random
+
+
+class UlidGenerator:
+    """
+    Generates ULID: 48 bits of timestamp in milliseconds and 80 random bits, encoded in 26 symbols of Crockford's
+    base32. Ids are sorted by the time of creation, ids of one generator are strictly increasing (monotonic)
+
+    Specification: https://github.com/ulid/spec
+    """
+
+    def __init__(self):
+        self._source = _MonotonicRandom(80)
+
+    def __call__(self) -> str:
+        ms, random = self._source.next()
+        value = (ms << 80) | random
+        symbols = []
+        for _ in range(26):
+            symbols.append(_CROCKFORD[value & 31])
+            value >>= 5
+        return "".join(reversed(symbols))
+
+
+class Uuid7Generator:
+    """
+    Generates UUID version 7: 48 bits of timestamp in milliseconds, version and variant bits and 74 random bits.
+    Ids are sorted by the time of creation, ids of one generator are strictly increasing (monotonic)
+
+    Specification: https://www.rfc-editor.org/rfc/rfc9562#name-uuid-version-7
+    """
+
+    def __init__(self):
+        self._source = _MonotonicRandom(74)
+
+    def __call__(self) -> str:
+        ms, random = self._source.next()
+        value = (ms << 80) | (7 << 76) | ((random >> 62) << 64) | (2 << 62) | (random & ((1 << 62) - 1))
+        return str(uuid.UUID(int=value))
+
+
+class SnowflakeGenerator:
+    """
+    Generates Snowflake-like 63-bit integer ids: milliseconds since the epoch, number of the node (process, host) and
+    a sequence number inside the millisecond. Ids of different nodes never collide, ids are sorted by the time of
+    creation, integer ids are the most compact record ids for SurrealDB
+    """
+
+    def __init__(self, node: int, epoch_ms: int = _DEFAULT_EPOCH, node_bits: int = 10, sequence_bits: int = 12):
+        """
+        :param node: number of the node, from 0 to 2**node_bits - 1
+        :param epoch_ms: start of the time for ids, in milliseconds since unix epoch, 2020-01-01 by default
+        :param node_bits: number of bits for the node
+        :param sequence_bits: number of bits for the sequence, so it is the maximum number of ids per millisecond
+        :raise ValueError: on a wrong node or number of bits, or if the epoch is in the future
+        """
+        if not 0 <= node < 1 << node_bits:
+            raise ValueError(f"Node should be from 0 to {(1 << node_bits) - 1}")
+        if node_bits + sequence_bits > 22:
+            raise ValueError("Node and sequence cannot take more than 22 bits, the rest is for the timestamp")
+        if epoch_ms > _now_ms():
+            raise ValueError(f"Epoch {epoch_ms} is in the future, ids would be negative")
+        self._node = node
+        self._node_part = node << sequence_bits
+        self._epoch = epoch_ms
+        self._time_shift = node_bits + sequence_bits
+        self._max_sequence = (1 << sequence_bits) - 1
+        self._lock = Lock()
+        self._last_ms = -1
+        self._sequence = 0
+
+    def __call__(self) -> int:
+        with self._lock:
+            ms = _now_ms()
+            if ms > self._last_ms:
+                self._sequence = 0
+            else:
+                ms = self._last_ms
+                self._sequence += 1
+                if self._sequence > self._max_sequence:
+                    # all ids of this millisecond are used, wait for the next one
+                    while ms <= self._last_ms:
+                        time.sleep(0.0001)
+                        ms = _now_ms()
+                    self._sequence = 0
+            self._last_ms = ms
+            return ((ms - self._epoch) << self._time_shift) | self._node_part | self._sequence
+
+    def __repr__(self):
+        return f"SnowflakeGenerator(node={self._node})"
+
+
+get_ulid = UlidGenerator()
+get_uuid7 = Uuid7Generator()
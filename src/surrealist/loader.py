@@ -0,0 +1,179 @@
+from concurrent.futures import Future
+from threading import Lock, Timer
+from typing import Dict, Iterable, List, Optional
+
+from surrealist.connections import Connection
+from surrealist.record_id import RecordId
+from surrealist.utils import StrOrRecord
+
+
+class RecordLoader:
+    """
+    Batches lookups of records by id (the N+1 problem of resolvers): all ids requested within **max_delay** seconds
+    are selected with one SELECT * FROM [id1, id2, ...] query per table, duplicate ids are selected once. Each lookup
+    gets a Future with the record (None if it does not exist). Loaded records are cached, so create a new loader for
+    each request (of GraphQL, HTTP and so on) to get fresh data.
+
+    Example:
+    loader = RecordLoader(db.get_connection())
+    futures = [loader.load(post["author"]) for post in posts]  # one query for all authors
+    authors = [future.result() for future in futures]
+    """
+
+    def __init__(self, connection: Connection, max_delay: float = 0.002, max_batch: int = 1000, fields: str = "*",
+                 cache: bool = True):
+        """
+        :param connection: connection or pool to run queries
+        :param max_delay: seconds to collect ids before the query
+        :param max_batch: maximum number of ids in one query, the query is sent at once when it is reached
+        :param fields: fields to select, id should be among them
+        :param cache: keep loaded records and return them without queries
+        :raise ValueError: if max_delay is negative or max_batch is less than one
+        """
+        if max_delay < 0 or max_batch < 1:
+            raise ValueError("Limits should satisfy max_delay >= 0 and max_batch >= 1")
+        self._connection = connection
+        self._max_delay = max_delay
+        self._max_batch = max_batch
+        self._fields = fields
+        self._cache = cache
+        self._lock = Lock()
+        self._loaded: Dict[str, Future] = {}
+        self._pending: Dict[str, Future] = {}
+        self._timer: Optional[Timer] = None
+        self._stats = {"loads": 0, "cache_hits": 0, "queries": 0, "records": 0}
+
+    def load(self, record_id: StrOrRecord) -> Future:
+        """
+        Requests the record, the query is sent after max_delay (or at once if max_batch ids are waiting)
+
+        :param record_id: full id of the record, like "person:john"
+        :return: Future with the record as a dict or None if there is no such record
+        """
+        key = _key(record_id)
+        with self._lock:
+            self._stats["loads"] += 1
+            future = self._loaded.get(key) or self._pending.get(key)
+            if future is not None:
+                self._stats["cache_hits"] += 1
+                return future
+            future = Future()
+            self._pending[key] = future
+            if self._cache:
+                self._loaded[key] = future
+            full = len(self._pending) >= self._max_batch
+            if not full and self._timer is None:
+                self._timer = Timer(self._max_delay, self.dispatch)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.dispatch()
+        return future
+
+    def load_many(self, record_ids: Iterable[StrOrRecord]) -> List[Future]:
+        """
+        Requests several records (see load)
+
+        :param record_ids: full ids of the records
+        :return: list of Futures in the same order
+        """
+        return [self.load(record_id) for record_id in record_ids]
+
+    def get(self, record_id: StrOrRecord, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Returns the record, waits for the query with ids of other threads
+
+        :param record_id: full id of the record, like "person:john"
+        :param timeout: seconds to wait, None means waiting forever
+        :return: record or None if there is no such record
+        :raise ValueError: if the query returns an error
+        """
+        return self.load(record_id).result(timeout)
+
+    def get_many(self, record_ids: Iterable[StrOrRecord], timeout: Optional[float] = None) -> List[Optional[Dict]]:
+        """
+        Returns records, the query is sent at once
+
+        :param record_ids: full ids of the records
+        :param timeout: seconds to wait, None means waiting forever
+        :return: list of records (or None for not existing ones) in the same order
+        :raise ValueError: if the query returns an error
+        """
+        futures = self.load_many(record_ids)
+        self.dispatch()
+        return [future.result(timeout) for future in futures]
+
+    def prime(self, record_id: StrOrRecord, record: Optional[Dict]):
+        """
+        Puts the record to the cache, for example after an update
+
+        :param record_id: full id of the record
+        :param record: record or None
+        """
+        future = Future()
+        future.set_result(record)
+        with self._lock:
+            self._loaded[_key(record_id)] = future
+
+    def clear(self, record_id: Optional[StrOrRecord] = None):
+        """
+        Removes the record (or all records) from the cache
+
+        :param record_id: full id of the record, None to clear all
+        """
+        with self._lock:
+            if record_id is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(_key(record_id), None)
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the loader
+
+        :return: dict with numbers of lookups, lookups without queries, queries and selected records
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def dispatch(self):
+        """
+        Sends queries for all waiting ids now, in the current thread
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        tables: Dict[str, List[str]] = {}
+        for key in pending:
+            tables.setdefault(key.split(":", 1)[0], []).append(key)
+        for keys in tables.values():
+            for start in range(0, len(keys), self._max_batch):
+                self._select(keys[start:start + self._max_batch], pending)
+
+    def _select(self, keys: List[str], futures: Dict[str, Future]):
+        try:
+            result = self._connection.query(f"SELECT {self._fields} FROM [{', '.join(keys)}];")
+            found = {_key(record["id"]): record for record in result.records()}
+        except Exception as e:  # the error goes to all lookups of the query
+            with self._lock:
+                self._stats["queries"] += 1
+                for key in keys:
+                    if self._loaded.get(key) is futures[key]:
+                        del self._loaded[key]  # so the next lookup tries again
+            for key in keys:
+                futures[key].set_exception(e)
+            return
+        with self._lock:
+            self._stats["queries"] += 1
+            self._stats["records"] += len(found)
+        for key in keys:
+            futures[key].set_result(found.get(key))
+
+    def __repr__(self):
+        return f"RecordLoader(max_delay={self._max_delay}, max_batch={self._max_batch}, cached={len(self._loaded)})"
+
+
+def _key(record_id: StrOrRecord) -> str:
+    return (record_id if isinstance(record_id, RecordId) else RecordId(record_id)).to_valid_string()
@@ -1,6 +1,8 @@
 from .database import Database
+from .parallel_scan import ParallelScan
 from .pool_database import DatabaseConnectionsPool
+from .replica import TableReplica
 from .statements.simple_statements import Where
 from .table import Table
 
-__all__ = ("Database", "DatabaseConnectionsPool", "Table", "Where",)
+__all__ = ("Database", "DatabaseConnectionsPool", "Table", "Where", "ParallelScan", "TableReplica",)
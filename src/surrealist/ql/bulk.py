@@ -0,0 +1,323 @@
+import time
+from logging import getLogger
+from queue import Queue
+from threading import Lock, Thread
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from surrealist.connections import Connection
+from surrealist.connections.lanes import current_lane, use_lane
+from surrealist.errors import (CircuitOpenError, ConcurrencyLimitError, HttpConnectionError, SurrealConnectionError,
+                               WebSocketConnectionClosedError, WebSocketConnectionError, WrongParameterError)
+from surrealist.ids import IdGenerator
+from surrealist.ql.statements.insert import Insert
+from surrealist.ql.statements.statement import Statement
+from surrealist.result import SurrealResult
+from surrealist.utils import parse_duration, safe_dumps
+
+logger = getLogger("surrealist.bulk")
+
+# errors raised before the request is sent, batches with them are sent again as they are
+NOT_SENT = (CircuitOpenError, ConcurrencyLimitError, ConnectionRefusedError)
+# errors of transport, the batch may be written already, so it is sent again only as INSERT IGNORE with ids
+RETRYABLE = NOT_SENT + (SurrealConnectionError, HttpConnectionError, WebSocketConnectionError,
+                        WebSocketConnectionClosedError, OSError)
+_STOP = object()  # tells a worker to finish
+_MAX_ERRORS = 10  # number of error messages in stats
+
+
+class AdaptiveBatcher:
+    """
+    Chooses the size of batches for bulk writes. After each batch it estimates the cost of one record (by the server
+    time of the result, or by the wall-clock time if the server does not report it) and the fixed cost of a round
+    trip, then moves the size to the number of records, which takes **target_latency** and fits **max_bytes**.
+    The size grows at most **growth** times per batch, on a failed or too slow batch it is multiplied by **backoff**.
+    It is thread-safe, so one batcher can serve all threads of a bulk insert
+
+    Example:
+    db.table("person").bulk_insert(rows, batch_size=AdaptiveBatcher(target_latency=0.5))
+    """
+
+    def __init__(self, initial_size: int = 500, min_size: int = 10, max_size: int = 10_000,
+                 target_latency: float = 1.0, max_bytes: int = 4 * 1024 * 1024, growth: float = 2.0,
+                 backoff: float = 0.5, smoothing: float = 0.3, on_change: Optional[Callable[[int, int], None]] = None):
+        """
+        :param initial_size: size of the first batch
+        :param min_size: size will never be less than this value
+        :param max_size: size will never be more than this value
+        :param target_latency: desired duration of one batch in seconds, keep it well below the timeout
+        :param max_bytes: desired maximum size of one batch in bytes
+        :param growth: maximum multiplier of the size per batch, more than 1
+        :param backoff: multiplier of the size on a failed or slow batch, between 0 and 1
+        :param smoothing: weight of the new sample in estimations, between 0 and 1
+        :param on_change: optional function to call on each change of the size, it gets old and new size
+        """
+        if min_size < 1 or max_size < min_size:
+            raise ValueError("Sizes should satisfy 1 <= min_size <= max_size")
+        if growth <= 1 or not 0 < backoff < 1 or not 0 < smoothing <= 1:
+            raise ValueError("Growth should be more than 1, backoff between 0 and 1, smoothing between 0 and 1")
+        self._min = min_size
+        self._max = max_size
+        self._size = float(min(max(initial_size, min_size), max_size))
+        self._target = target_latency
+        self._max_bytes = max_bytes
+        self._growth = growth
+        self._backoff = backoff
+        self._smoothing = smoothing
+        self._on_change = on_change
+        self._lock = Lock()
+        self._per_record: Optional[float] = None
+        self._overhead = 0.0
+        self._record_bytes: Optional[float] = None
+        self._batches = 0
+        self._failed = 0
+        self._last_latency = 0.0
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the size for the next batch
+        """
+        return int(self._size)
+
+    def observe_result(self, result: SurrealResult, count: int, size_bytes: int, latency: float):
+        """
+        Adapts the size with a batch, server time is taken from the result, an error result is a failed batch
+
+        :param result: result of the batch
+        :param count: number of records in the batch
+        :param size_bytes: size of the batch in bytes
+        :param latency: wall-clock duration of the batch in seconds
+        """
+        server_time = None
+        if result.time:
+            try:
+                server_time = parse_duration(result.time)
+            except ValueError:
+                pass
+        self.observe(count, size_bytes, latency, server_time, result.is_error())
+
+    def observe(self, count: int, size_bytes: int, latency: float, server_time: Optional[float] = None,
+                failed: bool = False):
+        """
+        Adapts the size with a batch
+
+        :param count: number of records in the batch
+        :param size_bytes: size of the batch in bytes
+        :param latency: wall-clock duration of the batch in seconds
+        :param server_time: optional duration of the batch on the server in seconds
+        :param failed: True if the batch failed
+        """
+        with self._lock:
+            self._batches += 1
+            self._last_latency = latency
+            old = int(self._size)
+            if failed or latency > self._target * 1.5:
+                self._failed += failed
+                size = self._size * self._backoff
+            elif count < 1:
+                return
+            else:
+                size = min(self._desired(count, size_bytes, latency, server_time), self._size * self._growth)
+            self._size = min(max(size, self._min), self._max)
+            new = int(self._size)
+        if old != new:
+            logger.debug("Batch size changed from %s to %s", old, new)
+            if self._on_change:
+                self._on_change(old, new)
+
+    def _desired(self, count: int, size_bytes: int, latency: float, server_time: Optional[float]) -> float:
+        """
+        Number of records for the target latency and bytes, estimations are smoothed, called under lock
+        """
+        busy = latency if server_time is None else min(server_time, latency)
+        weight = self._smoothing
+        if self._per_record is None:
+            self._per_record, self._record_bytes, self._overhead = busy / count, size_bytes / count, latency - busy
+        else:
+            self._per_record = self._per_record * (1 - weight) + busy / count * weight
+            self._record_bytes = self._record_bytes * (1 - weight) + size_bytes / count * weight
+            self._overhead = self._overhead * (1 - weight) + (latency - busy) * weight
+        by_time = (self._target - self._overhead) / self._per_record if self._per_record else self._max
+        by_bytes = self._max_bytes / self._record_bytes if self._record_bytes else self._max
+        return min(by_time, by_bytes)
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the batcher
+
+        :return: dict with current size, number of batches and failed ones, last latency and estimations
+        """
+        return {"size": self.size, "batches": self._batches, "failed": self._failed,
+                "last_latency": self._last_latency, "per_record": self._per_record, "overhead": self._overhead}
+
+    def __repr__(self):
+        return f"AdaptiveBatcher(size={self.size}, min={self._min}, max={self._max}, target_latency={self._target})"
+
+
+def batches(records: Iterable[Dict], batch_size: Union[int, AdaptiveBatcher], max_bytes: int,
+            id_generator: Optional[IdGenerator] = None) -> Iterator[Tuple[List[Dict], List[str], int]]:
+    """
+    Reads records lazily and groups them into batches, each record is rendered to measure its size. A batch is closed
+    when it has batch_size records or its rendered size exceeds max_bytes (a bigger record goes alone)
+
+    :param records: any iterable of dicts
+    :param batch_size: maximum number of records in a batch, or a batcher to ask for the size of each batch
+    :param max_bytes: maximum size of rendered records of a batch in bytes
+    :param id_generator: optional, function for new ids, records without id get a new one
+    :return: iterator of triples: records, rendered records and their size in bytes
+    """
+    adaptive = isinstance(batch_size, AdaptiveBatcher)
+    limit = batch_size.size if adaptive else batch_size
+    batch, rendered, size = [], [], 0
+    for record in records:
+        if id_generator is not None and "id" not in record:
+            record = {"id": id_generator(), **record}
+        text = safe_dumps(record)
+        length = len(text) if text.isascii() else len(text.encode())
+        if batch and (len(batch) >= limit or size + length > max_bytes):
+            yield batch, rendered, size
+            batch, rendered, size = [], [], 0
+            limit = batch_size.size if adaptive else batch_size
+        batch.append(record)
+        rendered.append(text)
+        size += length + 2  # with a separator
+    if batch:
+        yield batch, rendered, size
+
+
+def bulk_insert(connection: Connection, table: str, records: Iterable[Dict],
+                batch_size: Union[int, AdaptiveBatcher] = 1000, max_bytes: int = 4 * 1024 * 1024,
+                concurrency: int = 4, retries: int = 2, retry_delay: float = 0.5, ignore: bool = False,
+                on_duplicate: Optional[str] = None, id_generator: Optional[IdGenerator] = None,
+                on_error: Optional[Callable[[List[Dict], str], None]] = None, relation: bool = False) -> Dict:
+    """
+    Inserts records in batches, which are sent by several threads at the same time (over different connections of
+    a pool). Records are read lazily, at most 2 * concurrency batches wait in memory. Batches with errors of the
+    database (a result with ERR status) are not sent again.
+
+    Delivery is at least once: a batch with an error of transport (lost connection, timeout) may be written already.
+    Such a batch is sent again after a delay only if all its records have ids (use id_generator) and on_duplicate is
+    not used, and the retry is INSERT IGNORE, so records written by the first attempt are skipped. Otherwise the batch
+    goes to on_error without retries. Batches rejected before sending (open circuit, concurrency limit, refused
+    connection) are always sent again as they are
+
+    :param connection: connection or pool to run queries
+    :param table: name of the table
+    :param records: any iterable of dicts
+    :param batch_size: maximum number of records in a batch, or AdaptiveBatcher to change it on the fly
+    :param max_bytes: maximum size of rendered records of a batch in bytes
+    :param concurrency: number of threads to send batches
+    :param retries: number of attempts to send a batch again (see above)
+    :param retry_delay: delay before the first retry in seconds, it doubles with each next retry
+    :param ignore: use INSERT IGNORE, so existing records are skipped
+    :param on_duplicate: optional action for ON DUPLICATE KEY UPDATE, like "count += 1"
+    :param id_generator: optional, function for new ids (for example get_ulid), records without id get a new one
+    :param on_error: optional function, it gets records and the error of each failed batch
+    :param relation: use INSERT RELATION, records should have in and out fields
+    :return: stats: numbers of records, batches, failed batches and records, retries, bytes of queries, time, speed and
+    errors
+    :raise ValueError: if batch_size, max_bytes or concurrency is less than one, or retries is negative
+    :raise WrongParameterError: if both ignore and on_duplicate are used
+    """
+    batcher = batch_size if isinstance(batch_size, AdaptiveBatcher) else None
+    if min(batcher.size if batcher else batch_size, max_bytes, concurrency) < 1:
+        raise ValueError("The batch_size, max_bytes and concurrency cannot be smaller than 1")
+    if retries < 0:
+        raise ValueError("The retries cannot be negative")
+    if ignore and on_duplicate:
+        raise WrongParameterError("Use ignore or on_duplicate, not both")
+
+    def statement(batch: List[Dict], skip_existing: bool) -> Statement:
+        insert = Insert(None, table, batch)
+        if relation:
+            insert.relation()
+        if skip_existing:
+            insert.ignore()
+        return insert.on_duplicate(on_duplicate) if on_duplicate else insert
+
+    stats = {"records": 0, "batches": 0, "failed_batches": 0, "failed_records": 0, "retries": 0, "bytes": 0,
+             "errors": []}
+    lock = Lock()
+    queue = Queue(maxsize=2 * concurrency)
+
+    def send(batch: List[Dict], _rendered: List[str], _size: int):
+        query = statement(batch, ignore).to_str()
+        size = len(query) if query.isascii() else len(query.encode())
+        idempotent = not on_duplicate and all("id" in record for record in batch)
+        error = None
+        for attempt in range(retries + 1):
+            if attempt:
+                with lock:
+                    stats["retries"] += 1
+                time.sleep(retry_delay * 2 ** (attempt - 1))
+            started = time.perf_counter()
+            try:
+                result = connection.query(query)
+            except RETRYABLE as e:
+                error = f"{e.__class__.__name__}: {e}"
+                if batcher:
+                    batcher.observe(len(batch), size, time.perf_counter() - started, failed=True)
+                if isinstance(e, NOT_SENT):
+                    continue
+                if not idempotent:
+                    error = f"{error} (the batch may be written, it is not sent again without ids)"
+                    break
+                query = statement(batch, True).to_str()
+                continue
+            except Exception as e:  # not a transport error, so the batch is not sent again
+                error = f"{e.__class__.__name__}: {e}"
+                break
+            if batcher:
+                batcher.observe_result(result, len(batch), size, time.perf_counter() - started)
+            error = str(result.result) if result.is_error() else None
+            break
+        with lock:
+            stats["batches"] += 1
+            stats["bytes"] += size
+            if error is None:
+                stats["records"] += len(batch)
+            else:
+                stats["failed_batches"] += 1
+                stats["failed_records"] += len(batch)
+                if len(stats["errors"]) < _MAX_ERRORS:
+                    stats["errors"].append(error)
+        if error is not None and on_error is not None:
+            on_error(batch, error)
+
+    lane = current_lane(connection)  # workers use the lane of the caller
+
+    def work():
+        with use_lane(connection, lane):
+            consume()
+
+    def consume():
+        while True:
+            item = queue.get()
+            if item is _STOP:
+                return
+            try:
+                send(*item)
+            except Exception as e:  # error of on_error callback, the worker should not stop
+                with lock:
+                    if len(stats["errors"]) < _MAX_ERRORS:
+                        stats["errors"].append(f"{e.__class__.__name__}: {e}")
+
+    start = time.perf_counter()
+    threads = [Thread(target=work, name=f"surrealist-bulk-{i}", daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    try:
+        overhead = len(statement([], ignore).to_str()) - 2  # the query without records in brackets
+        for item in batches(records, batch_size, max_bytes - overhead, id_generator):
+            queue.put(item)
+    finally:
+        for _ in threads:
+            queue.put(_STOP)
+        for thread in threads:
+            thread.join()
+    seconds = time.perf_counter() - start
+    stats["seconds"] = seconds
+    stats["records_per_second"] = stats["records"] / seconds if seconds else 0.0
+    if batcher:
+        stats["batcher"] = batcher.stats()
+    return stats
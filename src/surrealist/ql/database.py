@@ -1,6 +1,6 @@
 import logging
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from surrealist.connections.connection import Connection
 from surrealist.enums import Algorithm, AutoOrNone
@@ -18,8 +18,10 @@ from surrealist.ql.statements.rebuild_index import RebuildIndex
 from surrealist.ql.statements.relate import Relate
 from surrealist.ql.statements.returns import Return
 from surrealist.ql.statements.statement import Statement
+from surrealist.ql.replica import TableReplica
 from surrealist.ql.statements.transaction import Transaction
 from surrealist.ql.table import Table
+from surrealist.query_cache import QueryCache
 from surrealist.result import SurrealResult
 from surrealist.surreal import Surreal
 from surrealist.utils import AC, DB, DEFAULT_TIMEOUT, NS
@@ -39,7 +41,8 @@ class Database:
     def __init__(self, url: str, namespace: str, database: str, access: Optional[str] = None,
                  credentials: Optional[Tuple[str, str]] = None,
                  use_http: bool = False, timeout: int = DEFAULT_TIMEOUT,
-                 active_connection: Optional[Connection] = None):
+                 active_connection: Optional[Connection] = None, lazy_results: bool = False,
+                 clean_dates: bool = False):
         """
         Creates a new connection to the database or uses existing connection
         :param url: url of the SurrealDB
@@ -51,13 +54,17 @@ class Database:
         :param timeout: timeout for the queries
         :param active_connection: existing and active (connected) connection to use, If specified, all other
         parameters are ignored
+        :param lazy_results: if True, results keep raw JSON and decode it only on access
+        :param clean_dates: if True, queries are cleaned from quoted date strings (like "d'2024-01-01T00:00:00Z'"),
+        False by default, use DatetimeLiteral (to_surreal_datetime_str) with query builders instead
         """
         if active_connection is None:
             self._namespace = namespace
             self._database = database
             self._access = access
             self._connection = Surreal(url, namespace, database, access=access, credentials=credentials,
-                                       use_http=use_http, timeout=timeout).connect()
+                                       use_http=use_http, timeout=timeout, lazy_results=lazy_results,
+                                       clean_dates=clean_dates).connect()
             logger.info("DatabaseQL is up")
         else:
             self._connection = self._use_connection(active_connection)
@@ -189,6 +196,40 @@ class Database:
         """
         return Table(name, self._connection)
 
+    def query_cache(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = 60.0,
+                    use_live: bool = True) -> QueryCache:
+        """
+        Creates a client-side cache of SELECT results on the connection of the database, use it with Table.cached.
+        Entries of a table are invalidated by a live query on it (only for websockets), by TTL and by eviction
+
+        Example:
+        cache = db.query_cache(ttl=60)
+        db.table("country").cached(cache).select().run()
+
+        :param max_entries: maximum number of cached results
+        :param max_bytes: maximum size of cached results (as JSON) in bytes
+        :param ttl: seconds to keep a result, None means until eviction or invalidation
+        :param use_live: invalidate entries of a table by a live query on it
+        :return: QueryCache object
+        """
+        return QueryCache(self._connection, max_entries, max_bytes, ttl, use_live)
+
+    def replicate(self, table_name: str, indexes: Iterable[str] = ()) -> TableReplica:
+        """
+        Loads the table into memory and keeps it in sync by a live query with DIFF (only for websockets), lookups by
+        id and by equality of fields are answered without requests. Use it for small tables, which are read often
+
+        Example:
+        currencies = db.replicate("currency", indexes=["code"])
+        currencies.find_one(code="EUR")
+
+        :param table_name: name of the table
+        :param indexes: fields to index for lookups by equality
+        :return: started TableReplica object, close it to kill the live query
+        :raise CompatibilityError: on http transport
+        """
+        return TableReplica(self._connection, table_name, indexes).start()
+
     def transaction(self, statements: List[Statement]) -> Transaction:
         """
         Create a transaction object to generate a query or run
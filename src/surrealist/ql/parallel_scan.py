@@ -0,0 +1,241 @@
+import re
+from queue import Queue
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from surrealist.connections import Connection
+from surrealist.connections.lanes import current_lane, use_lane
+from surrealist.ql.statements.keyset import KeysetIterator, key_literal
+from surrealist.ql.statements.stream import END, drain, offer
+
+SAMPLE_PER_PARTITION = 100  # records in the random sample for each partition, for keys which cannot be split evenly
+_NUMERIC_ID = re.compile(r"(\w+):(\d+)")
+
+
+class ParallelScan:
+    """
+    Full scan of a table, split into partitions by ranges of a unique sort key (id by default). Each partition is
+    selected with keyset pagination in its own thread, so with a pool (DatabaseConnectionsPool) partitions are read
+    concurrently over different connections.
+
+    Split points are found with the server (the smallest and the largest key or a sample), or can be specified, for
+    example [1000, 2000, 3000] for numeric keys. Records come as one merged iterator (order between partitions is not
+    kept) or to a callback for each page of each partition.
+
+    Example:
+    for record in db.table("user").parallel_scan(partitions=4):
+        process(record)
+    """
+
+    def __init__(self, connection: Connection, table: str, partitions: int, key: str = "id", fields: str = "*",
+                 page_size: int = 1000, boundaries: Optional[Sequence[Any]] = None, where: Optional[str] = None,
+                 progress: Optional[Callable[[Dict], None]] = None):
+        """
+        :param connection: connection or pool to run queries
+        :param table: name of the table
+        :param partitions: number of partitions (and threads), it cannot be smaller than one
+        :param key: unique sort key, it should be selected
+        :param fields: fields to select
+        :param page_size: number of records in each request, it cannot be smaller than one
+        :param boundaries: optional sorted split points, N points make N+1 partitions
+        :param where: optional condition for all partitions
+        :param progress: optional function, it gets stats (see stats method) after each page, called from threads
+        :raise ValueError: if partitions or page_size is less than one
+        """
+        if partitions < 1:
+            raise ValueError("The number of partitions cannot be smaller than 1")
+        if page_size < 1:
+            raise ValueError("The page_size cannot be smaller than 1")
+        self._connection = connection
+        self._table = table
+        self._partitions = partitions
+        self._key = key
+        self._fields = fields
+        self._page_size = page_size
+        self._boundaries = None if boundaries is None else list(boundaries)
+        self._where = where
+        self._progress = progress
+        self._lock = Lock()
+        self._records: List[int] = []
+        self._finished = 0
+
+    def boundaries(self) -> List[Any]:
+        """
+        Returns split points of partitions, they are queried on the first call if not specified: two requests for the
+        smallest and the largest key, and the range between them is split evenly for numbers and record ids with
+        numeric parts. For other keys a random sample of records (SAMPLE_PER_PARTITION for each partition) is sorted
+        by the server and split by its quantiles
+
+        :return: sorted list of key values
+        """
+        if self._boundaries is None:
+            where = f" WHERE {self._where}" if self._where else ""
+            ordered = f"SELECT VALUE {self._key} FROM {self._table}{where} ORDER BY {self._key}"
+            low = self._first(f"{ordered} LIMIT 1;")
+            high = self._first(f"{ordered} DESC LIMIT 1;")
+            points = _split(low, high, self._partitions)
+            if points is None:
+                size = SAMPLE_PER_PARTITION * self._partitions
+                sample = self._connection.query(f"SELECT VALUE {self._key} FROM (SELECT {self._key} FROM "
+                                                f"{self._table}{where} ORDER BY rand() LIMIT {size}) ORDER BY "
+                                                f"{self._key};").records()
+                points = _quantiles(sample, self._partitions)
+            self._boundaries = points
+        return self._boundaries
+
+    def ranges(self) -> List[Tuple[Any, Any]]:
+        """
+        Returns ranges of partitions: pairs of the first key (inclusive) and the last key (exclusive), None means
+        no bound
+
+        :return: list of pairs
+        """
+        points = [None, *self.boundaries(), None]
+        return list(zip(points[:-1], points[1:]))
+
+    def condition(self, index: int) -> Optional[str]:
+        """
+        Returns the condition of WHERE clause for the partition
+
+        :param index: number of the partition, from zero
+        :return: condition or None for the only partition without a condition
+        """
+        low, high = self.ranges()[index]
+        conditions = [f"({self._where})"] if self._where else []
+        if low is not None:
+            conditions.append(f"{self._key} >= {key_literal(self._key, low)}")
+        if high is not None:
+            conditions.append(f"{self._key} < {key_literal(self._key, high)}")
+        return " AND ".join(conditions) or None
+
+    def stats(self) -> Dict:
+        """
+        Returns progress of the scan: number of partitions, finished partitions and received records
+
+        :return: dict with metrics
+        """
+        with self._lock:
+            return {"partitions": len(self._records), "finished": self._finished, "records": sum(self._records),
+                    "per_partition": list(self._records)}
+
+    def run(self, callback: Callable[[int, List[Dict]], Any]) -> Dict:
+        """
+        Scans all partitions and passes each page to the callback with the number of the partition, the callback is
+        called from the threads of partitions. Blocks until all partitions are finished
+
+        :param callback: function of the partition number and the list of records
+        :return: stats of the scan
+        :raise Exception: the first error of any partition, after all threads are finished
+        """
+        errors = []
+
+        def emit(index: int, records: List[Dict]) -> bool:
+            callback(index, records)
+            return True
+
+        def work(index: int):
+            try:
+                self._scan(index, emit)
+            except Exception as e:  # any error of a partition goes to the caller
+                errors.append(e)
+
+        threads = self._start(work)
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return self.stats()
+
+    def __iter__(self) -> Iterator[Dict]:
+        count = len(self.ranges())
+        queue = Queue(maxsize=2 * count)
+        stop = Event()
+
+        def work(index: int):
+            try:
+                self._scan(index, lambda _, records: offer(queue, records, stop))
+                offer(queue, END, stop)
+            except Exception as e:  # any error of a partition goes to the consumer
+                offer(queue, e, stop)
+
+        self._start(work)
+        yield from drain(queue, count, stop)
+
+    def _start(self, work: Callable[[int], None]) -> List[Thread]:
+        count = len(self.ranges())
+        with self._lock:
+            self._records = [0] * count
+            self._finished = 0
+        lane = current_lane(self._connection)  # partitions use the lane of the caller
+
+        def in_lane(index: int):
+            with use_lane(self._connection, lane):
+                work(index)
+
+        threads = [Thread(target=in_lane, args=(index,), name=f"surrealist-scan-{index}", daemon=True)
+                   for index in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _scan(self, index: int, emit: Callable[[int, List[Dict]], bool]):
+        pages = KeysetIterator(self._connection.query, f"SELECT {self._fields} FROM {self._table}",
+                               self.condition(index), "", self._key, self._page_size)
+        for page in pages:
+            records = page.records()
+            with self._lock:
+                self._records[index] += len(records)
+            self._report()
+            if not emit(index, records):
+                return
+        with self._lock:
+            self._finished += 1
+        self._report()
+
+    def _first(self, query: str) -> Any:
+        found = self._connection.query(query).records()
+        return found[0] if found else None
+
+    def _report(self):
+        if self._progress is not None:
+            self._progress(self.stats())
+
+    def __repr__(self):
+        return f"ParallelScan(table={self._table}, partitions={self._partitions}, key={self._key})"
+
+
+def _split(low: Any, high: Any, partitions: int) -> Optional[List[Any]]:
+    """
+    Splits the range of keys evenly, returns None if keys are not numbers or record ids with numeric parts
+    """
+    if low is None or high is None or low == high:
+        return []
+    if _is_number(low) and _is_number(high):
+        return _split_numbers(low, high, partitions)
+    low_id, high_id = _NUMERIC_ID.fullmatch(str(low)), _NUMERIC_ID.fullmatch(str(high))
+    if low_id and high_id and low_id.group(1) == high_id.group(1):
+        table = low_id.group(1)
+        return [f"{table}:{point}" for point in _split_numbers(int(low_id.group(2)), int(high_id.group(2)), partitions)]
+    return None
+
+
+def _split_numbers(low: Any, high: Any, partitions: int) -> List[Any]:
+    if isinstance(low, int) and isinstance(high, int):
+        span = high - low + 1
+        points = {low + span * i // partitions for i in range(1, partitions)}
+    else:
+        points = {low + (high - low) * i / partitions for i in range(1, partitions)}
+    return sorted(point for point in points if low < point <= high)
+
+
+def _quantiles(sample: List[Any], partitions: int) -> List[Any]:
+    points = []
+    for i in range(1, partitions):
+        point = sample[len(sample) * i // partitions] if sample else None
+        if point is not None and point != sample[0] and point not in points:
+            points.append(point)
+    return points
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -1,8 +1,12 @@
 import logging
 from os import cpu_count
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from surrealist.connections.lanes import Lane
+from surrealist.connections.limits import CircuitBreaker, ConcurrencyLimiter
 from surrealist.connections.pool import Pool
+from surrealist.connections.single_flight import SingleFlight
 from surrealist.ql.database import Database
 from surrealist.utils import DEFAULT_TIMEOUT
 
@@ -27,19 +31,28 @@ class DatabaseConnectionsPool(Database):
     def __init__(self, url: str, namespace: str, database: str, access: Optional[str] = None,
                  credentials: Optional[Tuple[str, str]] = None,
                  use_http: bool = False, timeout: int = DEFAULT_TIMEOUT,
-                 min_connections: int = CORES_COUNT, max_connections: int = 50):
+                 min_connections: int = CORES_COUNT, max_connections: int = 50,
+                 limiter: Optional[ConcurrencyLimiter] = None, breaker: Optional[CircuitBreaker] = None,
+                 lanes: Optional[List[Lane]] = None, lazy_results: bool = False, clean_dates: bool = False,
+                 single_flight: Optional[SingleFlight] = None):
         """
         All parameters are the same as for Surreal or Database object
 
         :param min_connections: minimum number of connections, it cannot be less than 2
         :param max_connections: maximum number of connections, it cannot be more than 50
+        :param limiter: optional adaptive concurrency limiter (AimdLimiter or GradientLimiter)
+        :param breaker: optional circuit breaker
+        :param lanes: optional list of lanes (priority classes) to share connections between kinds of traffic
+        :param single_flight: optional SingleFlight to share identical concurrent read queries
         """
         self._options = {
             "url": url, "namespace": namespace, "database": database, "access": access, "credentials": credentials,
             "use_http": use_http, "timeout": timeout, "min_connections": min_connections,
-            "max_connections": max_connections
+            "max_connections": max_connections, "limiter": limiter, "breaker": breaker,
+            "lanes": lanes, "lazy_results": lazy_results, "clean_dates": clean_dates, "single_flight": single_flight
         }
-        super().__init__(url, namespace, database, access, credentials, use_http, timeout)
+        super().__init__(url, namespace, database, access, credentials, use_http, timeout,
+                         lazy_results=lazy_results, clean_dates=clean_dates)
         self._connection = Pool(self._connection, **self._options)
         self._connected = True
         self._min = min_connections
@@ -73,6 +86,44 @@ class DatabaseConnectionsPool(Database):
         """
         return self._max
 
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the pool, including metrics of the limiter and the circuit breaker if they are used
+
+        :return: dict with metrics
+        """
+        return self._connection.stats()
+
+    def close(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Closes the pool gracefully: stops accepting new requests, waits for the requests in flight no longer than
+        timeout, then closes all connections, including busy ones. You cannot and should not use a pool after that
+
+        :param timeout: seconds to wait for requests in flight, pool timeout is used if it is None
+        :return: report, a dict with "drained" flag (True if all requests were finished in time), number of closed
+        connections and a list of still running requests
+        """
+        logger.info("DatabaseQL pool is closing")
+        report = self._connection.close(timeout)
+        self._connected = False
+        return report
+
+    @contextmanager
+    def lane(self, name: str) -> Iterator["DatabaseConnectionsPool"]:
+        """
+        Context manager to run all requests of the current thread inside it in the specified lane, it works both for
+        database methods and for statements, for example:
+
+        with db.lane("batch"):
+            for result in db.person.select().iter(1000):
+                process(result)
+
+        :param name: name of the lane
+        :raise WrongParameterError: if there is no such lane, or pool has no lanes
+        """
+        with self._connection.lane(name):
+            yield self
+
     def __repr__(self):
         return f"DatabasePool(namespace={self._namespace}, name={self._database}, connected={self.is_connected()}," \
                f"connections_count={self.connections_count}, min_connections={self._min}, max_connections={self._max})"
@@ -0,0 +1,381 @@
+from copy import deepcopy
+from logging import getLogger
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from surrealist.connections import Connection
+from surrealist.ql.statements.live import Live
+from surrealist.record_id import RecordId
+from surrealist.utils import StrOrRecord
+
+logger = getLogger("surrealist.replica")
+_ALL = ""  # a mark in dirty keys: the whole table should be loaded again
+MAX_RETRY_DELAY = 30.0  # seconds between attempts of a failing background sync
+Index = Dict[Any, Set[str]]
+
+
+class TableReplica:
+    """
+    Local copy of a small table (currencies, feature flags, permissions), kept in sync by a live query with DIFF:
+    the table is selected once, then each event of the live query is applied to the copy. Lookups by id and by
+    equality of fields are answered from memory, with hash indexes on the chosen fields, without requests.
+
+    The live query is started before the table is selected, so no change is lost. If an event cannot be applied
+    (a record is missing, an unknown patch, an event during loading), the record is selected again in a background
+    thread, or the whole table if the id of the record is unknown. If such a select fails, it is repeated with
+    a growing delay, until then these records are stale (see stats). Live queries work only for websockets.
+
+    Records are shared, do not change them.
+
+    Example:
+    with db.replicate("currency", indexes=["code"]) as currencies:
+        currencies.get("currency:usd")
+        currencies.find_one(code="EUR")
+    """
+
+    def __init__(self, connection: Connection, table: str, indexes: Iterable[str] = (), retry_delay: float = 0.5):
+        """
+        :param connection: websocket connection or pool
+        :param table: name of the table
+        :param indexes: fields (dotted paths for nested ones) to index for find
+        :param retry_delay: delay before the first repeat of a failed background select in seconds, it doubles with
+        each next failure up to MAX_RETRY_DELAY
+        """
+        self._connection = connection
+        self._table = table
+        self._fields = tuple(indexes)
+        self._lock = Lock()
+        self._sync_lock = Lock()  # one loading at a time
+        self._records: Dict[str, Dict] = {}
+        self._indexes: Dict[str, Index] = {field: {} for field in self._fields}
+        self._versions: Dict[str, int] = {}  # number of events of records being selected, to detect changes
+        self._dirty: Set[str] = set()
+        self._loading = False
+        self._thread: Optional[Thread] = None
+        self._live_id: Optional[str] = None
+        self._retry_delay = retry_delay
+        self._closed = Event()
+        self._last_error: Optional[str] = None
+        self._stats = {"events": 0, "applied": 0, "reselected": 0, "reloads": 0, "errors": 0}
+
+    def start(self) -> "TableReplica":
+        """
+        Starts the live query and loads the table
+
+        :return: the replica
+        :raise CompatibilityError: on http transport
+        :raise ValueError: if the live query or the select returns an error
+        """
+        result = Live(self._connection, self._table, self._on_event, use_diff=True).run()
+        if result.is_error():
+            raise ValueError(f"Cannot start live query on {self._table}: {result.result}")
+        self._live_id = result.result
+        try:
+            self.reload()
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def get(self, record_id: StrOrRecord) -> Optional[Dict]:
+        """
+        Returns the record by id
+
+        :param record_id: full id like "currency:usd", or only the id part like "usd"
+        :return: record or None if there is no such record
+        """
+        return self._records.get(self._key(record_id))
+
+    def find(self, **equals) -> List[Dict]:
+        """
+        Returns records with all fields equal to the values, indexed fields are used first, use dict unpacking for
+        nested fields: find(**{"address.city": "Paris"})
+
+        :param equals: field names and values
+        :return: list of records
+        """
+        with self._lock:
+            indexed = [self._indexes[field].get(_hashable(value), set()) for field, value in equals.items()
+                       if field in self._indexes]
+            keys = min(indexed, key=len) if indexed else self._records.keys()
+            records = [self._records[key] for key in keys]
+        others = [(field, value) for field, value in equals.items() if field not in self._indexes or len(indexed) > 1]
+        return [record for record in records if all(_field(record, field) == value for field, value in others)]
+
+    def find_one(self, **equals) -> Optional[Dict]:
+        """
+        Returns any record with all fields equal to the values (see find)
+
+        :param equals: field names and values
+        :return: record or None
+        """
+        found = self.find(**equals)
+        return found[0] if found else None
+
+    def all(self) -> List[Dict]:
+        """
+        Returns all records of the replica
+        """
+        return list(self._records.values())
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record_id: StrOrRecord) -> bool:
+        return self._key(record_id) in self._records
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.all())
+
+    def reload(self):
+        """
+        Loads the whole table again now, in the current thread
+        """
+        with self._lock:
+            self._dirty.add(_ALL)
+        self.sync()
+
+    def sync(self):
+        """
+        Selects records, which could not be updated by events, now in the current thread
+        """
+        with self._sync_lock:
+            while True:
+                with self._lock:
+                    dirty, self._dirty = self._dirty, set()
+                    if not dirty:
+                        return
+                    self._loading = _ALL in dirty
+                try:
+                    if _ALL in dirty:
+                        self._load()
+                    else:
+                        self._reselect(sorted(dirty))
+                except Exception as e:
+                    with self._lock:
+                        self._loading = False
+                        self._dirty |= dirty
+                        self._stats["errors"] += 1
+                        self._last_error = str(e)
+                    raise
+                with self._lock:
+                    self._last_error = None
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the replica
+
+        :return: dict with numbers of records, live events, applied events, selected again records, loads of the
+        table, errors and records waiting for a select, stale flag (some records may be outdated, they wait for a
+        select) and the last error of a select (None after a successful one)
+        """
+        with self._lock:
+            return {**self._stats, "records": len(self._records), "dirty": len(self._dirty),
+                    "stale": bool(self._dirty), "last_error": self._last_error}
+
+    def close(self):
+        """
+        Kills the live query, the replica stops updating
+        """
+        self._closed.set()
+        live_id, self._live_id = self._live_id, None
+        if live_id:
+            self._connection.kill(live_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_details):
+        self.close()
+
+    def _key(self, record_id: StrOrRecord) -> str:
+        if isinstance(record_id, RecordId):
+            return record_id.to_valid_string()
+        return record_id if ":" in record_id else f"{self._table}:{record_id}"
+
+    def _load(self):
+        records = self._connection.query(f"SELECT * FROM {self._table};").records()
+        indexes: Dict[str, Index] = {field: {} for field in self._fields}
+        loaded = {}
+        for record in records:
+            key = str(record["id"])
+            loaded[key] = record
+            _index(indexes, key, record)
+        with self._lock:
+            self._records, self._indexes = loaded, indexes
+            self._loading = False
+            self._stats["reloads"] += 1
+
+    def _reselect(self, keys: List[str]):
+        with self._lock:
+            self._versions = dict.fromkeys(keys, 0)  # events are counted only while the select runs
+        try:
+            records = self._connection.query(f"SELECT * FROM [{', '.join(keys)}];").records()
+            found = {str(record["id"]): record for record in records}
+            with self._lock:
+                for key in keys:
+                    if self._versions[key]:
+                        self._dirty.add(key)  # changed again while selected
+                    elif key in found:
+                        self._put(key, found[key])
+                    else:
+                        self._drop(key)
+                self._stats["reselected"] += len(keys)
+        finally:
+            with self._lock:
+                self._versions = {}
+
+    def _on_event(self, message: Dict):
+        # called by the websocket thread, so requests are not allowed here
+        payload = message.get("result") or {}
+        action = payload.get("action")
+        if action not in ("CREATE", "UPDATE", "DELETE"):
+            return
+        key, data = _target(payload)
+        with self._lock:
+            self._stats["events"] += 1
+            if key in self._versions:
+                self._versions[key] += 1
+            if key is None or self._loading:
+                self._dirty.add(_ALL if key is None else key)
+            else:
+                try:
+                    self._apply(key, action, data)
+                    self._stats["applied"] += 1
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.info("Cannot apply event for %s, it will be selected: %s", key, e)
+                    self._dirty.add(key)
+            start = self._dirty and self._thread is None
+            if start:
+                self._thread = Thread(target=self._sync_in_background, name="surrealist-replica", daemon=True)
+        if start:
+            self._thread.start()
+
+    def _apply(self, key: str, action: str, data: Any):
+        """
+        Applies the event to the record, called under lock
+        """
+        if action == "DELETE":
+            self._drop(key)
+        elif isinstance(data, dict):
+            self._put(key, data)
+        else:
+            current = self._records.get(key)
+            self._put(key, _patched(None if current is None else deepcopy(current), data))
+
+    def _sync_in_background(self):
+        delay = self._retry_delay
+        while not self._closed.is_set():
+            try:
+                self.sync()
+                delay = self._retry_delay
+            except Exception:  # records stay dirty, they are selected again after the delay
+                logger.exception("Cannot sync replica of %s, next attempt in %s seconds", self._table, delay)
+                if self._closed.wait(delay):
+                    break
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                continue
+            with self._lock:
+                if not self._dirty:
+                    self._thread = None
+                    return
+        with self._lock:
+            self._thread = None
+
+    def _put(self, key: str, record: Dict):
+        """
+        Puts the record and updates indexes, called under lock
+        """
+        self._drop(key)
+        self._records[key] = record
+        _index(self._indexes, key, record)
+
+    def _drop(self, key: str):
+        """
+        Removes the record from records and indexes, called under lock
+        """
+        old = self._records.pop(key, None)
+        if old is None:
+            return
+        for field, index in self._indexes.items():
+            value = _hashable(_field(old, field))
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+    def __repr__(self):
+        return f"TableReplica(table={self._table}, records={len(self._records)}, indexes={list(self._fields)})"
+
+
+def _target(payload: Dict) -> Tuple[Optional[str], Any]:
+    """
+    Returns the id of the changed record and data of the event: a record or a list of JSON patches
+    """
+    data = payload.get("result")
+    record = payload.get("record")
+    if record is None and isinstance(data, dict):
+        record = data.get("id")
+    if record is None and isinstance(data, list):
+        record = next((patch["value"].get("id") for patch in data if patch.get("path") in ("", "/") and
+                       isinstance(patch.get("value"), dict)), None)
+    return (None if record is None else str(record)), data
+
+
+def _patched(record: Optional[Dict], patches: List[Dict]) -> Dict:
+    """
+    Applies JSON patches (add, replace, remove) of a DIFF live query to the record
+    """
+    for patch in patches:
+        path = [part.replace("~1", "/").replace("~0", "~") for part in patch["path"].strip("/").split("/") if part]
+        op = patch["op"]
+        if not path:
+            if op not in ("add", "replace"):
+                raise ValueError(f"Unsupported patch of the whole record: {op}")
+            record = patch["value"]
+            continue
+        if record is None:
+            raise KeyError("There is no record to patch")
+        parent = record
+        for part in path[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        last = path[-1]
+        if op == "remove":
+            del parent[int(last) if isinstance(parent, list) else last]
+        elif op in ("add", "replace") and isinstance(parent, list):
+            if last == "-":
+                parent.append(patch["value"])
+            elif op == "add":
+                parent.insert(int(last), patch["value"])
+            else:
+                parent[int(last)] = patch["value"]
+        elif op in ("add", "replace"):
+            parent[last] = patch["value"]
+        else:
+            raise ValueError(f"Unsupported patch: {op}")
+    if not isinstance(record, dict):
+        raise TypeError("Patched record is not a dict")
+    return record
+
+
+def _index(indexes: Dict[str, Index], key: str, record: Dict):
+    for field, index in indexes.items():
+        index.setdefault(_hashable(_field(record, field)), set()).add(key)
+
+
+def _field(record: Dict, field: str) -> Any:
+    value = record
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
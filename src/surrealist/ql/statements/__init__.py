@@ -7,6 +7,7 @@ from .define_user import DefineUser
 from .delete import Delete
 from .insert import Insert
 from .live import Live
+from .prepared import PreparedStatement
 from .rebuild_index import RebuildIndex
 from .remove import Remove
 from .select import Select
@@ -17,4 +18,5 @@ from .access import Access
 
 __all__ = ("Create", "Delete", "Insert", "Live", "Remove", "Select", "Show", "Update", "Transaction", "DefineParam",
            "DefineUser", "DefineEvent", "RebuildIndex", "DefineAnalyzer", "DefineAccessBearer", "DefineAccessJwt",
-           "DefineAccessRecord", "DefineField", "DefineScope", "DefineTable", "DefineToken", "DefineIndex", "Access")
+           "DefineAccessRecord", "DefineField", "DefineScope", "DefineTable", "DefineToken", "DefineIndex", "Access",
+           "PreparedStatement")
@@ -2,8 +2,7 @@ from typing import Dict, Optional
 
 from surrealist.ql.statements.common_statements import CanUseReturn
 from surrealist.ql.statements.statement import FinishedStatement, Statement
-from surrealist.ql.statements.utils import combine
-from surrealist.utils import safe_dumps
+from surrealist.ql.statements.utils import combine, render
 
 
 class Set(FinishedStatement, CanUseReturn):
@@ -33,7 +32,7 @@ class Content(FinishedStatement, CanUseReturn):
         self._content = content
 
     def _clean_str(self):
-        args = safe_dumps(self._content)
+        args = render(self._content)
         return f"{self._statement._clean_str()} CONTENT {args}"
 
 
@@ -3,7 +3,8 @@ from typing import Dict, List
 from surrealist.connections import Connection
 from surrealist.ql.statements.insert_statements import InsertUseDuplicate
 from surrealist.ql.statements.statement import Statement
-from surrealist.utils import OK, safe_dumps
+from surrealist.ql.statements.utils import render
+from surrealist.utils import OK
 
 
 class Insert(Statement, InsertUseDuplicate):
@@ -14,7 +15,7 @@ class Insert(Statement, InsertUseDuplicate):
 
     Examples: https://github.com/kotolex/surrealist/blob/master/examples/surreal_ql/ql_insert_examples.py
 
-    INSERT [ IGNORE ] INTO @what
+    INSERT [ RELATION ] [ IGNORE ] INTO @what
     [ @value
       | (@fields) VALUES (@values)
         [ ON DUPLICATE KEY UPDATE @field = @value ... ]
@@ -39,6 +40,22 @@ class Insert(Statement, InsertUseDuplicate):
         super().__init__(connection)
         self._table_name = table_name
         self._args = args
+        self._ignore = False
+        self._relation = False
+
+    def ignore(self) -> "Insert":
+        """
+        Include IGNORE statement for the query, so existing records are skipped without an error
+        """
+        self._ignore = True
+        return self
+
+    def relation(self) -> "Insert":
+        """
+        Include RELATION statement for the query, so records (with in and out fields) are inserted as edges
+        """
+        self._relation = True
+        return self
 
     def validate(self) -> List[str]:
         """
@@ -59,9 +76,11 @@ class Insert(Statement, InsertUseDuplicate):
     def _clean_str(self):
         args = self._args
         if len(args) == 1:
-            what = f"({args[0]._clean_str()})" if isinstance(args[0], Statement) else safe_dumps(args[0])
+            what = f"({args[0]._clean_str()})" if isinstance(args[0], Statement) else render(args[0])
         else:
             names = f"({', '.join(args[0])})"
-            data = ", ".join(safe_dumps(e) for e in args[1:])
+            data = ", ".join(render(e) for e in args[1:])
             what = f"{names} VALUES {data}"
-        return f"INSERT INTO {self._table_name} {what}"
+        relation = "" if not self._relation else " RELATION"
+        ignore = "" if not self._ignore else " IGNORE"
+        return f"INSERT{relation}{ignore} INTO {self._table_name} {what}"
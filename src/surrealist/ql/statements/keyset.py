@@ -0,0 +1,141 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Iterator, Optional
+
+from surrealist.record_id import RecordId
+from surrealist.result import SurrealResult
+from surrealist.utils import safe_dumps
+
+SOURCE = "source"  # SELECT ... FROM ... and WITH INDEX clauses
+FILTER = "filter"  # WHERE, AND, OR clauses
+TAIL = "tail"  # clauses, which can follow ORDER BY and LIMIT: FETCH, TIMEOUT, PARALLEL, TEMPFILES
+
+
+def key_literal(key: str, value: Any) -> str:
+    """
+    Renders a value of the sort key for a query, values of id are record ids
+
+    :param key: name of the key
+    :param value: value from a record
+    :return: string for a query
+    """
+    if key == "id" and isinstance(value, str):
+        return RecordId(value).to_valid_string()
+    return safe_dumps(value)
+
+
+def encode_cursor(key: str, last: Any) -> str:
+    """
+    Makes a cursor token from the key and its last value
+
+    :param key: name of the sort key
+    :param last: value of the key in the last received record
+    :return: url-safe string
+    """
+    return base64.urlsafe_b64encode(json.dumps([key, last]).encode()).decode()
+
+
+def decode_cursor(key: str, cursor: str) -> Any:
+    """
+    Returns the last value of the key from the cursor token
+
+    :param key: name of the sort key
+    :param cursor: token from KeysetIterator.cursor
+    :return: last value
+    :raise ValueError: if the token is wrong or made for another key
+    """
+    try:
+        cursor_key, last = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValueError(f"Wrong cursor: {cursor}") from e
+    if cursor_key != key:
+        raise ValueError(f"Cursor is made for key {cursor_key}, but iteration uses {key}")
+    return last
+
+
+class KeysetIterator:
+    """
+    Iterator on pages of a query with keyset (cursor) pagination: each page is selected with
+    WHERE key > last ORDER BY key LIMIT n, so the server never skips rows and a full scan takes linear time.
+    After each page **cursor** keeps the position, pass it to iter(cursor=...) to continue after a failure
+    """
+
+    def __init__(self, run: Callable[[str], SurrealResult], prefix: str, condition: Optional[str], tail: str,
+                 key: str, limit: int, cursor: Optional[str] = None):
+        """
+        :param run: function to run the query
+        :param prefix: SELECT ... FROM ... part of the query
+        :param condition: optional condition of the WHERE clause
+        :param tail: optional clauses after LIMIT
+        :param key: unique sort key, values of it should be in selected records
+        :param limit: number of records in each page
+        :param cursor: optional token to start after
+        """
+        self._run = run
+        self._prefix = prefix
+        self._condition = condition
+        self._tail = tail
+        self._key = key
+        self._limit = limit
+        self._last = None if cursor is None else decode_cursor(key, cursor)
+        self._started = cursor is not None
+        self._finished = False
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """
+        Returns a token with the position after the last received page, None if nothing is received yet
+        """
+        return encode_cursor(self._key, self._last) if self._started else None
+
+    def query(self) -> str:
+        """
+        Returns the query for the next page
+        """
+        conditions = [f"({self._condition})"] if self._condition else []
+        if self._started:
+            conditions.append(f"{self._key} > {key_literal(self._key, self._last)}")
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"{self._prefix}{where} ORDER BY {self._key} LIMIT {self._limit}{self._tail};"
+
+    def __iter__(self) -> Iterator[SurrealResult]:
+        return self
+
+    def __next__(self) -> SurrealResult:
+        if self._finished:
+            raise StopIteration
+        result = self._run(self.query())
+        records = result.records()
+        if not records:
+            self._finished = True
+            raise StopIteration
+        last = self._value(records[-1])
+        if self._started and not _moved(last, self._last):
+            raise ValueError(f"Keyset iteration on the key {self._key} does not move forward: {last!r} after "
+                             f"{self._last!r}, values of the key should be unique and keep their type in a query")
+        self._last = last
+        self._started = True
+        self._finished = len(records) < self._limit
+        return result
+
+    def _value(self, record: Any) -> Any:
+        value = record
+        for part in self._key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                raise ValueError(f"Records should contain the key {self._key} for keyset iteration, got {record}")
+            value = value[part]
+        return value
+
+
+def _moved(last: Any, previous: Any) -> bool:
+    """
+    Checks that the last key of a page is after the previous one, only numbers are compared by order, because the
+    server sorts record ids and strings in its own way
+    """
+    if last == previous:
+        return False
+    numbers = (int, float)
+    if isinstance(last, numbers) and isinstance(previous, numbers) and not isinstance(last, bool):
+        return last > previous
+    return True
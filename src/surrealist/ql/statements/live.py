@@ -1,6 +1,7 @@
 from typing import Callable, List, Optional
 
 from surrealist.connections import Connection
+from surrealist.connections.lanes import use_lane
 from surrealist.ql.statements.live_statements import LiveUseWhere
 from surrealist.ql.statements.statement import Statement
 from surrealist.result import SurrealResult
@@ -80,8 +81,10 @@ class Live(Statement, LiveUseWhere):
             return ["Using DIFF with alias parameter"]
         return [OK]
 
-    def run(self) -> SurrealResult:
-        return self._drill(self.to_str())
+    def run(self, parameterized: bool = False, lane: Optional[str] = None) -> SurrealResult:
+        # LIVE query is sent without variables, so it is always rendered inline
+        with use_lane(self._connection, lane):
+            return self._drill(self.to_str())
 
     def _drill(self, query):
         return self._connection.custom_live(query, self._callback)
@@ -1,3 +1,6 @@
+from typing import Optional
+
+from surrealist.connections.lanes import use_lane
 from surrealist.ql.statements.statement import FinishedStatement, Statement
 from surrealist.result import SurrealResult
 
@@ -16,8 +19,10 @@ class Fetch(FinishedStatement):
         what = ", ".join(self._args)
         return f"{self._statement._clean_str()} FETCH {what}"
 
-    def run(self) -> SurrealResult:
-        return self._statement._drill(self.to_str())
+    def run(self, parameterized: bool = False, lane: Optional[str] = None) -> SurrealResult:
+        # LIVE query is sent without variables, so it is always rendered inline
+        with use_lane(self._connection, lane):
+            return self._statement._drill(self.to_str())
 
 
 class LiveUseFetch:
@@ -43,8 +48,10 @@ class Where(FinishedStatement, LiveUseFetch):
         super().__init__(statement)
         self._predicate = predicate
 
-    def run(self) -> SurrealResult:
-        return self._statement._drill(self.to_str())
+    def run(self, parameterized: bool = False, lane: Optional[str] = None) -> SurrealResult:
+        # LIVE query is sent without variables, so it is always rendered inline
+        with use_lane(self._connection, lane):
+            return self._statement._drill(self.to_str())
 
     def _drill(self, query) -> SurrealResult:
         return self._statement._drill(query)
@@ -0,0 +1,88 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from surrealist.connections import Connection
+from surrealist.errors import WrongParameterError
+from surrealist.result import SurrealResult
+
+_VARIABLE = re.compile(r"\$(\w+)")
+
+
+class PreparedStatement:
+    """
+    Statement, which is rendered once: text of the query is cached, only variables change from run to run.
+    Use Statement.prepare to create it, variables are values of the statement ($__p1, $__p2, ...) and your own
+    variables in raw parts of the query (like "age > $age").
+
+    Values of variables are sent as JSON, to use a record id in a variable, use type::thing in the query, for example:
+    where("author = type::thing('user', $user)")
+
+    Example:
+    prepared = db.person.select("name").where("age > $age").prepare()
+    for age in (18, 30, 60):
+        print(prepared.run(age=age).result)
+    """
+
+    def __init__(self, connection: Connection, query: str, variables: Optional[Dict] = None):
+        """
+        :param connection: connection to run the query on
+        :param query: full text of the query
+        :param variables: default values of variables
+        """
+        self._connection = connection
+        self._query = query
+        self._variables = variables or {}
+        self._names = frozenset(_VARIABLE.findall(query))
+
+    @property
+    def query(self) -> str:
+        """
+        Returns the text of the query
+        """
+        return self._query
+
+    @property
+    def variables(self) -> Dict:
+        """
+        Returns default values of variables (a copy)
+        """
+        return dict(self._variables)
+
+    def bind(self, **params: Any) -> Dict:
+        """
+        Returns variables for the run: default ones updated with params
+
+        :param params: values of variables by their names (without $)
+        :return: dict of variables
+        :raise WrongParameterError: if the query does not use some of the params
+        """
+        unknown = params.keys() - self._names
+        if unknown:
+            raise WrongParameterError(f"Query does not use variables {sorted(unknown)}, it uses {sorted(self._names)}")
+        return {**self._variables, **params}
+
+    def run(self, **params: Any) -> SurrealResult:
+        """
+        Runs the query with variables
+
+        :param params: values of variables by their names (without $), other variables keep default values
+        :return: result of the request
+        :raise WrongParameterError: if the query does not use some of the params
+        """
+        return self._connection.query(self._query, self.bind(**params))
+
+    def run_many(self, params: Iterable[Dict]) -> List[SurrealResult]:
+        """
+        Runs the query for each dict of variables, one by one
+
+        :param params: dicts with values of variables
+        :return: list of results in the same order
+        :raise WrongParameterError: if the query does not use some of the params
+        """
+        return [self.run(**values) for values in params]
+
+    def __str__(self):
+        return self._query
+
+    def __repr__(self):
+        return f"PreparedStatement(query={self._query!r}, variables={self._variables!r})"
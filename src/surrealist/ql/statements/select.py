@@ -3,6 +3,7 @@ from typing import List, Optional, Tuple, Union
 from surrealist.connections import Connection
 from surrealist.utils import OK, StrOrRecord, get_table_or_record_id
 
+from .keyset import SOURCE
 from .select_statements import SelectUseIndex, SelectUseTempfiles
 from .statement import IterableStatement, Statement
 
@@ -40,6 +41,7 @@ class Select(IterableStatement, SelectUseIndex, SelectUseTempfiles):
     [TEMPFILES]
     [ EXPLAIN [ FULL ]];
     """
+    _keyset_role = SOURCE
 
     def __init__(self, connection: Connection, table_name: Union[str, Statement], *args,
                  alias: Optional[List[Tuple[str, Union[str, Statement]]]] = None,
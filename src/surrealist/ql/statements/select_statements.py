@@ -1,5 +1,6 @@
 from typing import Tuple
 
+from surrealist.ql.statements.keyset import FILTER, SOURCE, TAIL
 from surrealist.ql.statements.statement import (FinishedStatement,
                                                 IterableStatement, Statement)
 from surrealist.utils import OK
@@ -30,6 +31,7 @@ class Tempfiles(IterableStatement, SelectUseExplain):
     """
     Represent a TEMPFILES clause in CREATE statement.
     """
+    _keyset_role = TAIL
 
     def _clean_str(self):
         return f"{self._statement._clean_str()} TEMPFILES"
@@ -53,6 +55,7 @@ class Parallel(IterableStatement):
     """
     Represent a PARALLEL clause in CREATE statement.
     """
+    _keyset_role = TAIL
 
     def _clean_str(self):
         return f"{self._statement._clean_str()} PARALLEL"
@@ -67,6 +70,7 @@ class Timeout(IterableStatement, SelectUseParallel):
     """
     Represent a TIMEOUT clause in CREATE statement.
     """
+    _keyset_role = TAIL
 
     def __init__(self, statement: Statement, duration: str):
         super().__init__(statement)
@@ -92,6 +96,7 @@ class Fetch(IterableStatement, SelectUseTimeout):
     """
     Represent a FETCH clause in CREATE statement.
     """
+    _keyset_role = TAIL
 
     def __init__(self, statement: Statement, *args: str):
         super().__init__(statement)
@@ -251,6 +256,7 @@ class SelectUseSplit(SelectUseGroup):
 
 
 class Or(IterableStatement, SelectUseSplit):
+    _keyset_role = FILTER
     def __init__(self, statement: Statement, predicate: str):
         super().__init__(statement)
         self._statement = statement
@@ -267,6 +273,7 @@ class Or(IterableStatement, SelectUseSplit):
 
 
 class And(IterableStatement, SelectUseSplit):
+    _keyset_role = FILTER
     def __init__(self, statement: Statement, predicate: str):
         super().__init__(statement)
         self._statement = statement
@@ -286,6 +293,7 @@ class Where(IterableStatement, SelectUseSplit):
     """
     Represent a WHERE clause in CREATE statement.
     """
+    _keyset_role = FILTER
 
     def __init__(self, statement: Statement, predicate: str):
         super().__init__(statement)
@@ -311,6 +319,7 @@ class WithIndex(IterableStatement, SelectUseWhere):
     """
     Represent WITH INDEX clause in CREATE statement.
     """
+    _keyset_role = SOURCE
 
     def __init__(self, statement: Statement, *index_names: str):
         super().__init__(statement)
@@ -328,6 +337,7 @@ class WithNoIndex(IterableStatement, SelectUseWhere):
     """
     Represent WITH NO INDEX clause in CREATE statement.
     """
+    _keyset_role = SOURCE
 
     def __init__(self, statement: Statement):
         super().__init__(statement)
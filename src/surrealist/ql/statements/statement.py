@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Iterator, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from surrealist import columns
 from surrealist.connections import Connection
+from surrealist.connections.lanes import current_lane, use_lane
+from surrealist.errors import WrongCallError
+from surrealist.ql.statements.keyset import FILTER, SOURCE, TAIL, KeysetIterator
+from surrealist.ql.statements.prepared import PreparedStatement
+from surrealist.ql.statements.stream import stream_records
+from surrealist.ql.statements.utils import parameters
 from surrealist.result import SurrealResult
 from surrealist.utils import OK
 
@@ -10,6 +17,7 @@ class Statement(ABC):
     """
     Parent for all statements(QL statements)
     """
+    _keyset_role: Optional[str] = None  # place of the clause in keyset iteration (see IterableStatement.iter)
 
     def __init__(self, connection: Connection):
         self._connection = connection
@@ -52,12 +60,61 @@ class Statement(ABC):
         :return: result of the query
         """
 
-    def run(self) -> SurrealResult:
+    def compile(self) -> Tuple[str, Dict]:
+        """
+        Returns the whole query, where values (of CONTENT, MERGE, PATCH, SET, INSERT) are replaced with variables
+        ($__p1, $__p2, ...), and dict of these variables. Queries of the same shape have the same text. Names start
+        with __p, so they do not collide with your own variables (like $p1), do not use such names in raw parts.
+        Values with RecordId or datetime inside stay in the query as is
+
+        Example:
+        query, variables = db.person.create().content({"name": "John"}).compile()
+        # query == "CREATE person CONTENT $__p1;", variables == {"__p1": {"name": "John"}}
+
+        :return: pair of query text and variables
+        """
+        with parameters() as variables:
+            query = self.to_str()
+        return query, variables
+
+    def prepare(self, parameterized: bool = True) -> PreparedStatement:
+        """
+        Renders the query once and returns an object to run it many times with different variables, see
+        PreparedStatement
+
+        Example:
+        prepared = db.person.select().where("age > $age").prepare()
+        results = prepared.run_many([{"age": 18}, {"age": 30}])
+
+        :param parameterized: if True, values of the statement are variables too (see compile)
+        :return: PreparedStatement object
+        """
+        query, variables = self.compile() if parameterized else (self.to_str(), {})
+        return PreparedStatement(self._connection, query, variables)
+
+    def run(self, parameterized: bool = False, lane: Optional[str] = None) -> SurrealResult:
         """
         Runs the whole query and returns result from SurrealDB
+        :param parameterized: if True, values are sent as variables of the query (see compile)
+        :param lane: optional lane of the pool for the request (see Pool.lane)
         :return: result of the request
+        :raise WrongParameterError: if the lane is specified, but the connection is not a pool with such lane
+        """
+        with use_lane(self._connection, lane):
+            if parameterized:
+                return self._connection.query(*self.compile())
+            return self._connection.query(self.to_str())
+
+    def run_as(self, model: type, parameterized: bool = False, lane: Optional[str] = None) -> Any:
         """
-        return self._connection.query(self.to_str())
+        Runs the whole query and converts records of the result to objects of the model, see SurrealResult.as_type
+        :param model: class of the model (dataclass, attrs class, class with __slots__ or annotations)
+        :param parameterized: if True, values are sent as variables of the query (see compile)
+        :param lane: optional lane of the pool for the request (see Pool.lane)
+        :return: list of objects, one object or None
+        :raise ValueError: if result is an error or a required field is missing
+        """
+        return self.run(parameterized, lane).as_type(model)
 
     def __str__(self):
         return self.to_str()
@@ -88,7 +145,8 @@ class IterableStatement(FinishedStatement):
     Under the hood transform query to SELECT * FROM (initial_query) LIMIT {limit} START AT {current};
     """
 
-    def iter(self, limit: int = 100) -> Iterator:
+    def iter(self, limit: int = 100, key: Optional[str] = None, cursor: Optional[str] = None,
+             lane: Optional[str] = None) -> Iterator:
         """
         Creates and returns a generator object to iterate on big query results
 
@@ -96,17 +154,109 @@ class IterableStatement(FinishedStatement):
 
         Example: https://github.com/kotolex/surrealist/tree/master/examples/surreal_ql/iterator.py
 
+        With key it uses keyset pagination: WHERE key > last ORDER BY key LIMIT limit, it takes linear time on big
+        tables and can continue from a cursor (see KeysetIterator), key should be unique and selected
+
         :param limit: number of records in each iteration, it cannot be smaller than one
+        :param key: optional unique sort key for keyset pagination, like "id"
+        :param cursor: optional token of KeysetIterator.cursor to continue iteration after it, only with key
+        :param lane: optional lane of the pool for all pages, the current lane of the thread is used by default,
+        even if pages are requested from another thread
         :return: generator to use in for-statements or with the next method
-        :raise ValueError: if limit less than one
+        :raise ValueError: if limit less than one or cursor is wrong
+        :raise WrongCallError: if statement has clauses, which cannot be used with keyset pagination
         """
         if limit < 1:
             raise ValueError("The limit cannot be smaller than 1")
+        lane = lane or current_lane(self._connection)
+        if key is not None:
+            prefix, condition, tail = self._keyset_parts()
+            return KeysetIterator(self._query_in_lane(lane), prefix, condition, tail, key, limit, cursor)
+        if cursor is not None:
+            raise ValueError("Cursor can be used only with a key")
+        return self._iter_pages(limit, self._query_in_lane(lane))
+
+    def _query_in_lane(self, lane: Optional[str]) -> Callable[[str], SurrealResult]:
+        if lane is None:
+            return self._connection.query
+
+        def query(text: str) -> SurrealResult:
+            with use_lane(self._connection, lane):
+                return self._connection.query(text)
+
+        return query
+
+    def _iter_pages(self, limit: int, run: Callable[[str], SurrealResult]) -> Iterator:
         current = 0
         while True:
             query = f"SELECT * FROM ({self._clean_str()}) LIMIT {limit} START AT {current};"
-            res = self._connection.query(query)
+            res = run(query)
             yield res
             if res.count() < limit:
                 break
             current += limit
+
+    def stream(self, page_size: int = 100, prefetch: int = 2, key: Optional[str] = None,
+               lane: Optional[str] = None) -> Iterator:
+        """
+        Creates and returns a generator of records (not pages) of big query results. A background thread fetches up
+        to prefetch pages ahead while you process records, so at most (prefetch + 2) pages are in memory at once
+
+        Example:
+        for record in db.table("user").select().stream(page_size=1000, prefetch=2, key="id"):
+            process(record)
+
+        :param page_size: number of records in each request, it cannot be smaller than one
+        :param prefetch: number of pages to fetch ahead, it cannot be smaller than one
+        :param key: optional unique sort key for keyset pagination (see iter)
+        :param lane: optional lane of the pool for all pages, the current lane of the thread is used by default
+        :return: generator of records
+        :raise ValueError: if page_size or prefetch is less than one, or a page is an error
+        """
+        if prefetch < 1:
+            raise ValueError("The prefetch cannot be smaller than 1")
+        return stream_records(self.iter(page_size, key, lane=lane), prefetch)
+
+    def _keyset_parts(self) -> Tuple[str, Optional[str], str]:
+        """
+        Splits the query to the source (SELECT ... FROM ... WITH INDEX), condition of WHERE and the tail (FETCH,
+        TIMEOUT, PARALLEL, TEMPFILES)
+        """
+        full = self._clean_str()
+        node = self
+        while node._keyset_role == TAIL:
+            node = node._statement
+        source = node._clean_str()
+        has_filter = node._keyset_role == FILTER
+        while node._keyset_role == FILTER:
+            node = node._statement
+        if node._keyset_role != SOURCE:
+            raise WrongCallError(f"Keyset iteration cannot be used with {node.__class__.__name__}, use WHERE only")
+        prefix = node._clean_str()
+        condition = source[len(prefix) + len(" WHERE "):] if has_filter else None
+        return prefix, condition, full[len(source):]
+
+    def iter_columns(self, limit: int = 100, fields: Optional[Sequence[str]] = None,
+                     schema: Optional[Dict[str, str]] = None, fill: Optional[Any] = None,
+                     key: Optional[str] = None, lane: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Creates and returns a generator object to iterate on big query results page by page, each page converted to
+        columns (see SurrealResult.to_columns). Schema is inferred on the first page and used for all next pages,
+        a column of a next page, which does not fit it, is widened from int to float or stays a list
+
+        :param limit: number of records in each iteration, it cannot be smaller than one
+        :param fields: projection, list of fields to use, all fields are used by default
+        :param schema: types of the fields ("int", "float", "bool", "str", "object"), inferred if not specified
+        :param fill: value for nulls and missing fields
+        :param key: optional unique sort key for keyset pagination (see iter)
+        :param lane: optional lane of the pool for all pages (see iter)
+        :return: generator of dicts with columns
+        :raise ValueError: if limit less than one or result is an error
+        """
+        for result in self.iter(limit, key, lane=lane):
+            records = result.records()
+            if not records:
+                break
+            if schema is None:
+                schema = columns.infer_schema(records, fields)
+            yield columns.to_columns(records, fields or list(schema), schema, fill)
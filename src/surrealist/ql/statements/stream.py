@@ -0,0 +1,81 @@
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Any, Iterator
+
+from surrealist.result import SurrealResult
+
+END = object()  # marks the end of pages of one producer in the queue
+_WAIT = 0.1  # seconds to wait for the queue before checking the stop flag
+
+
+def stream_records(pages: Iterator[SurrealResult], prefetch: int) -> Iterator[Any]:
+    """
+    Yields records of pages one by one, while a background thread fetches next pages into a bounded queue, so network
+    and processing overlap. Errors of the fetching thread are raised in the consumer. If the consumer stops early
+    (break or close of the generator), the thread stops after the current request
+
+    :param pages: iterator on results (see IterableStatement.iter)
+    :param prefetch: maximum number of pages waiting in the queue
+    :return: generator of records
+    """
+    queue = Queue(maxsize=prefetch)
+    stop = Event()
+
+    def fetch():
+        try:
+            for page in pages:
+                if not offer(queue, page.records(), stop):
+                    return
+            offer(queue, END, stop)
+        except Exception as e:  # any error of fetching goes to the consumer
+            offer(queue, e, stop)
+
+    Thread(target=fetch, name="surrealist-stream", daemon=True).start()
+    return drain(queue, 1, stop)
+
+
+def offer(queue: Queue, item: Any, stop: Event) -> bool:
+    """
+    Puts the item (a list of records, END or an exception) to the queue of pages, waits for a free place until the
+    consumer sets the stop flag
+
+    :param queue: bounded queue of pages
+    :param item: item to put
+    :param stop: flag of the consumer
+    :return: True if the item is put, False if the consumer stopped
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_WAIT)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def drain(queue: Queue, producers: int, stop: Event) -> Iterator[Any]:
+    """
+    Yields records of pages from the queue until each producer puts END, exceptions from the queue are raised. When
+    the generator is finished or closed, it sets the stop flag and frees the queue, so producers are not blocked
+
+    :param queue: bounded queue of pages (see offer)
+    :param producers: number of threads, which put pages
+    :param stop: flag for producers to stop
+    :return: generator of records
+    """
+    try:
+        while producers:
+            item = queue.get()
+            if item is END:
+                producers -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+    finally:
+        stop.set()
+        try:
+            while True:
+                queue.get_nowait()  # free places, so the producers are not blocked
+        except Empty:
+            pass
@@ -1,6 +1,10 @@
-from typing import Dict, Optional
+from contextlib import contextmanager
+from threading import local
+from typing import Any, Dict, Iterator, Optional
 
-from surrealist.utils import safe_dumps
+from surrealist.utils import is_plain, safe_dumps
+
+_local = local()
 
 
 def combine(result: Optional[str], kwargs: Dict) -> str:
@@ -13,6 +17,46 @@ def combine(result: Optional[str], kwargs: Dict) -> str:
     :return: string combined
     """
     first = result if result else ''
-    second = ", ".join(f"{k} = {safe_dumps(v)}" for k, v in kwargs.items()) if kwargs else ''
+    second = ", ".join(f"{k} = {render(v)}" for k, v in kwargs.items()) if kwargs else ''
     args = ', '.join(element for element in (first, second) if element)
     return args
+
+
+@contextmanager
+def parameters() -> Iterator[Dict]:
+    """
+    Context manager for compiling statements with variables: while it is active, render puts values to the dict and
+    returns names of variables ($__p1, $__p2, ...) instead of values
+
+    :return: dict of variables, filled on rendering
+    """
+    previous = getattr(_local, "variables", None)
+    variables = _local.variables = {}
+    try:
+        yield variables
+    finally:
+        _local.variables = previous
+
+
+def render(value: Any) -> str:
+    """
+    Renders a value for a query: inline (see safe_dumps) or as a variable, if statement is compiled (see parameters).
+    Values with RecordId or datetime inside are always inline, because variables are sent as JSON
+
+    :param value: value to render
+    :return: string for a query
+    """
+    variables = getattr(_local, "variables", None)
+    if variables is None:
+        return safe_dumps(value)
+    if value.__class__ is tuple and all(is_plain(e) for e in value):
+        return f"({', '.join(_bind(variables, e) for e in value)})"
+    if is_plain(value):
+        return _bind(variables, value)
+    return safe_dumps(value)
+
+
+def _bind(variables: Dict, value: Any) -> str:
+    name = f"__p{len(variables) + 1}"
+    variables[name] = value
+    return f"${name}"
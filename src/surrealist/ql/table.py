@@ -1,7 +1,10 @@
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from surrealist.connections import Connection
-from surrealist.errors import WrongCallError
+from surrealist.errors import WrongCallError, WrongParameterError
+from surrealist.ids import IdGenerator
+from surrealist.ql.bulk import AdaptiveBatcher, bulk_insert
+from surrealist.ql.parallel_scan import ParallelScan
 from surrealist.ql.statements.create import Create
 from surrealist.ql.statements.delete import Delete
 from surrealist.ql.statements.insert import Insert
@@ -13,6 +16,7 @@ from surrealist.ql.statements.show import Show
 from surrealist.ql.statements.statement import Statement
 from surrealist.ql.statements.update import Update
 from surrealist.ql.statements.upsert import Upsert
+from surrealist.query_cache import QueryCache
 from surrealist.result import SurrealResult
 from surrealist.utils import StrOrRecord
 
@@ -76,7 +80,32 @@ class Table:
         """
         return Select(self._connection, self.name, *args, alias=alias, value=value)
 
-    def create(self, record_id: Optional[Union[StrOrRecord, int]] = None) -> Create:
+    def parallel_scan(self, partitions: int = 4, key: str = "id", fields: str = "*", page_size: int = 1000,
+                      boundaries: Optional[Sequence[Any]] = None, where: Optional[str] = None,
+                      progress: Optional[Callable[[Dict], None]] = None) -> ParallelScan:
+        """
+        Scans the whole table in partitions by ranges of the key, each partition in its own thread with keyset
+        pagination. Use it with DatabaseConnectionsPool, so partitions are read over different connections
+
+        Example:
+        for record in db.table("user").parallel_scan(partitions=4, page_size=1000):
+            process(record)
+
+        :param partitions: number of partitions (and threads), it cannot be smaller than one
+        :param key: unique sort key, it should be selected
+        :param fields: fields to select
+        :param page_size: number of records in each request, it cannot be smaller than one
+        :param boundaries: optional sorted split points of the key, they are queried from the server if not specified
+        :param where: optional condition for all partitions
+        :param progress: optional function, it gets stats of the scan after each page
+        :return: ParallelScan object, iterate on it for merged records or use run(callback) for pages of partitions
+        :raise ValueError: if partitions or page_size is less than one
+        """
+        return ParallelScan(self._connection, self._name, partitions, key, fields, page_size, boundaries, where,
+                            progress)
+
+    def create(self, record_id: Optional[Union[StrOrRecord, int]] = None,
+               id_generator: Optional[IdGenerator] = None) -> Create:
         """
         Represent CREATE a statement and its abilities as refer here:
         https://docs.surrealdb.com/docs/surrealql/statements/create
@@ -87,10 +116,27 @@ class Table:
         Examples: https://github.com/kotolex/surrealist/blob/master/examples/surreal_ql/ql_create_examples.py
 
         :param record_id: optional, if specified transform to 'table_name:record_id'
+        :param id_generator: optional, function for a new id (for example get_ulid), used if record_id is not specified
         :return: Create object
         """
+        if record_id is None and id_generator is not None:
+            record_id = id_generator()
         return Create(self._connection, self.name, record_id)
 
+    def cached(self, cache: QueryCache) -> "Table":
+        """
+        Returns the same table, which runs queries through the cache: results of SELECT queries are taken from the
+        cache, other queries invalidate cached results of the table
+
+        Example:
+        cache = db.query_cache(ttl=60)
+        db.table("country").cached(cache).select().where("active = true").run()
+
+        :param cache: QueryCache object (see Database.query_cache)
+        :return: Table object
+        """
+        return Table(self._name, cache)
+
     def show_changes(self, since: Optional[str] = None) -> Show:
         """
         Represents SHOW CHANGES statement for the Change Feed
@@ -187,7 +233,7 @@ class Table:
         """
         return self._connection.kill(live_id)
 
-    def insert(self, *args) -> Insert:
+    def insert(self, *args, id_generator: Optional[IdGenerator] = None) -> Insert:
         """
         Represent INSERT INTO statement.
         Arguments here are:
@@ -207,10 +253,46 @@ class Table:
 
         :param args: args for insert, it can be list of records, one record, one statement or 2 or more tuples of names
         and values
+        :param id_generator: optional, function for new ids (for example get_ulid), records without id get a new one
         :return: Insert object
+        :raise WrongParameterError: if id_generator is used without records or names of fields are not a tuple
         """
+        if id_generator is not None:
+            args = _with_ids(args, id_generator)
         return Insert(self._connection, self._name, *args)
 
+    def bulk_insert(self, records: Iterable[Dict], batch_size: Union[int, AdaptiveBatcher] = 1000,
+                    concurrency: int = 4, max_bytes: int = 4 * 1024 * 1024, retries: int = 2,
+                    retry_delay: float = 0.5, ignore: bool = False, on_duplicate: Optional[str] = None,
+                    id_generator: Optional[IdGenerator] = None,
+                    on_error: Optional[Callable[[List[Dict], str], None]] = None, relation: bool = False) -> Dict:
+        """
+        Inserts records from any iterable (a generator, a file reader) in batches, batches are sent by several threads
+        at the same time. Use it with DatabaseConnectionsPool, so batches go over different connections
+
+        Example:
+        stats = db.table("person").bulk_insert(read_rows(), batch_size=1000, concurrency=4, ignore=True)
+        print(stats["records_per_second"], stats["failed_records"])
+
+        :param records: any iterable of dicts, it is read lazily
+        :param batch_size: maximum number of records in a batch, or AdaptiveBatcher to change it by measured latency
+        :param concurrency: number of threads to send batches
+        :param max_bytes: maximum size of a query in bytes
+        :param retries: number of attempts to send a batch again after an error of transport
+        :param retry_delay: delay before the first retry in seconds, it doubles with each next retry
+        :param ignore: use INSERT IGNORE, so existing records are skipped
+        :param on_duplicate: optional action for ON DUPLICATE KEY UPDATE, like "count += 1"
+        :param id_generator: optional, function for new ids (for example get_ulid), records without id get a new one
+        :param on_error: optional function, it gets records and the error of each failed batch
+        :param relation: use INSERT RELATION (like insert_relation), records should have in and out fields
+        :return: dict with numbers of records, batches, failed batches and records, retries, bytes, seconds,
+        records_per_second and first errors
+        :raise ValueError: if batch_size, max_bytes or concurrency is less than one, or retries is negative
+        :raise WrongParameterError: if both ignore and on_duplicate are used
+        """
+        return bulk_insert(self._connection, self._name, records, batch_size, max_bytes, concurrency, retries,
+                           retry_delay, ignore, on_duplicate, id_generator, on_error, relation)
+
     def update(self, record_id: Optional[StrOrRecord] = None) -> Update:
         """
         Represent UPDATE object
@@ -264,3 +346,24 @@ class Table:
     def __call__(self, *args, **kwargs):
         raise WrongCallError(f"Table object is not callable. \n"
                              f"It looks like you misspelled the method name of Database({self._name})")
+
+
+def _with_ids(args: Tuple, id_generator: IdGenerator) -> Tuple:
+    """
+    Adds generated ids to records without id, records of the user are not changed
+    """
+    if not args:
+        raise WrongParameterError("Insert with id_generator expects records or names and values")
+    if len(args) > 1:
+        names, *values = args
+        if not isinstance(names, (tuple, list)):
+            raise WrongParameterError(f"Names of fields should be a tuple, like ('name', 'age'), got {names!r}")
+        if "id" in names:
+            return args
+        return (("id", *names), *((id_generator(), *row) for row in values))
+    value = args[0]
+    if isinstance(value, Dict):
+        return (value if "id" in value else {"id": id_generator(), **value},)
+    if isinstance(value, List):
+        return ([{"id": id_generator(), **e} if isinstance(e, Dict) and "id" not in e else e for e in value],)
+    return args
@@ -0,0 +1,237 @@
+import json
+import re
+import time
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+from typing import Any, Dict, Optional, Set, Tuple
+
+from surrealist.connections import Connection
+from surrealist.connections.single_flight import is_read, normalize
+from surrealist.errors import CompatibilityError
+from surrealist.result import SurrealResult
+
+logger = getLogger("surrealist.query_cache")
+_FROM = re.compile(r"\bFROM\s+(?:ONLY\s+)?([A-Za-z_]\w*(?::\w+)?(?:\s*,\s*[A-Za-z_]\w*(?::\w+)?)*)", re.IGNORECASE)
+# subqueries, graph traversals, FETCH, dotted paths (a record link can be dereferenced: author.name) and impure calls
+_NOT_CACHED = re.compile(r"->|<-|\bFETCH\b|"
+                         r"[(\[]\s*(?:SELECT|CREATE|UPDATE|UPSERT|DELETE|INSERT|RELATE|RETURN|LET|IF)\b|"
+                         r"[\w\]]\.[A-Za-z_*]|\brand::|\btime::now\b|\barray::shuffle\b", re.IGNORECASE)
+# sources after the table names: function calls (type::table($tb)), parameters, subqueries and lists
+_OTHER_SOURCE = re.compile(r"\s*(?:,|::|\(|\[|\$)")
+_SELECT = re.compile(r"\bSELECT\b", re.IGNORECASE)
+_CALL = re.compile(r"([A-Za-z_][\w:]*)\s*\(")
+# words before parentheses, which are not calls of functions
+_KEYWORDS = {"SELECT", "VALUE", "FROM", "WHERE", "AND", "OR", "NOT", "IN", "IS", "AS", "BY", "THEN", "ELSE", "LIMIT",
+             "START", "AT", "CONTAINS", "CONTAINSNOT", "CONTAINSALL", "CONTAINSANY", "CONTAINSNONE", "INSIDE",
+             "NOTINSIDE", "ALLINSIDE", "ANYINSIDE", "NONEINSIDE", "OUTSIDE", "INTERSECTS"}
+PURE_NAMESPACES = ("math::", "string::", "array::", "object::", "type::", "duration::", "geo::", "vector::")
+_WORDS = re.compile(r"[A-Za-z_]\w*")
+
+
+def read_tables(query: str) -> Optional[Set[str]]:
+    """
+    Returns tables, which the normalized SELECT query reads, or None if the query cannot be cached: subqueries, graph
+    traversals, FETCH, dotted paths (a record link like author.name reads another table, so nested fields are not
+    cached too), calls of functions other than count() and functions of PURE_NAMESPACES, and sources other than
+    tables or records (function calls like type::table($tb), parameters, subqueries)
+
+    :param query: normalized text of the query
+    :return: set of table names or None
+    """
+    if not query.upper().startswith("SELECT ") or _NOT_CACHED.search(query) or len(_SELECT.findall(query)) > 1:
+        return None
+    if not all(_is_pure(name) for name in _CALL.findall(query)):
+        return None
+    found = _FROM.search(query)
+    if not found or _OTHER_SOURCE.match(query, found.end()):
+        return None
+    return {target.strip().split(":")[0] for target in found.group(1).split(",")}
+
+
+def _is_pure(name: str) -> bool:
+    if name.upper() in _KEYWORDS:
+        return True
+    name = name.lower()
+    return name == "count" or name.startswith(PURE_NAMESPACES)
+
+
+class QueryCache:
+    """
+    Client-side cache of results of SELECT queries with LRU eviction (by number of entries and by size), TTL and
+    invalidation by live queries: for each cached table a LIVE SELECT is started, any change of the table removes its
+    entries, so cached reads stay fresh without polling. If live queries are not available (http transport), entries
+    live until TTL. Other queries through the cache go to the connection and remove entries of tables they mention.
+
+    Cached SurrealResult objects are shared, do not change them.
+
+    Example:
+    cache = db.query_cache(max_entries=1000, ttl=60)
+    users = db.table("user").cached(cache)
+    users.select().where("active = true").run()  # from the database
+    users.select().where("active = true").run()  # from the cache
+    """
+
+    def __init__(self, connection: Connection, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: Optional[float] = 60.0, use_live: bool = True):
+        """
+        :param connection: connection or pool to run queries
+        :param max_entries: maximum number of cached results
+        :param max_bytes: maximum size of cached results (as JSON) in bytes
+        :param ttl: seconds to keep a result, None means until eviction or invalidation
+        :param use_live: invalidate entries of a table by a live query on it
+        :raise ValueError: if limits are less than one
+        """
+        if max_entries < 1 or max_bytes < 1 or (ttl is not None and ttl <= 0):
+            raise ValueError("Limits should satisfy max_entries >= 1, max_bytes >= 1 and ttl > 0")
+        self._connection = connection
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._use_live = use_live
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[SurrealResult, Set[str], float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._generations: Dict[str, int] = {}  # number of changes of each cached table
+        self._live: Dict[str, Optional[str]] = {}  # table -> id of its live query (None if it is not available)
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0, "uncached": 0}
+
+    def query(self, query: str, variables: Optional[Dict] = None) -> SurrealResult:
+        """
+        Returns the result of the query from the cache, or runs it and caches the result
+
+        :param query: any SurrealQL query
+        :param variables: a set of variables used by the query
+        :return: result of request
+        """
+        text = normalize(query)
+        tables = read_tables(text) if is_read(text) else None
+        if tables is None:
+            return self._pass(query, variables, text)
+        try:
+            key = text if not variables else f"{text}\n{json.dumps(variables, sort_keys=True)}"
+        except (TypeError, ValueError):
+            return self._pass(query, variables, text)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+            if entry is not None:
+                self._remove(key)
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            generations = {table: self._generations.setdefault(table, 0) for table in tables}
+        for table in tables:
+            self._watch(table)
+        result = self._connection.query(query, variables) if variables is not None else self._connection.query(query)
+        if not result.is_error():
+            self._store(key, result, tables, generations)
+        return result
+
+    def invalidate(self, table: Optional[str] = None):
+        """
+        Removes cached results of the table (or all results)
+
+        :param table: name of the table, None for all tables
+        """
+        with self._lock:
+            if table is None:
+                self._stats["invalidations"] += len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                for name in self._generations:
+                    self._generations[name] += 1
+                return
+            self._generations[table] = self._generations.get(table, 0) + 1
+            keys = [key for key, entry in self._entries.items() if table in entry[1]]
+            for key in keys:
+                self._remove(key)
+            self._stats["invalidations"] += len(keys)
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the cache
+
+        :return: dict with numbers of hits, misses, evictions, expirations, invalidations, uncached queries, entries,
+        bytes and tables with live queries
+        """
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes,
+                    "live_tables": sorted(table for table, live_id in self._live.items() if live_id)}
+
+    def close(self):
+        """
+        Kills live queries and clears the cache
+        """
+        with self._lock:
+            live, self._live = self._live, {}
+        for live_id in live.values():
+            if live_id:
+                try:
+                    self._connection.kill(live_id)
+                except Exception as e:  # the connection can be closed already
+                    logger.warning("Cannot kill live query %s of the cache: %s", live_id, e)
+        self.invalidate()
+
+    def __getattr__(self, item) -> Any:
+        # all other methods (and transport) go to the connection, so the cache can be used instead of it
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(self._connection, item)
+
+    def _pass(self, query: str, variables: Optional[Dict], text: str) -> SurrealResult:
+        with self._lock:
+            self._stats["uncached"] += 1
+        result = self._connection.query(query, variables) if variables is not None else self._connection.query(query)
+        if not is_read(text):
+            # after the write, so a read in flight with old data is not stored too
+            with self._lock:
+                mentioned = set(_WORDS.findall(text)) & set(self._generations)
+            for table in mentioned:
+                self.invalidate(table)
+        return result
+
+    def _watch(self, table: str):
+        with self._lock:
+            if not self._use_live or table in self._live:
+                return
+            self._live[table] = None
+        try:
+            result = self._connection.custom_live(f"LIVE SELECT id FROM {table};", lambda _: self.invalidate(table))
+        except CompatibilityError:
+            logger.info("Live queries are not available, cache of %s is invalidated only by TTL", table)
+            return
+        if result.is_error():
+            logger.warning("Cannot start live query for %s, cache of it is invalidated only by TTL: %s", table,
+                           result.result)
+            return
+        with self._lock:
+            self._live[table] = result.result
+
+    def _store(self, key: str, result: SurrealResult, tables: Set[str], generations: Dict[str, int]):
+        size = len(json.dumps(result.result, default=str))
+        if size > self._max_bytes:
+            return
+        expires = time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            if any(self._generations.get(table, 0) != number for table, number in generations.items()):
+                return  # the table was changed while the query was in flight
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (result, tables, expires, size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _remove(self, key: str):
+        """
+        Removes the entry, called under lock
+        """
+        self._bytes -= self._entries.pop(key)[3]
+
+    def __repr__(self):
+        return f"QueryCache(entries={len(self._entries)}, max_entries={self._max_entries}, ttl={self._ttl})"
@@ -1,25 +1,36 @@
+from functools import total_ordering
 from string import ascii_lowercase, digits
-from typing import Optional
+from sys import intern as intern_string
+from typing import Iterable, List, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from surrealist.errors import SurrealRecordIdError
 
 ALPHABET = ascii_lowercase + digits
 
 
+@total_ordering
 class RecordId:
     """
-    This class is a wrapper for record_id of SurrealDB
+    This class is a wrapper for record_id of SurrealDB. RecordId objects are immutable, hashable and can be compared,
+    so they can be used as keys of dicts or in sets. Ids are ordered by table, then by id part, integer ids are
+    compared as numbers (person:9 < person:10) and go before other ids of the table
 
     About record_ids: https://surrealdb.com/docs/surrealql/datamodel/ids
     Refer to: https://github.com/kotolex/surrealist?tab=readme-ov-file#using-recordid
     Examples: https://github.com/kotolex/surrealist/blob/master/examples/record_id.py
     """
+    __slots__ = ("_table_part", "_id_part", "_naive_id", "_valid", "__weakref__")
+    _table_part: str
+    _id_part: str
+    _naive_id: str
+    _valid: Optional[str]  # cached result of to_valid_string
 
     def __init__(self, id_: str, table: Optional[str] = None):
         """
         Wrapper for record_id
         :param id_: full record_id like "table:id" or just "id" part of it. In the latter case, the table should be
-        specified
+        specified. The table part ends at the first colon, so in "time:12:30" the id part is "12:30"
         :param table: name of table, you can omit it if id_ is in full form (table:id)
         :raises: SurrealRecordIdError on invalid id or table
         """
@@ -30,14 +41,99 @@ class RecordId:
         if table and ":" in id_ and table != id_.split(":")[0]:
             table_part = id_.split(":")[0]
             raise SurrealRecordIdError(f"Table name is different from id, we expect {table}, but got {table_part}")
-        id_ = id_.replace("`", "").replace("⟨", "").replace("⟩", "")
-        self._naive_id = id_ if ":" in id_ else f"{table}:{id_}"
-        self._table_part, self._id_part = self._naive_id.split(":")
-        self._uid = f"{self._table_part}:⟨{self._id_part}⟩"
+        _init(self, id_ if ":" in id_ else f"{table}:{id_}")
+
+    @classmethod
+    def parse_many(cls, values: Iterable[str], table: Optional[str] = None, intern: bool = False) -> List["RecordId"]:
+        """
+        Creates RecordId objects for many strings at once, it is much faster than creating them one by one
+
+        Example:
+        RecordId.parse_many(["person:1", "person:2"])
+        RecordId.parse_many(["1", "2"], table="person")
+
+        :param values: strings with record ids, like "table:id", or just "id" if table is specified
+        :param table: name of table for all ids
+        :param intern: if True, the same ids return the same objects, see **intern**
+        :return: list of RecordId objects
+        :raises: SurrealRecordIdError on invalid id or table
+        """
+        if table and ":" in table:
+            raise SurrealRecordIdError("Table name should not contain ':'")
+        prefix = f"{table}:" if table else None
+        result = []
+        append = result.append
+        new = object.__new__
+        for value in values:
+            if prefix is not None:
+                if not value.startswith(prefix):
+                    if ":" in value:
+                        raise SurrealRecordIdError(f"Table name is different from id, we expect {table}, but got "
+                                                   f"{value.split(':')[0]}")
+                    value = f"{prefix}{value}"
+            elif ":" not in value:
+                raise SurrealRecordIdError(f"You need to specify table name or id like 'table:id', got {value}")
+            if intern:
+                record_id = _interned.get(value)
+                if record_id is None:
+                    record_id = new(cls)
+                    _init(record_id, value)
+                    record_id = _interned.setdefault(value, record_id)
+            else:
+                record_id = new(cls)
+                _init(record_id, value)
+            append(record_id)
+        return result
+
+    @classmethod
+    def intern(cls, id_: str, table: Optional[str] = None) -> "RecordId":
+        """
+        Returns the same RecordId object for the same id while it is used anywhere (intern table keeps weak
+        references only), so hot ids do not take memory many times
+
+        :param id_: full record_id like "table:id" or just "id" part of it, if table is specified
+        :param table: name of table
+        :return: RecordId object
+        :raises: SurrealRecordIdError on invalid id or table
+        """
+        key = id_ if table is None or ":" in id_ else f"{table}:{id_}"
+        record_id = _interned.get(key)
+        if record_id is None:
+            record_id = _interned.setdefault(key, cls(id_, table))
+        return record_id
 
     def __repr__(self):
         return f"RecordId('{self._naive_id}')"
 
+    def __eq__(self, other):
+        if other.__class__ is RecordId or isinstance(other, RecordId):
+            return self._naive_id == other._naive_id
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._naive_id)
+
+    def __lt__(self, other):
+        if isinstance(other, RecordId):
+            return self._order_key() < other._order_key()
+        return NotImplemented
+
+    def _order_key(self) -> Tuple[str, int, int, str]:
+        """
+        Key to order ids by table and id part, integer ids are compared as numbers and go before others
+        """
+        id_part = self._id_part
+        number = id_part[1:] if id_part[:1] == "-" else id_part
+        if number.isascii() and number.isdigit():
+            return self._table_part, 0, int(id_part), id_part
+        return self._table_part, 1, 0, id_part
+
+    def __setattr__(self, key, value):
+        raise AttributeError("RecordId is immutable")
+
+    def __reduce__(self):
+        return RecordId, (self._naive_id,)
+
     @property
     def id_part(self) -> str:
         """
@@ -61,10 +157,15 @@ class RecordId:
 
     def to_valid_string(self) -> str:
         """
-        Checks and adds special braces if id is not in simple form(a..zA..Z0-9), otherwise just returns naive_id
+        Checks and adds special braces if id is not in simple form(a..zA..Z0-9), otherwise just returns naive_id.
+        The result is calculated once and cached
         """
-        is_complicated_format = any(e not in ALPHABET for e in self._id_part.lower())
-        return self.to_uid_string() if is_complicated_format else self._naive_id
+        valid = self._valid
+        if valid is None:
+            is_complicated_format = any(e not in ALPHABET for e in self._id_part.lower())
+            valid = self.to_uid_string() if is_complicated_format else self._naive_id
+            _set_valid(self, valid)
+        return valid
 
     def to_prefixed_string(self) -> str:
         """
@@ -76,10 +177,30 @@ class RecordId:
         """
         Return record id with special braces for id like article:⟨c332eb25-e408-4396-814f-83a85d556493⟩
         """
-        return self._uid
+        return f"{self._table_part}:⟨{self._id_part}⟩"
 
     def to_uid_string_with_backticks(self) -> str:
         """
         Return record id with backticks for id like article:`c332eb25-e408-4396-814f-83a85d556493`
         """
-        return self._uid.replace("⟨", "`").replace("⟩", "`")
+        return f"{self._table_part}:`{self._id_part}`"
+
+
+_interned: "WeakValueDictionary[str, RecordId]" = WeakValueDictionary()
+
+
+def _set_valid(record_id: RecordId, valid: Optional[str]):
+    object.__setattr__(record_id, "_valid", valid)  # RecordId forbids setting attributes
+
+
+def _init(record_id: RecordId, naive_id: str):
+    """
+    Sets slots of a new RecordId, the table part is before the first colon, all the rest is the id part
+    """
+    if "`" in naive_id or "⟨" in naive_id:
+        naive_id = naive_id.replace("`", "").replace("⟨", "").replace("⟩", "")
+    table_part, _, id_part = naive_id.partition(":")
+    object.__setattr__(record_id, "_table_part", intern_string(table_part))
+    object.__setattr__(record_id, "_id_part", id_part)
+    object.__setattr__(record_id, "_naive_id", naive_id)
+    _set_valid(record_id, None)
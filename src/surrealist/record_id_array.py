@@ -0,0 +1,281 @@
+import re
+from array import array
+from sys import intern as intern_string
+from typing import Iterable, Iterator, List, Union, overload
+
+from surrealist.errors import SurrealRecordIdError
+from surrealist.record_id import RecordId
+
+_SIMPLE = re.compile(r"[A-Za-z0-9]*")
+IdLike = Union[str, RecordId]
+
+
+class RecordIdArray:
+    """
+    Compact container for many record ids of one table. Table part is stored once, id parts are packed (UTF-8) into
+    one buffer with offsets, so one id takes its length plus 8 bytes instead of a str or RecordId object.
+
+    Supports set operations (|, &, -), sorting, chunked iteration and rendering to SELECT ... FROM [ids] queries.
+    Elements are returned as RecordId objects, use **id_parts** to get strings.
+
+    Example:
+    ids = RecordIdArray.from_ids(result.ids)
+    for query in ids.to_queries(batch_size=1000):
+        connection.query(query)
+    """
+    __slots__ = ("_table", "_data", "_offsets")
+
+    def __init__(self, table: str, ids: Iterable[IdLike] = ()):
+        """
+        :param table: name of the table of all ids
+        :param ids: ids as strings ("table:id" or just "id") or RecordId objects
+        :raise SurrealRecordIdError: if table name is invalid or any id belongs to another table
+        """
+        if not table or ":" in table:
+            raise SurrealRecordIdError(f"Wrong table name: {table}")
+        self._table = intern_string(table)
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+        self.extend(ids)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[IdLike]) -> "RecordIdArray":
+        """
+        Creates an array from full ids, table name is taken from the first id (for example from SurrealResult.ids)
+
+        :param ids: ids as "table:id" strings or RecordId objects
+        :return: new array
+        :raise SurrealRecordIdError: if ids belong to different tables or an id has no table part
+        """
+        iterator = iter(ids)
+        first = next(iterator, None)
+        if first is None:
+            raise SurrealRecordIdError("Cant get table name from an empty sequence, use RecordIdArray(table) instead")
+        table = first.table_part if isinstance(first, RecordId) else first.split(":")[0]
+        if not isinstance(first, RecordId) and ":" not in first:
+            raise SurrealRecordIdError(f"Full id like 'table:id' expected, got {first}")
+        result = cls(table, [first])
+        result.extend(iterator)
+        return result
+
+    @property
+    def table(self) -> str:
+        """
+        Returns the table name of all ids
+        """
+        return self._table
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes used by ids (buffer and offsets)
+        """
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def append(self, id_: IdLike):
+        """
+        Adds an id to the end of the array
+
+        :param id_: id as a string ("table:id" or just "id") or RecordId object
+        :raise SurrealRecordIdError: if id belongs to another table
+        """
+        self.extend((id_,))
+
+    def extend(self, ids: Iterable[IdLike]):
+        """
+        Adds ids to the end of the array
+
+        :param ids: ids as strings ("table:id" or just "id") or RecordId objects
+        :raise SurrealRecordIdError: if any id belongs to another table
+        """
+        data, offsets, table = self._data, self._offsets, self._table
+        prefix = f"{table}:"
+        size = len(prefix)
+        end = offsets[-1]
+        for id_ in ids:
+            if isinstance(id_, RecordId):
+                if id_.table_part != table:
+                    raise SurrealRecordIdError(f"Table name is different from id, we expect {table}, but got "
+                                               f"{id_.table_part}")
+                part = id_.id_part
+            elif id_.startswith(prefix):
+                part = id_[size:]
+            elif ":" in id_:
+                raise SurrealRecordIdError(f"Table name is different from id, we expect {table}, but got "
+                                           f"{id_.split(':')[0]}")
+            else:
+                part = id_
+            if "⟨" in part or "`" in part:
+                part = part.replace("`", "").replace("⟨", "").replace("⟩", "")
+            encoded = part.encode()
+            data += encoded
+            end += len(encoded)
+            offsets.append(end)
+
+    def id_parts(self) -> Iterator[str]:
+        """
+        Iterates on id parts of all ids (without table name)
+
+        :return: iterator of strings
+        """
+        data, offsets = self._data, self._offsets
+        for i in range(len(offsets) - 1):
+            yield data[offsets[i]:offsets[i + 1]].decode()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[RecordId]:
+        prefix = f"{self._table}:"
+        return iter(RecordId.parse_many(f"{prefix}{part}" for part in self.id_parts()))
+
+    @overload
+    def __getitem__(self, index: int) -> RecordId:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordIdArray":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self._new(list(self.id_parts())[index])
+            result = RecordIdArray(self._table)
+            first, last = self._offsets[start], self._offsets[max(start, stop)]
+            result._data = self._data[first:last]
+            result._offsets = array("q", (offset - first for offset in self._offsets[start:max(start, stop) + 1]))
+            return result
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RecordIdArray index out of range")
+        part = self._data[self._offsets[index]:self._offsets[index + 1]].decode()
+        return RecordId.parse_many((f"{self._table}:{part}",))[0]
+
+    def __contains__(self, item: IdLike) -> bool:
+        if isinstance(item, RecordId):
+            if item.table_part != self._table:
+                return False
+            item = item.id_part
+        elif ":" in item:
+            table, _, item = item.partition(":")
+            if table != self._table:
+                return False
+        return item in self.id_parts()
+
+    def __eq__(self, other):
+        if not isinstance(other, RecordIdArray):
+            return NotImplemented
+        return self._table == other._table and self._data == other._data and self._offsets == other._offsets
+
+    def __repr__(self):
+        return f"RecordIdArray(table={self._table}, count={len(self)})"
+
+    def unique(self) -> "RecordIdArray":
+        """
+        Returns a new array without duplicates, order of the first occurrences is kept
+        """
+        return self._new(dict.fromkeys(self.id_parts()))
+
+    def union(self, other: "RecordIdArray") -> "RecordIdArray":
+        """
+        Returns a new array with unique ids from both arrays, ids of this array go first
+
+        :param other: array of the same table
+        :return: new array
+        """
+        self._check(other)
+        return self._new({**dict.fromkeys(self.id_parts()), **dict.fromkeys(other.id_parts())})
+
+    def intersection(self, other: "RecordIdArray") -> "RecordIdArray":
+        """
+        Returns a new array with unique ids, which are in both arrays, in order of this array
+
+        :param other: array of the same table
+        :return: new array
+        """
+        self._check(other)
+        others = set(other.id_parts())
+        return self._new(part for part in dict.fromkeys(self.id_parts()) if part in others)
+
+    def difference(self, other: "RecordIdArray") -> "RecordIdArray":
+        """
+        Returns a new array with unique ids of this array, which are not in other array
+
+        :param other: array of the same table
+        :return: new array
+        """
+        self._check(other)
+        others = set(other.id_parts())
+        return self._new(part for part in dict.fromkeys(self.id_parts()) if part not in others)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def sort(self, reverse: bool = False) -> "RecordIdArray":
+        """
+        Sorts ids in place by their id parts (as strings)
+
+        :param reverse: sort in descending order if True
+        :return: the array itself
+        """
+        sorted_array = self._new(sorted(self.id_parts(), reverse=reverse))
+        self._data, self._offsets = sorted_array._data, sorted_array._offsets
+        return self
+
+    def chunks(self, size: int) -> Iterator["RecordIdArray"]:
+        """
+        Iterates on parts of the array
+
+        :param size: number of ids in each part, the last one can be smaller
+        :return: iterator of arrays
+        :raise ValueError: if size is less than one
+        """
+        if size < 1:
+            raise ValueError("Size of chunk cannot be smaller than 1")
+        for start in range(0, len(self), size):
+            yield self[start:start + size]
+
+    def to_valid_strings(self) -> List[str]:
+        """
+        Returns valid string representations of all ids, like person:tobie or person:⟨a-b⟩ (see RecordId)
+
+        :return: list of strings
+        """
+        table = self._table
+        simple = _SIMPLE.fullmatch
+        return [f"{table}:{part}" if simple(part) else f"{table}:⟨{part}⟩" for part in self.id_parts()]
+
+    def to_queries(self, fields: str = "*", batch_size: int = 1000) -> Iterator[str]:
+        """
+        Renders SELECT queries on the records of the array, batch by batch
+
+        Example:
+        list(RecordIdArray("person", ["1", "2"]).to_queries()) == ["SELECT * FROM [person:1, person:2];"]
+
+        :param fields: fields to select
+        :param batch_size: number of ids in each query
+        :return: iterator of queries
+        :raise ValueError: if batch_size is less than one
+        """
+        for chunk in self.chunks(batch_size):
+            yield f"SELECT {fields} FROM [{', '.join(chunk.to_valid_strings())}];"
+
+    def _new(self, parts: Iterable[str]) -> "RecordIdArray":
+        result = RecordIdArray(self._table)
+        data, offsets = result._data, result._offsets
+        end = 0
+        for part in parts:
+            encoded = part.encode()
+            data += encoded
+            end += len(encoded)
+            offsets.append(end)
+        return result
+
+    def _check(self, other: "RecordIdArray"):
+        if other._table != self._table:
+            raise SurrealRecordIdError(f"Arrays of different tables: {self._table} and {other._table}")
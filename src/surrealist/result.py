@@ -1,9 +1,19 @@
 import json
-from typing import Any, Dict, List, Optional, Union
+import re
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+from surrealist import columns, typed
+from surrealist.converters import ResultConverter
 from surrealist.errors import ResultHasNoValuesError, TooManyNestedLevelsError
 from surrealist.utils import ERR, HTTP_OK, OK
 
+_RPC_HEAD = re.compile(r'\{"id":("(?:[^"\\]|\\.)*"|-?\d+|null),"result":')
+_STATEMENT_HEAD = '[{"result":'
+_STATEMENT_TAIL = re.compile(r',"status":"OK","time":"((?:[^"\\]|\\.)*)"\}\]$')
+# ids with escaped symbols are not matched, so results with such ids are decoded instead
+_ID = re.compile(r'"id":"([^"\\]*)"')
+_EMPTY = ("[]", "{}", '""', "null")
+
 
 class SurrealResult:
     """
@@ -12,6 +22,7 @@ class SurrealResult:
 
     Examples: https://github.com/kotolex/surrealist/blob/master/examples/result.py
     """
+    __slots__ = ("ws_id", "result", "code", "query", "status", "time", "additional_info")
 
     def __init__(self, **kwargs):
         """
@@ -40,11 +51,55 @@ class SurrealResult:
         if self.code and self.code != HTTP_OK:
             self.status = ERR
         self.additional_info: Dict = kwargs
-        if self.status == ERR and isinstance(self.result, dict) and "code" in self.result and "message" in self.result:
-            self.code = self.result["code"]
-            self.result = self.result["message"]
-        if self.result and isinstance(self.result, str) and "There was a problem with the database:" in self.result:
-            self.result = self.result.split(":", 1)[1].strip()
+        self._normalize_error()
+
+    @classmethod
+    def from_response(cls, content: Dict) -> "SurrealResult":
+        """
+        Fast constructor for the dict response of SurrealDB. Common shapes of responses (statement result, rpc result
+        and rpc error) are assigned directly, without copying the dict as keyword arguments, all other shapes go
+        through the common constructor
+
+        :param content: one response or one statement result of SurrealDB
+        :return: Result object
+        """
+        size = len(content)
+        code = None
+        if size == 3 and "status" in content and "time" in content and "result" in content:
+            ws_id, result, status, time = None, content["result"], content["status"], content["time"]
+        elif size == 2 and "id" in content:
+            ws_id, time = content["id"], None
+            if "result" in content:
+                result, status = content["result"], OK
+            elif "error" in content:
+                result, status = content["error"], ERR
+                if result.__class__ is dict and "code" in result and "message" in result:
+                    code, result = result["code"], result["message"]
+            else:
+                return cls(**content)
+        else:
+            return cls(**content)
+        if result.__class__ is str and "There was a problem with the database:" in result:
+            result = result.split(":", 1)[1].strip()
+        res = object.__new__(cls)
+        res.ws_id = ws_id
+        res.result = result
+        res.code = code
+        res.query = None
+        res.status = status
+        res.time = time
+        res.additional_info = {}
+        if status == ERR and code is None:
+            res._normalize_error()
+        return res
+
+    def _normalize_error(self):
+        result = self.result
+        if self.status == ERR and isinstance(result, dict) and "code" in result and "message" in result:
+            self.code = result["code"]
+            self.result = result = result["message"]
+        if result and isinstance(result, str) and "There was a problem with the database:" in result:
+            self.result = result.split(":", 1)[1].strip()
 
     def count(self) -> int:
         """
@@ -163,6 +218,102 @@ class SurrealResult:
         """
         return self.status != OK
 
+    def to_columns(self, fields: Optional[Sequence[str]] = None, schema: Optional[Dict[str, str]] = None,
+                   fill: Optional[Any] = None) -> Dict[str, Sequence]:
+        """
+        Converts records of the result to columns: a dict with field names as keys and typed arrays (array.array for
+        int, float and bool fields, lists for others) as values
+
+        Example:
+        SurrealResult(result=[{"a": 1}, {"a": 2}]).to_columns() == {"a": array('q', [1, 2])}
+
+        :param fields: projection, list of fields to use (nested fields like "address.city" are allowed), all fields
+        are used by default
+        :param schema: types of the fields ("int", "float", "bool", "str", "object"), inferred if not specified
+        :param fill: value for nulls and missing fields, if None: float columns get NaN, int and bool columns with
+        nulls stay lists
+        :return: dict of columns
+        :raise ValueError: if result is an error or does not contain records
+        """
+        return columns.to_columns(self.records(), fields, schema, fill)
+
+    def to_numpy(self, fields: Optional[Sequence[str]] = None, schema: Optional[Dict[str, str]] = None,
+                 fill: Optional[Any] = None) -> Dict:
+        """
+        Converts records of the result to a dict of NumPy arrays, NumPy should be installed.
+        Parameters are the same as for **to_columns**
+
+        :return: dict of NumPy arrays
+        :raise ValueError: if result is an error or does not contain records
+        :raise ImportError: if NumPy is not installed
+        """
+        return columns.to_numpy(self.records(), fields, schema, fill)
+
+    def to_pandas(self, fields: Optional[Sequence[str]] = None, schema: Optional[Dict[str, str]] = None,
+                  fill: Optional[Any] = None):
+        """
+        Converts records of the result to a pandas DataFrame, pandas should be installed.
+        Parameters are the same as for **to_columns**
+
+        :return: pandas DataFrame
+        :raise ValueError: if result is an error or does not contain records
+        :raise ImportError: if pandas is not installed
+        """
+        return columns.to_pandas(self.records(), fields, schema, fill)
+
+    def as_type(self, model: type) -> Any:
+        """
+        Converts records of the result to objects of the model (dataclass, attrs class, class with __slots__ or
+        annotations). Decoder for the model is generated on the first call and cached, RecordId and datetime fields
+        are converted from strings
+
+        Example:
+        SurrealResult(result=[{"id": "person:1", "name": "John"}]).as_type(Person) == [Person(RecordId("person:1"),
+        "John")]
+
+        :param model: class of the model
+        :return: list of objects for a list result, one object for a dict result, None for an empty result
+        :raise ValueError: if result is an error, is not a record or a required field is missing
+        :raise TypeError: if the model is not supported
+        """
+        if self.is_error():
+            raise ValueError(f"Cant convert an error result, body: {self.result}")
+        return typed.decode(self.result, model)
+
+    def convert(self, converter: Optional[ResultConverter] = None) -> "SurrealResult":
+        """
+        Converts datetime strings and record ids in records of the result to datetime and RecordId objects in place.
+        Fields to convert are detected on a sample of records, see ResultConverter
+
+        Example:
+        SurrealResult(result=[{"id": "person:1"}]).convert().result == [{"id": RecordId("person:1")}]
+
+        :param converter: converter to use, new ResultConverter with default parameters is used if not specified
+        :return: the result itself
+        :raise ValueError: if result is an error or does not contain records
+        """
+        records = self.records()
+        if records:
+            (converter or ResultConverter()).convert(records)
+        return self
+
+    def _is_list(self) -> bool:
+        return isinstance(self.result, List)
+
+    def records(self) -> List:
+        """
+        Returns records of the result as a list: a list result as is, an empty result as an empty list, any other
+        result as a list of one element
+
+        :return: list of records
+        :raise ValueError: if the result is an error
+        """
+        if self.is_error():
+            raise ValueError(f"Cant convert an error result, body: {self.result}")
+        if self.is_empty():
+            return []
+        return self.result if isinstance(self.result, List) else [self.result]
+
     def to_dict(self) -> Dict:
         """
         Return all data as dict
@@ -178,12 +329,200 @@ class SurrealResult:
     def __eq__(self, other):
         if other is None or not isinstance(other, SurrealResult):
             return False
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, name) == getattr(other, name) for name in SurrealResult.__slots__)
 
     def __hash__(self):
         return hash((self.ws_id, self.result, self.status, self.time, self.code, self.query))
 
 
+class LazySurrealResult(SurrealResult):
+    """
+    Result which keeps the raw JSON of the payload and decodes it only on the first access to **result**. Envelope
+    (id, status, time) is decoded eagerly, so is_error, is_empty and time do not touch the payload at all.
+    For flat records (each record has a string id and no nested objects) count, ids and id are extracted from the
+    raw text without building dicts of the records, for all other payloads they decode it.
+
+    Use to_lazy_result to create it, or lazy_results=True on Surreal (Database, DatabaseConnectionsPool)
+    """
+    __slots__ = ("_raw", "_flat", "_decoded")
+
+    @classmethod
+    def from_raw(cls, ws_id: Optional[Union[int, str]], time: Optional[str], raw: str) -> "LazySurrealResult":
+        """
+        Creates a successful result with the raw JSON text of the payload, without decoding it
+
+        :param ws_id: id of the request
+        :param time: execution time of the statement
+        :param raw: JSON text of the payload
+        :return: LazySurrealResult object
+        """
+        res = object.__new__(cls)
+        res.ws_id = ws_id
+        res.code = None
+        res.query = None
+        res.status = OK
+        res.time = time
+        res.additional_info = {}
+        res._raw = raw
+        res._flat = None
+        res._decoded = None
+        return res
+
+    @property
+    def result(self) -> Optional[Union[str, int, Dict, List]]:
+        """
+        Returns the payload, the raw JSON is decoded on the first access
+        """
+        raw = self._raw
+        if raw is not None:
+            self._decoded = _loads(raw)
+            self._raw = None
+        return self._decoded
+
+    @result.setter
+    def result(self, value):
+        self._decoded = value
+        self._raw = None
+        self._flat = None
+
+    def is_decoded(self) -> bool:
+        """
+        Shows the payload was already decoded
+
+        :return: True if result was accessed (or set), False if it is still raw
+        """
+        return self._raw is None
+
+    def raw(self) -> Optional[str]:
+        """
+        Returns raw JSON text of the payload if it was not decoded yet
+
+        :return: JSON text or None
+        """
+        return self._raw
+
+    def is_empty(self) -> bool:
+        raw = self._raw
+        if raw is not None:
+            return raw in _EMPTY
+        return super().is_empty()
+
+    def count(self) -> int:
+        raw = self._raw
+        if raw is not None:
+            flat = self._flat_count(raw)
+            if flat is not None:
+                return flat
+        return super().count()
+
+    @property
+    def ids(self) -> List:
+        raw = self._raw
+        if raw is not None:
+            flat = self._flat_count(raw)
+            if flat is not None:
+                ids = _ID.findall(raw)
+                if len(ids) == flat:
+                    return ids
+        return super().ids
+
+    @property
+    def id(self) -> str:
+        raw = self._raw
+        if raw is not None and self._flat_count(raw) == 1:
+            ids = _ID.findall(raw)
+            if len(ids) == 1:
+                return ids[0]
+        return super().id
+
+    def _is_list(self) -> bool:
+        raw = self._raw
+        if raw is not None:
+            return raw[:1] == "["
+        return super()._is_list()
+
+    def _flat_count(self, raw: str) -> Optional[int]:
+        # the raw text is read once by callers, another thread can decode the result and drop it meanwhile
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = _count_flat_records(raw)
+        return flat if flat >= 0 else None
+
+    def __repr__(self):
+        raw = self._raw
+        if raw is not None:
+            return f"LazySurrealResult(id={self.ws_id}, status={self.status}, raw={len(raw)} chars, " \
+                   f"time={self.time})"
+        return super().__repr__()
+
+
+def _loads(text: str):
+    try:
+        return json.loads(text)
+    except RecursionError as exc:
+        raise TooManyNestedLevelsError("Cant serialize object, too many nested levels") from exc
+
+
+def _count_flat_records(raw: str) -> int:
+    """
+    Counts records in the raw JSON without decoding it. It is only possible for a record or a list of records, where
+    each record has a string id and there are no nested objects, it returns -1 for all other cases.
+    Every "id":" sequence is a real key (quotes inside strings are escaped), so if there are as many of them as
+    braces, no string contains a brace and all checks below see only the structure of the JSON. Then each object,
+    except the first one, should follow another object in the same list, nested objects always break this rule
+    """
+    if raw[:2] != "[{" and raw[:1] != "{":
+        return -1
+    count = raw.count("{")
+    if count != raw.count('"id":"') or count != 1 + raw.count("},{"):
+        return -1
+    return count
+
+
+def response_id(content: str) -> Optional[Union[str, int]]:
+    """
+    Gets id of the successful rpc response from its raw JSON without decoding the whole response
+
+    :param content: raw JSON response from SurrealDB
+    :return: id of the response or None if response does not start with id and result
+    """
+    match = _RPC_HEAD.match(content)
+    return json.loads(match.group(1)) if match else None
+
+
+def to_lazy_result(content: str) -> SurrealResult:
+    """
+    Converts str response of SurrealDB to a result, which decodes payload only on demand (see LazySurrealResult).
+    Errors, scalar payloads and responses with several statements are decoded at once, as usual
+
+    :param content: raw JSON response from SurrealDB
+    :return: LazySurrealResult or SurrealResult object
+    """
+    match = _RPC_HEAD.match(content)
+    if match:
+        ws_id, start = json.loads(match.group(1)), match.end()
+    elif content.startswith('{"result":'):
+        ws_id, start = None, 10
+    else:
+        return to_result(content)
+    if content[-1:] != "}":
+        return to_result(content)
+    body, time = content[start:-1], None
+    if body.startswith(_STATEMENT_HEAD):
+        tail = body[-256:]
+        found = _STATEMENT_TAIL.search(tail)
+        if not found:
+            return to_result(content)
+        body = body[len(_STATEMENT_HEAD):len(body) - len(tail) + found.start()]
+        # a boundary between two statements, it cannot be inside a string
+        if '},{"result":' in body:
+            return to_result(content)
+        time = json.loads(f'"{found.group(1)}"')
+    if body[:1] not in ("[", "{"):
+        return to_result(content)
+    return LazySurrealResult.from_raw(ws_id, time, body)
+
+
 def to_result(content: Union[str, Dict, List]) -> SurrealResult:
     """
     Converts str or dict response of SurrealDB to a common object for convenient use
@@ -198,19 +537,22 @@ def to_result(content: Union[str, Dict, List]) -> SurrealResult:
             raise TooManyNestedLevelsError("Cant serialize object, too many nested levels") from exc
     if isinstance(content, List):
         if len(content) == 1:
-            return SurrealResult(**content[0])
-        return SurrealResult(result=[SurrealResult(**e) for e in content])
+            return SurrealResult.from_response(content[0])
+        return SurrealResult(result=[SurrealResult.from_response(e) for e in content])
     if _is_result_inside(content):
-        res = SurrealResult(**content["result"][0])
+        res = SurrealResult.from_response(content["result"][0])
         if "id" in content:
             res.ws_id = content["id"]
         return res
-    return SurrealResult(**content)
+    return SurrealResult.from_response(content)
 
 
 def _is_result_inside(a_dict) -> bool:
     """
     Helper predicate for deep nested objects
     """
-    return len(a_dict) in (1, 2) and "result" in a_dict and isinstance(a_dict["result"], List) \
-        and len(a_dict["result"]) == 1 and set(a_dict["result"][0].keys()) == {"time", "status", "result"}
+    inner = a_dict.get("result")
+    if inner.__class__ is not list or len(inner) != 1 or len(a_dict) > 2:
+        return False
+    first = inner[0]
+    return first.__class__ is dict and len(first) == 3 and "time" in first and "status" in first and "result" in first
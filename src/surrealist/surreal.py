@@ -25,7 +25,7 @@ class Surreal:
 
     def __init__(self, url: str, namespace: Optional[str] = None, database: Optional[str] = None,
                  access: Optional[str] = None, credentials: Tuple[str, str] = None, use_http: bool = False,
-                 timeout: int = DEFAULT_TIMEOUT):
+                 timeout: int = DEFAULT_TIMEOUT, lazy_results: bool = False, clean_dates: bool = False):
         """
         Initiating all parameters for connection, this method does not check or validates anything by itself, just save
         data for future use. To make sure your url is valid and accessible - use **is_ready** method of Surreal object.
@@ -41,6 +41,9 @@ class Surreal:
         :param use_http: boolean flag of using http transport. Will use websocket-client if False.
         It is strongly recommended to use websocket transport as it is more powerful.
         :param timeout: connection timeout in seconds
+        :param lazy_results: if True, results of the connections keep raw JSON and decode it only on access
+        :param clean_dates: if True, queries are cleaned from quoted date strings (like "d'2024-01-01T00:00:00Z'"),
+        False by default, use DatetimeLiteral (to_surreal_datetime_str) with query builders instead
         """
         self._client = HttpConnection if use_http else WebSocketConnection
         self.db_params = {}
@@ -64,6 +67,8 @@ class Surreal:
         self.set_url(url)
         self.credentials = credentials
         self.timeout = timeout
+        self.lazy_results = lazy_results
+        self.clean_dates = clean_dates
 
     def set_url(self, url: str):
         """
@@ -97,7 +102,8 @@ class Surreal:
         :return: connection object to work with SurrealDB
         :raise SurrealConnectionError: if cant connect with specified parameters
         """
-        return self._client(self._url, db_params=self.db_params, credentials=self.credentials, timeout=self.timeout)
+        return self._client(self._url, db_params=self.db_params, credentials=self.credentials, timeout=self.timeout,
+                            lazy_results=self.lazy_results, clean_dates=self.clean_dates)
 
     def is_ready(self) -> bool:
         """
@@ -0,0 +1,199 @@
+import dataclasses
+import datetime
+import types
+import typing
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from surrealist.record_id import RecordId
+from surrealist.utils import parse_datetime
+
+FIELDS_ATTRIBUTE = "__surreal_fields__"  # optional dict on a model: attribute name -> field name in SurrealDB
+_MISSING = object()
+_UNIONS = (typing.Union, getattr(types, "UnionType", typing.Union))  # Optional[X] and X | None (python 3.10+)
+_NoneType = type(None)
+_decoders: Dict[type, Callable[[Dict], Any]] = {}
+_lock = Lock()
+
+
+def decoder_for(model: type) -> Callable[[Dict], Any]:
+    """
+    Returns a decoder for the model: a function, which converts a record (dict) to an object of the model.
+    Decoder is generated once for each model and cached, so all checks of the model and its fields are done only
+    on the first call.
+
+    Supported models: dataclasses, attrs classes, classes with __slots__ or annotations. Fields with RecordId and
+    datetime types (including Optional, X | None and List of them) are converted from strings, fields with another
+    model type are decoded recursively. Names of the fields in the database can be changed with
+    __surreal_fields__ dict on the model: {"attribute_name": "field_name"}
+
+    :param model: class of the model
+    :return: decoder function
+    :raise TypeError: if the model is not supported
+    """
+    decoder = _decoders.get(model)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(model)
+            if decoder is None:
+                decoder = _build(model)
+                _decoders[model] = decoder
+    return decoder
+
+
+def decode(records: Any, model: type) -> Any:
+    """
+    Converts a record or a list of records to objects of the model
+
+    :param records: dict, list of dicts or None
+    :param model: class of the model
+    :return: object of the model, list of objects or None
+    :raise ValueError: if records are not dicts or a required field is missing
+    """
+    if records is None:
+        return None
+    decoder = decoder_for(model)
+    if isinstance(records, List):
+        if any(not isinstance(record, Dict) for record in records):
+            raise ValueError(f"Only records (dicts) can be decoded to {model.__name__}")
+        return [decoder(record) for record in records]
+    if not isinstance(records, Dict):
+        raise ValueError(f"Only records (dicts) can be decoded to {model.__name__}, got: {records}")
+    return decoder(records)
+
+
+def _to_record_id(value):
+    if value is None or value.__class__ is RecordId:
+        return value
+    return RecordId(value)
+
+
+def _to_datetime(value):
+    return parse_datetime(value) if value.__class__ is str else value
+
+
+def _fields(model: type) -> List[Tuple[str, Any, Any, bool]]:
+    """
+    Returns fields of the model as tuples: name of the attribute, type, default value (or factory) and a flag of
+    factory. Fields of dataclasses and attrs classes, which are not in __init__, are skipped
+    """
+    hints = _hints(model)
+    if dataclasses.is_dataclass(model):
+        result = []
+        for field in dataclasses.fields(model):
+            if not field.init:
+                continue
+            default, is_factory = field.default, False
+            if field.default_factory is not dataclasses.MISSING:
+                default, is_factory = field.default_factory, True
+            default = _MISSING if default is dataclasses.MISSING else default
+            result.append((field.name, hints.get(field.name, field.type), default, is_factory))
+        return result
+    if hasattr(model, "__attrs_attrs__"):
+        result = []
+        for attribute in model.__attrs_attrs__:
+            if not attribute.init:
+                continue
+            default, is_factory = attribute.default, False
+            if default.__class__.__name__ == "_Nothing" or getattr(default, "takes_self", False):
+                default = _MISSING
+            elif hasattr(default, "factory"):
+                default, is_factory = default.factory, True
+            alias = getattr(attribute, "alias", None) or attribute.name.lstrip("_")
+            result.append((alias, hints.get(attribute.name, attribute.type), default, is_factory))
+        return result
+    names = [name for klass in reversed(model.__mro__) for name in _slots(klass)] or list(hints)
+    if not names:
+        raise TypeError(f"Cant decode to {model.__name__}: it is not a dataclass, attrs class, and it has no slots "
+                        f"or annotations")
+    return [(name, hints.get(name), _MISSING, False) for name in dict.fromkeys(names)]
+
+
+def _slots(klass: type) -> List[str]:
+    slots = klass.__dict__.get("__slots__", ())
+    slots = [slots] if isinstance(slots, str) else list(slots)
+    return [name for name in slots if name not in ("__dict__", "__weakref__")]
+
+
+def _hints(model: type) -> Dict[str, Any]:
+    try:
+        return typing.get_type_hints(model)
+    except Exception:  # pylint: disable=broad-except
+        # unresolved forward references, annotations are used as is, strings are just not converted
+        result = {}
+        for klass in reversed(model.__mro__):
+            result.update(klass.__dict__.get("__annotations__", {}))
+        return result
+
+
+def _is_model(kind: Any) -> bool:
+    if not isinstance(kind, type) or kind in (str, int, float, bool, bytes, dict, list, tuple, set):
+        return False
+    return dataclasses.is_dataclass(kind) or hasattr(kind, "__attrs_attrs__") or bool(
+        [name for klass in kind.__mro__ for name in _slots(klass)])
+
+
+def _converter(kind: Any) -> Optional[Callable]:
+    """
+    Returns a function to convert the value of the field with given type or None if no conversion needed
+    """
+    origin, args = typing.get_origin(kind), typing.get_args(kind)
+    if origin in _UNIONS:
+        args = [arg for arg in args if arg is not _NoneType]
+        return _converter(args[0]) if len(args) == 1 else None
+    if origin in (list, List) and args:
+        inner = _converter(args[0])
+        if inner is None:
+            return None
+        return lambda value: value if value is None else [inner(e) for e in value]
+    if kind is RecordId:
+        return _to_record_id
+    if kind is datetime.datetime:
+        return _to_datetime
+    if _is_model(kind):
+        return lambda value: value if value is None or not isinstance(value, Dict) else decoder_for(kind)(value)
+    return None
+
+
+def _build(model: type) -> Callable[[Dict], Any]:
+    """
+    Generates the source of the decoder for the model and compiles it. Each field becomes one expression, without
+    loops or checks of the type in runtime. Dataclasses and attrs classes are created via __init__, all other
+    classes are created without calling __init__, fields are just assigned (missing fields become None)
+    """
+    renames = getattr(model, FIELDS_ATTRIBUTE, {})
+    use_init = dataclasses.is_dataclass(model) or hasattr(model, "__attrs_attrs__")
+    namespace = {"_model": model, "_new": object.__new__}
+    values = []
+    required = []  # lookups of required fields, only they can raise KeyError
+    for number, (name, kind, default, is_factory) in enumerate(_fields(model)):
+        key = repr(renames.get(name, name))
+        if default is _MISSING and use_init:
+            required.append(f"        _value{number} = data[{key}]")
+            value = f"_value{number}"
+        elif default is _MISSING:
+            value = f"_get({key})"
+        elif is_factory:
+            namespace[f"_factory{number}"] = default
+            value = f"(data[{key}] if {key} in data else _factory{number}())"
+        else:
+            namespace[f"_default{number}"] = default
+            value = f"_get({key}, _default{number})"
+        converter = _converter(kind)
+        if converter is not None:
+            namespace[f"_convert{number}"] = converter
+            value = f"_convert{number}({value})"
+        values.append((name, value))
+    lines = ["def decode(data):", "    _get = data.get"]
+    if required:
+        lines.extend(["    try:", *required, "    except KeyError as e:",
+                      f"        raise ValueError(f'Field {{e}} is required for {model.__name__}, but missing') "
+                      f"from None"])
+    if use_init:
+        lines.append(f"    obj = _model({', '.join(f'{name}={value}' for name, value in values)})")
+    else:
+        lines.append("    obj = _new(_model)")
+        lines.extend(f"    obj.{name} = {value}" for name, value in values)
+    lines.append("    return obj")
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["decode"]
@@ -38,16 +38,29 @@ def mask_pass(text: str) -> str:
     :param text: text before putting it to log
     :return: text without visible passwords
     """
+    if "pass" not in text:
+        return text
     return re.sub(r"(?ms)(?<=['\"]pass['\"]: ['\"]).*?(?=['\"])", '******', text)
 
 
-def to_surreal_datetime_str(dt: datetime.datetime) -> str:
+class DatetimeLiteral(str):
     """
-    Convert datetime to string in Surreal format, for example: d'2024-04-18T11:34:41.665249Z'
+    String with SurrealQL datetime literal, like d'2024-04-18T11:34:41.665249Z'. Query builders (safe_dumps) put it in
+    queries as is, without quotes
+    """
+    __slots__ = ()
+
+
+def to_surreal_datetime_str(dt: datetime.datetime) -> DatetimeLiteral:
+    """
+    Convert datetime to string in Surreal format, for example: d'2024-04-18T11:34:41.665249Z'.
+    Aware datetime is converted to UTC, naive one is considered as UTC
     :param dt: datetime object
     :return: string representation of the datetime
     """
-    return f"d'{dt.strftime(DATE_FORMAT_NS)}'"
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return DatetimeLiteral(f"d'{dt.isoformat(timespec='microseconds')}Z'")
 
 
 def to_datetime(dt_str: str) -> datetime.datetime:
@@ -63,29 +76,100 @@ def to_datetime(dt_str: str) -> datetime.datetime:
     return datetime.datetime.strptime(dt_str, DATE_FORMAT_NS)
 
 
+_fromisoformat = datetime.datetime.fromisoformat
+_ISO_SIZES = {20: 19, 24: 23, 27: 26, 28: 26, 29: 26, 30: 26}
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """
+    Fast parser for datetime strings of SurrealDB (ISO-8601, like 2024-04-18T11:34:41.665249123Z), it is much faster
+    than strptime and works with nanoseconds, which are truncated to microseconds. Datetime in UTC (with Z at the end)
+    is returned as a naive datetime object, like in to_datetime, datetime with offset returns as an aware object
+    :param value: datetime string
+    :return: datetime object
+    :raise ValueError: if string is not a valid datetime
+    """
+    text = value
+    try:
+        size = len(value)
+        if value[-1] == "Z" and size in _ISO_SIZES and (size == 20 or value[19] == ".") and (
+                size < 28 or value[26:-1].isdigit()):
+            # fast path for usual SurrealDB datetimes: fromisoformat works with 0, 3 or 6 digits of fraction
+            return _fromisoformat(value[:_ISO_SIZES[size]] if size < 28 else value[:26])
+        tz = None
+        if value[-1] == "Z":
+            value = value[:-1]
+        elif len(value) > 19 and value[-6] in "+-" and value[-3] == ":":
+            sign = -1 if value[-6] == "-" else 1
+            offset = datetime.timedelta(hours=int(value[-5:-3]), minutes=int(value[-2:]))
+            tz = datetime.timezone(sign * offset)
+            value = value[:-6]
+        if value[4] != "-" or value[7] != "-" or value[10] not in "Tt " or value[13] != ":" or value[16] != ":":
+            raise ValueError(value)
+        micro = 0
+        if len(value) > 19:
+            if value[19] != "." or not value[20:].isdigit():
+                raise ValueError(value)
+            micro = int(value[20:26].ljust(6, "0"))
+        return datetime.datetime(int(value[:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]),
+                                 int(value[14:16]), int(value[17:19]), micro, tz)
+    except (IndexError, ValueError) as e:
+        raise ValueError(f"Wrong datetime format: {text}") from e
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ns|µs|us|ms|s|m|h|d|w|y)")
+_DURATION_UNITS = {"ns": 1e-9, "µs": 1e-6, "us": 1e-6, "ms": 1e-3, "s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0,
+                   "w": 604800.0, "y": 31536000.0}
+
+
+def parse_duration(text: str) -> float:
+    """
+    Converts SurrealDB duration (like time of the result: "1.234567ms", "1m30s", "120µs") to seconds
+
+    :param text: duration string
+    :return: number of seconds
+    :raise ValueError: if the string is not a duration
+    """
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(number + unit for number, unit in parts) != text.strip():
+        raise ValueError(f"Wrong duration format: {text}")
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
 def clean_dates(data: str) -> str:
     """
-    Get surreal dates with d' prefix out of quotes
+    Get surreal dates with d' prefix out of quotes. Query builders render datetime objects and results of
+    to_surreal_datetime_str correctly, so it is needed only for hand-made queries (see clean_dates of Connection)
     :param data: some Surreal query
     :return: data with valid Surreal dates
     """
     return re.sub(r'["\'](d(["\']).+?)["\']+', r'\1\2', data)
 
 
+_IN_DICT = (RecordId, list, dict, DatetimeLiteral, datetime.datetime)  # values of a dict with special rendering
+_IN_LIST = (*_IN_DICT, tuple)  # the same for elements of lists and tuples
+_SCALARS = {str, int, float, bool, type(None)}
+_SIMPLE_KEY = re.compile(r'[ !#-\[\]-~]*').fullmatch  # keys, which json.dumps does not escape
+
+
 def safe_dumps(data: Any) -> str:
     """
-    Convert data to json string with special logic for RecordId (if it exists)
-    We have to do it because since version 2.0 of SurrealDB it never converts string to record_id
+    Convert data to json string with special logic for RecordId and datetime (if it exists)
+    We have to do it because since version 2.0 of SurrealDB it never converts string to record_id or datetime
     :param data: data to convert, dict, list, tuple or JSON serializable object expected here
     :return: string
     """
     if isinstance(data, RecordId):
         return data.to_valid_string()
-    if isinstance(data, List):
+    if isinstance(data, DatetimeLiteral):
+        return str.__str__(data)
+    if isinstance(data, datetime.datetime):
+        return to_surreal_datetime_str(data)
+    if isinstance(data, list):
         return list_to_json_str(data)
-    if isinstance(data, Tuple):
+    if isinstance(data, tuple):
         return tuple_to_json_str(data)
-    if isinstance(data, Dict):
+    if isinstance(data, dict):
         return dict_to_json_str(data)
     return json.dumps(data)
 
@@ -93,43 +177,39 @@ def safe_dumps(data: Any) -> str:
 def dict_to_json_str(data: Dict) -> str:
     """
     Convert dict to json string with special logic for RecordId (if it exists)
-    We have to do it because since version 2.0 of SurrealDB it never converts string to record_id
+    We have to do it because since version 2.0 of SurrealDB it never converts string to record_id.
+    Values without special rendering go first, then RecordId, list and dict values
     :param data: dict to convert
     :return: string
     """
-    ids = {k: v for k, v in data.items() if isinstance(v, (RecordId, List, Dict))}
-    if not ids:
+    if _is_plain_dict(data):
         return json.dumps(data)
-    without_ids = {k: v for k, v in data.items() if k not in ids}
-    first = json.dumps(without_ids) if without_ids else ""
-    join = ", ".join([f'"{k}": {safe_dumps(v)}' for k, v in ids.items()])
-    if first:
-        first = first.rstrip("}")
-        first = f"{first}, "
-    else:
-        first = "{"
-    return f"{first}{join}}}"
+    without_ids = {}
+    ids = []
+    for k, v in data.items():
+        if isinstance(v, _IN_DICT):
+            ids.append(f'"{k}": {safe_dumps(v)}')
+        else:
+            without_ids[k] = v
+    first = f"{json.dumps(without_ids).rstrip('}')}, " if without_ids else "{"
+    return f"{first}{', '.join(ids)}}}"
 
 
 def list_to_json_str(data: List) -> str:
     """
     Convert a list to json string with special logic for RecordId (if it exists)
-    We have to do it because since version 2.0 of SurrealDB it never converts string to record_id
+    We have to do it because since version 2.0 of SurrealDB it never converts string to record_id.
+    Scalar elements go first, then RecordId, list, dict and tuple elements
     :param data: list of pairs to convert
     :return: string
     """
-    ids = [e for e in data if isinstance(e, (RecordId, List, Dict, Tuple))]
+    if data.__class__ is list and _is_plain_list(data):
+        return json.dumps(data)
+    without_ids, ids = _split(data)
     if not ids:
         return json.dumps(data)
-    without_ids = [e for e in data if e not in ids]
-    first = json.dumps(without_ids) if without_ids else ""
-    join = ", ".join(safe_dumps(e) for e in ids)
-    if first:
-        first = first.rstrip("]")
-        first = f"{first}, "
-    else:
-        first = "["
-    return f"{first}{join}]"
+    first = f"{json.dumps(without_ids).rstrip(']')}, " if without_ids else "["
+    return f"{first}{_join(ids)}]"
 
 
 def tuple_to_json_str(values: Tuple) -> str:
@@ -139,16 +219,115 @@ def tuple_to_json_str(values: Tuple) -> str:
     :param values: tuple to convert
     :return: string
     """
-    ids = [e for e in values if isinstance(e, (RecordId, List, Dict, Tuple))]
+    without_ids, ids = _split(values)
+    first = json.dumps(without_ids).lstrip("[").rstrip("]")
     if not ids:
-        return f'({json.dumps(values).lstrip("[").rstrip("]")})'
-    without_ids = [e for e in values if e not in ids]
-    first = json.dumps(without_ids)
-    first = first.lstrip("[").rstrip("]")
+        return f"({first})"
     if first:
         first = f"{first}, "
-    join = ", ".join(f'{safe_dumps(e)}' for e in ids)
-    return f"({first}{join})"
+    return f"({first}{_join(ids)})"
+
+
+def is_plain(value: Any) -> bool:
+    """
+    Checks if the value is rendered by safe_dumps the same way as by json.dumps, so it can be sent as a query variable
+    :param value: any value
+    :return: True for JSON scalars, lists and dicts without RecordId, datetime and tuples inside
+    """
+    if value.__class__ in _SCALARS:
+        return True
+    if value.__class__ is dict:
+        return _is_plain_dict(value)
+    if value.__class__ is list:
+        return _is_plain_list(value)
+    return False
+
+
+def _is_plain_dict(data: Dict) -> bool:
+    """
+    Returns True if json.dumps gives the same string as safe_dumps for the dict: no RecordId inside, lists and dicts
+    go after all other values and have simple keys
+    """
+    scalars = _SCALARS
+    nested = False
+    for key, value in data.items():
+        if value.__class__ in scalars or not isinstance(value, _IN_DICT):
+            if nested:
+                return False
+            continue
+        if value.__class__ is dict:
+            plain = _is_plain_dict(value)
+        elif value.__class__ is list:
+            plain = _is_plain_list(value)
+        else:
+            return False
+        if not plain or key.__class__ is not str or not _SIMPLE_KEY(key):
+            return False
+        nested = True
+    return True
+
+
+def _is_plain_list(data: List) -> bool:
+    """
+    Returns True if json.dumps gives the same string as safe_dumps for the list: no RecordId and tuples inside, lists
+    and dicts go after all other elements
+    """
+    scalars = _SCALARS
+    nested = False
+    for e in data:
+        if e.__class__ in scalars:
+            if nested:
+                return False
+            continue
+        if e.__class__ is dict:
+            plain = _is_plain_dict(e)
+        elif e.__class__ is list:
+            plain = _is_plain_list(e)
+        else:
+            # other objects can be skipped as equal to RecordId, list, dict or tuple, let the slow path decide
+            return False
+        if not plain:
+            return False
+        nested = True
+    return True
+
+
+def _split(data: Union[List, Tuple]) -> Tuple[List, List]:
+    """
+    Splits elements to the ones without special rendering and the others in one pass
+    """
+    scalars = _SCALARS
+    without_ids = []
+    ids = []
+    for e in data:
+        if e.__class__ in scalars or not isinstance(e, _IN_LIST):
+            without_ids.append(e)
+        else:
+            ids.append(e)
+    if ids and any(e.__class__ not in scalars for e in without_ids):
+        # only objects of other classes can be equal to RecordId, list, dict or tuple, they are skipped as before
+        without_ids = [e for e in without_ids if e.__class__ in scalars or e not in ids]
+    return without_ids, ids
+
+
+def _join(ids: List) -> str:
+    """
+    Renders special elements joined with comma, neighbour dicts and lists, which json.dumps renders the same way, are
+    rendered by one json.dumps call, this is much faster for bulk payloads (like INSERT of many records)
+    """
+    parts = []
+    plain = []
+    for e in ids:
+        if (e.__class__ is dict and _is_plain_dict(e)) or (e.__class__ is list and _is_plain_list(e)):
+            plain.append(e)
+            continue
+        if plain:
+            parts.append(json.dumps(plain)[1:-1])
+            plain = []
+        parts.append(safe_dumps(e))
+    if plain:
+        parts.append(json.dumps(plain)[1:-1])
+    return ", ".join(parts)
 
 
 def get_table_or_record_id(table_name: str, record_id: Optional[StrOrRecord]) -> str:
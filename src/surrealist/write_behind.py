@@ -0,0 +1,217 @@
+from logging import getLogger
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from surrealist.connections import Connection
+from surrealist.errors import OperationOnClosedConnectionError
+from surrealist.record_id import RecordId
+from surrealist.result import SurrealResult
+from surrealist.utils import ERR, StrOrRecord, safe_dumps
+
+logger = getLogger("surrealist.write_behind")
+MERGE = "MERGE"
+CONTENT = "CONTENT"
+Pending = Tuple[str, Dict]  # kind of the write (MERGE or CONTENT) and data
+
+
+class WriteBehindBuffer:
+    """
+    Buffer for frequent writes to the same records (counters, presence, last seen): **merge** and **upsert** calls
+    return at once, updates of the same record are coalesced in memory (dicts are merged like MERGE does) and a
+    background thread writes them every **max_delay** seconds, or as soon as **max_records** records are waiting.
+    All waiting records are written with one multi-statement query of UPSERT ... MERGE / UPSERT ... CONTENT, so
+    N calls for K records cost one round trip instead of N.
+
+    Memory is bounded: if **max_pending** records are waiting, callers are blocked until the next write. On close
+    all waiting records are written. Failed records are passed to **on_error**, they are not written again.
+
+    Example:
+    with WriteBehindBuffer(connection, max_delay=0.5) as buffer:
+        buffer.merge("presence:john", {"online": True, "seen": now})
+    """
+
+    def __init__(self, connection: Connection, max_delay: float = 0.1, max_records: int = 1000,
+                 max_pending: int = 10_000, on_error: Optional[Callable[[Dict[str, Pending], str], None]] = None,
+                 on_flush: Optional[Callable[[int], None]] = None):
+        """
+        :param connection: connection or pool to write
+        :param max_delay: maximum time in seconds a change waits in the buffer
+        :param max_records: number of waiting records to write without waiting for max_delay
+        :param max_pending: maximum number of waiting records, callers are blocked after it
+        :param on_error: optional function, it gets failed records (id: (MERGE or CONTENT, data)) and the error
+        :param on_flush: optional function, it gets the number of written records after each write
+        :raise ValueError: if limits are wrong
+        """
+        if max_delay <= 0 or max_records < 1 or max_pending < max_records:
+            raise ValueError("Limits should satisfy max_delay > 0 and 1 <= max_records <= max_pending")
+        self._connection = connection
+        self._max_delay = max_delay
+        self._max_records = max_records
+        self._max_pending = max_pending
+        self._on_error = on_error
+        self._on_flush = on_flush
+        self._pending: Dict[str, Pending] = {}
+        self._condition = Condition()
+        self._write_lock = Lock()  # writes go one by one, so an older value never overwrites a newer one
+        self._closed = False
+        self._stats = {"calls": 0, "coalesced": 0, "flushes": 0, "flushed_records": 0, "failed_records": 0}
+        self._thread = Thread(target=self._run, name="surrealist-write-behind", daemon=True)
+        self._thread.start()
+
+    def merge(self, record_id: StrOrRecord, data: Dict):
+        """
+        Merges data into the record (like Connection.merge), the record is created if it does not exist
+
+        :param record_id: full id of the record, like "person:john"
+        :param data: fields to change
+        :raise OperationOnClosedConnectionError: if the buffer is closed
+        """
+        self._add(record_id, MERGE, data)
+
+    def upsert(self, record_id: StrOrRecord, data: Dict):
+        """
+        Replaces content of the record (like Connection.upsert), the record is created if it does not exist
+
+        :param record_id: full id of the record, like "person:john"
+        :param data: new content
+        :raise OperationOnClosedConnectionError: if the buffer is closed
+        """
+        self._add(record_id, CONTENT, data)
+
+    def _add(self, record_id: StrOrRecord, kind: str, data: Dict):
+        key = record_id.to_valid_string() if isinstance(record_id, RecordId) else RecordId(record_id).to_valid_string()
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or len(self._pending) < self._max_pending or key in
+                                     self._pending)
+            if self._closed:
+                raise OperationOnClosedConnectionError("Write-behind buffer is closed")
+            self._stats["calls"] += 1
+            previous = self._pending.get(key)
+            if previous is None:
+                self._pending[key] = (kind, dict(data))
+            else:
+                self._stats["coalesced"] += 1
+                if kind == CONTENT:
+                    self._pending[key] = (kind, dict(data))
+                else:
+                    self._pending[key] = (previous[0], _merged(previous[1], data))
+            if len(self._pending) >= self._max_records:
+                self._condition.notify_all()
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of records waiting for a write
+        """
+        return len(self._pending)
+
+    def stats(self) -> Dict:
+        """
+        Returns metrics of the buffer
+
+        :return: dict with numbers of calls, coalesced calls, writes (flushes), written and failed records and
+        waiting records
+        """
+        with self._condition:
+            return {**self._stats, "pending": len(self._pending)}
+
+    def flush(self):
+        """
+        Writes all waiting records now, in the current thread
+        """
+        with self._write_lock:
+            with self._condition:
+                taken, self._pending = self._pending, {}
+                self._condition.notify_all()
+            self._write(taken)
+
+    def close(self):
+        """
+        Stops the background thread and writes all waiting records
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_details):
+        self.close()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or len(self._pending) >= self._max_records,
+                                         self._max_delay)
+                if self._closed:
+                    return
+            if self._pending:
+                try:
+                    self.flush()
+                except Exception:  # errors of callbacks should not stop the thread
+                    logger.exception("Error on write-behind flush")
+
+    def _write(self, records: Dict[str, Pending]):
+        items = list(records.items())
+        for start in range(0, len(items), self._max_records):
+            chunk = items[start:start + self._max_records]
+            query = "".join(f"UPSERT {key} {kind} {safe_dumps(data)};" for key, (kind, data) in chunk)
+            try:
+                failed, error = _failed(self._connection.query(query), chunk)
+            except Exception as e:  # any error of the connection fails all records of the chunk
+                failed, error = dict(chunk), f"{e.__class__.__name__}: {e}"
+            done = len(chunk) - len(failed)
+            with self._condition:
+                self._stats["flushes"] += 1
+                self._stats["flushed_records"] += done
+                self._stats["failed_records"] += len(failed)
+            if failed:
+                logger.error("Write-behind failed for %s records: %s", len(failed), error)
+                if self._on_error:
+                    self._on_error(failed, error)
+            if self._on_flush:
+                self._on_flush(done)
+
+    def __repr__(self):
+        return (f"WriteBehindBuffer(pending={self.pending}, max_delay={self._max_delay}, "
+                f"max_records={self._max_records})")
+
+
+def _merged(old: Dict, new: Dict) -> Dict:
+    """
+    Deep merge of dicts, like MERGE of SurrealDB: nested dicts are merged, other values are replaced
+    """
+    result = dict(old)
+    for key, value in new.items():
+        current = result.get(key)
+        result[key] = _merged(current, value) if isinstance(current, dict) and isinstance(value, dict) else value
+    return result
+
+
+def _failed(result: SurrealResult, chunk: List[Tuple[str, Pending]]) -> Tuple[Dict[str, Pending], Optional[str]]:
+    """
+    Finds failed records by results of statements
+    """
+    if result.is_error():
+        return dict(chunk), str(result.result)
+    statements = result.result if isinstance(result.result, list) and len(chunk) > 1 else [result]
+    failed, error = {}, None
+    for (key, value), statement in zip(chunk, statements):
+        status, text = _status(statement)
+        if status == ERR:
+            failed[key] = value
+            error = error or text
+    return failed, error
+
+
+def _status(statement: Any) -> Tuple[Optional[str], Any]:
+    if isinstance(statement, SurrealResult):
+        return statement.status, statement.result
+    if isinstance(statement, dict):
+        return statement.get("status"), statement.get("result")
+    return None, None
@@ -0,0 +1,171 @@
+from unittest import TestCase, main
+
+from surrealist.errors import CircuitOpenError, SurrealConnectionError, WrongParameterError
+from surrealist.ql.bulk import AdaptiveBatcher, batches, bulk_insert
+from surrealist.result import SurrealResult
+from tests.unit_tests.utils import FakeConnection
+
+
+def inserted(_query, _variables):
+    return SurrealResult(result=[], time="1.5ms")
+
+
+def connection_with(failures=0, error=SurrealConnectionError):
+    return FakeConnection(inserted, failures=failures, error=error)
+
+
+class TestBulk(TestCase):
+    def test_batches(self):
+        result = list(batches(({"n": i} for i in range(5)), batch_size=2, max_bytes=1000))
+        self.assertEqual([2, 2, 1], [len(batch) for batch, _, _ in result])
+        self.assertEqual(['{"n": 0}', '{"n": 1}'], result[0][1])
+
+    def test_batches_by_size(self):
+        records = [{"text": "x" * 10}, {"text": "y" * 10}, {"text": "z" * 100}]
+        result = list(batches(records, batch_size=100, max_bytes=50))
+        self.assertEqual([2, 1], [len(batch) for batch, _, _ in result])
+
+    def test_batches_with_ids(self):
+        records = [{"n": 1}, {"id": "person:2", "n": 2}]
+        result = list(batches(records, 10, 1000, id_generator=lambda: "x"))
+        self.assertEqual([{"id": "x", "n": 1}, {"id": "person:2", "n": 2}], result[0][0])
+        self.assertEqual({"n": 1}, records[0])
+
+    def test_bulk_insert(self):
+        connection = connection_with()
+        stats = bulk_insert(connection, "person", ({"n": i} for i in range(1000)), batch_size=100, concurrency=3)
+        self.assertEqual(10, len(connection.queries))
+        self.assertTrue(connection.queries[0].startswith('INSERT INTO person [{"n": '))
+        self.assertEqual(1000, stats["records"])
+        self.assertEqual(10, stats["batches"])
+        self.assertEqual(0, stats["failed_batches"])
+        self.assertEqual(sum(len(q) for q in connection.queries), stats["bytes"])
+
+    def test_ignore_and_duplicate(self):
+        connection = connection_with()
+        bulk_insert(connection, "person", [{"n": 1}], ignore=True)
+        bulk_insert(connection, "person", [{"n": 1}], on_duplicate="count += 1")
+        self.assertEqual(['INSERT IGNORE INTO person [{"n": 1}];',
+                          'INSERT INTO person [{"n": 1}] ON DUPLICATE KEY UPDATE count += 1;'], connection.queries)
+        with self.assertRaises(WrongParameterError):
+            bulk_insert(connection, "person", [], ignore=True, on_duplicate="count += 1")
+
+    def test_retries(self):
+        connection = connection_with(failures=2)
+        stats = bulk_insert(connection, "person", [{"id": "person:1"}], retries=2, retry_delay=0.001)
+        self.assertEqual(1, stats["records"])
+        self.assertEqual(2, stats["retries"])
+        retry = 'INSERT IGNORE INTO person [{"id": "person:1"}];'
+        self.assertEqual(['INSERT INTO person [{"id": "person:1"}];', retry, retry], connection.queries)
+        connection = connection_with(failures=3)
+        failed = []
+        stats = bulk_insert(connection, "person", [{"n": 1}], retries=2, id_generator=lambda: "person:x",
+                            retry_delay=0.001, on_error=lambda batch, error: failed.append(batch))
+        self.assertEqual(1, stats["failed_records"])
+        self.assertEqual(["SurrealConnectionError: connection lost"], stats["errors"])
+        self.assertEqual([[{"id": "person:x", "n": 1}]], failed)
+
+    def test_no_retries_without_ids(self):
+        connection = connection_with(failures=1)
+        stats = bulk_insert(connection, "person", [{"n": 1}], retries=2, retry_delay=0.001)
+        self.assertEqual(1, len(connection.queries))
+        self.assertEqual(1, stats["failed_records"])
+        self.assertIn("may be written", stats["errors"][0])
+        connection = connection_with(failures=1)
+        bulk_insert(connection, "person", [{"id": "person:1"}], retries=2, retry_delay=0.001, on_duplicate="n += 1")
+        self.assertEqual(1, len(connection.queries))
+
+    def test_retries_before_sending(self):
+        connection = connection_with(failures=2, error=CircuitOpenError)
+        stats = bulk_insert(connection, "person", [{"n": 1}], retries=2, retry_delay=0.001)
+        self.assertEqual(1, stats["records"])
+        self.assertEqual(['INSERT INTO person [{"n": 1}];'] * 3, connection.queries)
+
+    def test_error_result_is_not_retried(self):
+        connection = FakeConnection(lambda _query, _variables: SurrealResult(error="Database record already exists"))
+        stats = bulk_insert(connection, "person", [{"n": 1}], retries=2, retry_delay=0.001)
+        self.assertEqual(1, len(connection.queries))
+        self.assertEqual(1, stats["failed_batches"])
+        self.assertEqual(0, stats["records"])
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            bulk_insert(None, "person", [], batch_size=0)
+        with self.assertRaises(ValueError):
+            bulk_insert(None, "person", [], retries=-1)
+
+    def test_relation(self):
+        connection = connection_with()
+        bulk_insert(connection, "likes", [{"in": "user:1", "out": "post:1"}], relation=True)
+        self.assertEqual(['INSERT RELATION INTO likes [{"in": "user:1", "out": "post:1"}];'], connection.queries)
+
+    def test_adaptive_batches(self):
+        batcher = AdaptiveBatcher(initial_size=2, min_size=1)
+        result = []
+        for batch, _, _ in batches(({"n": i} for i in range(20)), batcher, 1000):
+            result.append(len(batch))
+            batcher.observe(len(batch), 100, 0.001)
+        self.assertEqual([2, 4, 8, 6], result)
+
+    def test_bulk_insert_with_batcher(self):
+        batcher = AdaptiveBatcher(initial_size=10, min_size=1)
+        stats = bulk_insert(connection_with(), "person", ({"n": i} for i in range(200)), batcher, concurrency=1)
+        self.assertEqual(200, stats["records"])
+        self.assertLess(stats["batches"], 20)
+        self.assertEqual(stats["batches"], stats["batcher"]["batches"])
+
+
+class TestAdaptiveBatcher(TestCase):
+    def test_grows_to_target(self):
+        batcher = AdaptiveBatcher(initial_size=100, target_latency=1.0, growth=2.0)
+        batcher.observe(100, 1000, 0.1)  # 1ms per record
+        self.assertEqual(200, batcher.size)
+        for _ in range(10):
+            batcher.observe(batcher.size, batcher.size * 10, batcher.size * 0.001)
+        self.assertEqual(1000, batcher.size)
+
+    def test_server_time_and_overhead(self):
+        batcher = AdaptiveBatcher(initial_size=100, target_latency=1.0, growth=10.0)
+        batcher.observe(100, 1000, 0.3, server_time=0.1)  # 0.2 seconds of network, 1ms per record on the server
+        self.assertEqual(800, batcher.size)
+        batcher = AdaptiveBatcher(initial_size=100, target_latency=1.0, growth=10.0)
+        batcher.observe_result(SurrealResult(result=[], time="100ms"), 100, 1000, 0.3)
+        self.assertEqual(800, batcher.size)
+
+    def test_bytes(self):
+        batcher = AdaptiveBatcher(initial_size=100, max_bytes=10_000, growth=10.0)
+        batcher.observe(100, 5_000, 0.01)
+        self.assertEqual(200, batcher.size)
+
+    def test_backoff(self):
+        changes = []
+        batcher = AdaptiveBatcher(initial_size=100, target_latency=1.0, on_change=lambda old, new: changes.append(new))
+        batcher.observe(100, 1000, 2.0)
+        self.assertEqual(50, batcher.size)
+        batcher.observe(50, 1000, 0.1, failed=True)
+        self.assertEqual(25, batcher.size)
+        batcher.observe_result(SurrealResult(error="timeout"), 25, 1000, 0.1)
+        self.assertEqual(12, batcher.size)
+        self.assertEqual([50, 25, 12], changes)
+        self.assertEqual(2, batcher.stats()["failed"])
+
+    def test_limits(self):
+        batcher = AdaptiveBatcher(initial_size=100, min_size=50, max_size=150, growth=10.0)
+        batcher.observe(100, 100, 0.001)
+        self.assertEqual(150, batcher.size)
+        batcher.observe(100, 100, 10.0)
+        self.assertEqual(75, batcher.size)
+        batcher.observe(100, 100, 10.0)
+        self.assertEqual(50, batcher.size)
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            AdaptiveBatcher(min_size=0)
+        with self.assertRaises(ValueError):
+            AdaptiveBatcher(growth=1.0)
+        with self.assertRaises(ValueError):
+            AdaptiveBatcher(backoff=1.0)
+
+
+if __name__ == '__main__':
+    main()
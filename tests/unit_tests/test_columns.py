@@ -0,0 +1,91 @@
+import math
+from array import array
+from unittest import TestCase, main, skipUnless
+
+from surrealist import SurrealResult
+from surrealist.columns import infer_schema, to_columns
+from surrealist.ql.statements.select import Select
+from tests.unit_tests.utils import FakeConnection
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+records = [
+    {"id": "person:1", "age": 33, "score": 1.5, "active": True, "address": {"city": "Paris"}},
+    {"id": "person:2", "age": 22, "score": None, "active": False},
+    {"id": "person:3", "age": None, "score": 2, "active": True, "address": {"city": "Rome"}},
+]
+
+
+class TestColumns(TestCase):
+    def test_infer_schema(self):
+        self.assertEqual({"id": "str", "age": "int", "score": "float", "active": "bool", "address": "object"},
+                         infer_schema(records))
+
+    def test_to_columns(self):
+        columns = SurrealResult(result=records).to_columns()
+        self.assertEqual(["person:1", "person:2", "person:3"], columns["id"])
+        self.assertEqual([33, 22, None], columns["age"])
+        self.assertEqual(array("b", [True, False, True]), columns["active"])
+        self.assertEqual("d", columns["score"].typecode)
+        self.assertTrue(math.isnan(columns["score"][1]))
+
+    def test_projection_and_fill(self):
+        columns = to_columns(records, fields=["age", "address.city"], fill=0)
+        self.assertEqual(["age", "address.city"], list(columns))
+        self.assertEqual(array("q", [33, 22, 0]), columns["age"])
+        self.assertEqual(["Paris", 0, "Rome"], columns["address.city"])
+
+    def test_schema(self):
+        columns = to_columns(records, schema={"score": "float", "id": "object"})
+        self.assertEqual(["score", "id"], list(columns))
+        with self.assertRaises(ValueError):
+            to_columns(records, schema={"score": "decimal"})
+
+    def test_single_and_empty(self):
+        self.assertEqual({"a": array("q", [1])}, SurrealResult(result={"a": 1}).to_columns())
+        self.assertEqual({}, SurrealResult(result=[]).to_columns())
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            SurrealResult(error="some").to_columns()
+        with self.assertRaises(ValueError):
+            SurrealResult(result=[1, 2]).to_columns()
+
+    def test_iter_columns(self):
+        pages = [[{"a": 1, "b": "x"}, {"a": 2, "b": "y"}], [{"a": 3, "b": None}]]
+        select = Select(FakeConnection(pages=pages), "person")
+        result = list(select.iter_columns(limit=2))
+        self.assertEqual([{"a": array("q", [1, 2]), "b": ["x", "y"]}, {"a": array("q", [3]), "b": [None]}], result)
+
+    def test_iter_columns_wider_pages(self):
+        pages = [[{"a": 1}, {"a": 2}], [{"a": 3.5}, {"a": 4}], [{"a": 2 ** 70}, {"a": 5}], [{"a": "x"}]]
+        result = list(Select(FakeConnection(pages=pages), "person").iter_columns(limit=2))
+        self.assertEqual([array("q", [1, 2]), array("d", [3.5, 4.0]), [2 ** 70, 5], ["x"]],
+                         [columns["a"] for columns in result])
+
+    def test_fill_wider_than_type(self):
+        columns = SurrealResult(result=[{"a": 1}, {"a": None}]).to_columns(fill=0.5)
+        self.assertEqual(array("d", [1.0, 0.5]), columns["a"])
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_to_numpy(self):
+        columns = SurrealResult(result=records).to_numpy(fields=["age", "active"])
+        self.assertEqual("float64", str(columns["age"].dtype))
+        self.assertEqual("bool", str(columns["active"].dtype))
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_to_numpy_int_with_floats(self):
+        columns = SurrealResult(result=[{"a": 1}, {"a": 2.5}, {"a": 3}]).to_numpy(schema={"a": "int"})
+        self.assertEqual("float64", str(columns["a"].dtype))
+        self.assertEqual([1.0, 2.5, 3.0], columns["a"].tolist())
+        columns = SurrealResult(result=[{"a": 1}, {"a": None}]).to_numpy(fill=0.5)
+        self.assertEqual([1.0, 0.5], columns["a"].tolist())
+        columns = SurrealResult(result=[{"a": 1}, {"a": 2.0}]).to_numpy(schema={"a": "int"})
+        self.assertEqual("int64", str(columns["a"].dtype))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import datetime
+from unittest import TestCase, main, skipUnless
+
+from surrealist import RecordId, ResultConverter, SurrealResult
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CREATED = "2024-01-24T11:31:06.347880800Z"
+
+
+def records():
+    return [{"id": "person:1", "created": CREATED, "friends": ["person:2"], "name": "John", "note": "a:b c",
+             "lang": "en:US"},
+            {"id": "person:⟨a-b⟩", "created": None, "friends": [], "name": "Jane", "note": None, "lang": "fr:FR"}]
+
+
+class TestConverters(TestCase):
+    def test_detect(self):
+        self.assertEqual({"id": "record_id", "created": "datetime"}, ResultConverter().detect(records()))
+        self.assertEqual({"id": "record_id", "created": "datetime", "friends": "record_ids"},
+                         ResultConverter(id_fields=["friends"]).detect(records()))
+        self.assertEqual({"name": "record_id"}, ResultConverter({"name": "record_id"}, detect=False).detect(records()))
+        with self.assertRaises(ValueError):
+            ResultConverter({"name": "int"})
+
+    def test_convert(self):
+        for use_numpy in (False, True):
+            with self.subTest(f"numpy {use_numpy}"):
+                converter = ResultConverter(use_numpy=use_numpy, id_fields=["friends"])
+                result = SurrealResult(result=records()).convert(converter).result
+                self.assertEqual(datetime.datetime(2024, 1, 24, 11, 31, 6, 347880), result[0]["created"])
+                self.assertIsNone(result[1]["created"])
+                self.assertEqual("a-b", result[1]["id"].id_part)
+                self.assertIsInstance(result[0]["friends"][0], RecordId)
+                self.assertEqual("a:b c", result[0]["note"])
+                self.assertEqual("en:US", result[0]["lang"])
+
+    def test_wrong_values_stay(self):
+        converter = ResultConverter({"created": "datetime"}, use_numpy=False)
+        self.assertEqual([{"created": "yesterday"}], converter.convert([{"created": "yesterday"}]))
+
+    def test_record_ids_cached(self):
+        converter = ResultConverter()
+        self.assertIs(converter.record_id("person:1"), converter.record_id("person:1"))
+        self.assertEqual("text", converter.record_id("text"))
+
+    def test_convert_columns(self):
+        columns = SurrealResult(result=records()).to_columns(fields=["id", "created"])
+        ResultConverter(use_numpy=False).convert_columns(columns)
+        self.assertEqual([datetime.datetime(2024, 1, 24, 11, 31, 6, 347880), None], columns["created"])
+        self.assertEqual("person:1", columns["id"][0].naive_id)
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_convert_numpy_columns(self):
+        columns = ResultConverter().convert_columns(SurrealResult(result=records()).to_numpy(fields=["id", "created"]))
+        self.assertEqual("datetime64[us]", str(columns["created"].dtype))
+        self.assertTrue(numpy.isnat(columns["created"][1]))
+        self.assertIsInstance(columns["id"][0], RecordId)
+
+
+if __name__ == '__main__':
+    main()
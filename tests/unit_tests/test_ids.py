@@ -0,0 +1,83 @@
+import time
+import uuid
+from threading import Thread
+from unittest import TestCase, main
+
+from surrealist import SnowflakeGenerator, UlidGenerator, Uuid7Generator, get_ulid, get_uuid7
+from surrealist.errors import WrongParameterError
+from surrealist.ql.table import Table
+
+
+class TestIds(TestCase):
+    def test_ulid(self):
+        ids = [get_ulid() for _ in range(1000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(1000, len(set(ids)))
+        self.assertTrue(all(len(id_) == 26 and id_.isalnum() and id_.isupper() for id_ in ids))
+
+    def test_uuid7(self):
+        ids = [get_uuid7() for _ in range(1000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(1000, len(set(ids)))
+        parsed = uuid.UUID(ids[0])
+        self.assertEqual(7, parsed.version)
+        self.assertEqual(uuid.RFC_4122, parsed.variant)
+
+    def test_snowflake(self):
+        generator = SnowflakeGenerator(5)
+        ids = [generator() for _ in range(10_000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(10_000, len(set(ids)))
+        self.assertTrue(all(0 < id_ < 2 ** 63 and (id_ >> 12) & 1023 == 5 for id_ in ids))
+        self.assertEqual("SnowflakeGenerator(node=5)", repr(generator))
+
+    def test_snowflake_wrong(self):
+        with self.assertRaises(ValueError):
+            SnowflakeGenerator(1024)
+        with self.assertRaises(ValueError):
+            SnowflakeGenerator(-1)
+        with self.assertRaises(ValueError):
+            SnowflakeGenerator(1, node_bits=12, sequence_bits=12)
+        with self.assertRaises(ValueError):
+            SnowflakeGenerator(1, epoch_ms=int(time.time() * 1000) + 60_000)
+
+    def test_threads(self):
+        for generator in (UlidGenerator(), Uuid7Generator(), SnowflakeGenerator(1, sequence_bits=4)):
+            with self.subTest(f"{generator}"):
+                results = []
+
+                def work():
+                    results.extend(generator() for _ in range(500))
+
+                threads = [Thread(target=work) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(2000, len(set(results)))
+
+    def test_table_create(self):
+        text = Table("person", None).create(id_generator=lambda: 1).to_str()
+        self.assertEqual("CREATE person:1;", text)
+        text = Table("person", None).create("john", id_generator=lambda: 1).to_str()
+        self.assertEqual("CREATE person:john;", text)
+
+    def test_table_insert(self):
+        data = [{"name": "John"}, {"id": 7, "name": "Jane"}]
+        text = Table("person", None).insert(data, id_generator=lambda: 1).to_str()
+        self.assertEqual('INSERT INTO person [{"id": 1, "name": "John"}, {"id": 7, "name": "Jane"}];', text)
+        self.assertEqual({"name": "John"}, data[0])
+        text = Table("person", None).insert({"name": "John"}, id_generator=lambda: "a").to_str()
+        self.assertEqual('INSERT INTO person {"id": "a", "name": "John"};', text)
+        text = Table("person", None).insert(("name",), ("John",), ("Jane",), id_generator=iter((1, 2)).__next__).to_str()
+        self.assertEqual('INSERT INTO person (id, name) VALUES (1, "John"), (2, "Jane");', text)
+
+    def test_table_insert_wrong(self):
+        with self.assertRaises(WrongParameterError):
+            Table("person", None).insert(id_generator=lambda: 1)
+        with self.assertRaises(WrongParameterError):
+            Table("person", None).insert("name", ("John",), id_generator=lambda: 1)
+
+
+if __name__ == '__main__':
+    main()
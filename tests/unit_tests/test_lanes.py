@@ -0,0 +1,145 @@
+import threading
+import time
+from unittest import TestCase, main
+
+from surrealist import Lane
+from surrealist.connections.lanes import LaneScheduler
+from surrealist.connections.pool import Pool
+from surrealist.errors import ConcurrencyLimitError, WrongParameterError
+from surrealist.ql.bulk import bulk_insert
+from surrealist.ql.parallel_scan import ParallelScan
+from surrealist.ql.statements.select import Select
+from surrealist.result import SurrealResult
+
+
+class LaneConnection:
+    """
+    Remembers the lane of the pool for each query
+    """
+
+    def __init__(self):
+        self.pool = None
+        self.lanes = []
+
+    def query(self, query, variables=None):
+        self.lanes.append(self.pool.current_lane())
+        return SurrealResult(result=[])
+
+    def close(self):
+        pass
+
+
+class FixedPool(Pool):
+    def _start(self):
+        pass
+
+    def _create_new_connection(self):
+        pass
+
+
+def lane_pool(timeout=5):
+    connection = LaneConnection()
+    pool = FixedPool(connection, "http://127.0.0.1:8000", max_connections=2, timeout=timeout,
+                     lanes=[Lane("interactive", reserved=1), Lane("batch")])
+    connection.pool = pool
+    return pool, connection
+
+
+class TestLanes(TestCase):
+    def test_default_lane_added(self):
+        scheduler = LaneScheduler([Lane("batch")], 4)
+        self.assertEqual(["batch", "default"], scheduler.lanes)
+
+    def test_wrong_lanes(self):
+        with self.assertRaises(ValueError):
+            LaneScheduler([Lane("a"), Lane("a")], 4)
+        with self.assertRaises(ValueError):
+            LaneScheduler([Lane("a", reserved=3), Lane("b", reserved=2)], 4)
+        with self.assertRaises(ValueError):
+            Lane("a", weight=0)
+        with self.assertRaises(WrongParameterError):
+            LaneScheduler([Lane("a")], 4).acquire("b")
+
+    def test_reserved_capacity(self):
+        scheduler = LaneScheduler([Lane("interactive", reserved=1), Lane("batch")], 3)
+        self.assertTrue(scheduler.acquire("batch", 0))
+        self.assertTrue(scheduler.acquire("batch", 0))
+        # the last slot is reserved for interactive lane
+        self.assertFalse(scheduler.acquire("batch", 0.01))
+        self.assertTrue(scheduler.acquire("interactive", 0))
+        self.assertFalse(scheduler.acquire("interactive", 0.01))
+        scheduler.release("batch")
+        self.assertTrue(scheduler.acquire("interactive", 0))
+        self.assertEqual(2, scheduler.stats()["interactive"]["in_use"])
+
+    def test_weighted_fair(self):
+        scheduler = LaneScheduler([Lane("interactive", weight=3), Lane("batch", weight=1)], 1)
+        self.assertTrue(scheduler.acquire("batch", 0))
+        order = []
+
+        def worker(name):
+            scheduler.acquire(name)
+            order.append(name)
+            scheduler.release(name)
+
+        threads = [threading.Thread(target=worker, args=(name,)) for name in ["batch"] * 4 + ["interactive"] * 4]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        scheduler.release("batch")
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(8, len(order))
+        self.assertEqual(4, order[:6].count("interactive"))
+
+    def test_timeouts_of_waiters(self):
+        scheduler = LaneScheduler([Lane("a")], 1)
+        self.assertTrue(scheduler.acquire("a", 0))
+        results = {}
+
+        def wait(name, timeout):
+            results[name] = scheduler.acquire("a", timeout)
+
+        first = threading.Thread(target=wait, args=("first", 0.3))
+        first.start()
+        time.sleep(0.05)
+        second = threading.Thread(target=wait, args=("second", 0.05))
+        second.start()
+        second.join()
+        first.join()
+        self.assertEqual({"first": False, "second": False}, results)
+        scheduler.release("a")
+        self.assertEqual((0, 0), (scheduler.stats()["a"]["in_use"], scheduler.stats()["a"]["waiting"]))
+        self.assertTrue(scheduler.acquire("a", 0))
+
+
+class TestPoolLanes(TestCase):
+    def test_run_in_lane(self):
+        pool, connection = lane_pool()
+        Select(pool, "person").run(lane="batch")
+        Select(pool, "person").run()
+        self.assertEqual(["batch", "default"], connection.lanes)
+        with self.assertRaises(WrongParameterError):
+            Select(LaneConnection(), "person").run(lane="batch")
+
+    def test_worker_threads_keep_lane(self):
+        pool, connection = lane_pool()
+        with pool.lane("batch"):
+            stream = Select(pool, "person").stream(page_size=10)
+            pages = Select(pool, "person").iter(limit=10, key="id")
+            bulk_insert(pool, "person", [{"n": 1}, {"n": 2}], batch_size=1, concurrency=2)
+            ParallelScan(pool, "person", 2, boundaries=[5]).run(lambda index, records: None)
+        list(stream)
+        list(pages)
+        self.assertEqual(["batch"] * 6, connection.lanes)
+
+    def test_lane_timeout(self):
+        pool, _ = lane_pool(timeout=0.05)
+        pool._lanes.acquire("batch")
+        with self.assertRaises(ConcurrencyLimitError):
+            Select(pool, "person").run(lane="batch")
+        self.assertEqual([], Select(pool, "person").run(lane="interactive").result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import time
+from unittest import TestCase, main
+
+from surrealist import AimdLimiter, CircuitBreaker, CircuitOpenError, CircuitState, GradientLimiter
+
+
+class TestLimits(TestCase):
+    def test_aimd_grows_and_shrinks(self):
+        changes = []
+        limiter = AimdLimiter(initial_limit=4, max_limit=10, target_latency=0.1,
+                              on_change=lambda old, new: changes.append((old, new)))
+        for _ in range(20):
+            self.assertTrue(limiter.acquire(0))
+            limiter.release(0.01)
+        self.assertTrue(limiter.limit > 4)
+        grown = limiter.limit
+        self.assertTrue(limiter.acquire(0))
+        limiter.release(1.0)
+        self.assertTrue(limiter.limit < grown)
+        self.assertTrue(changes)
+        self.assertEqual(0, limiter.in_flight)
+
+    def test_aimd_bounds(self):
+        limiter = AimdLimiter(initial_limit=2, min_limit=2, max_limit=3, target_latency=0.1)
+        for _ in range(50):
+            limiter.acquire(0)
+            limiter.release(5, failed=True)
+        self.assertEqual(2, limiter.limit)
+        for _ in range(50):
+            limiter.acquire(0)
+            limiter.release(0.001)
+        self.assertEqual(3, limiter.limit)
+
+    def test_acquire_timeout(self):
+        limiter = AimdLimiter(initial_limit=1, max_limit=1)
+        self.assertTrue(limiter.acquire(0))
+        self.assertFalse(limiter.acquire(0.01))
+        self.assertEqual(1, limiter.stats()["rejected"])
+
+    def test_wrong_limits(self):
+        with self.assertRaises(ValueError):
+            AimdLimiter(min_limit=5, max_limit=2)
+        with self.assertRaises(ValueError):
+            AimdLimiter(backoff_ratio=1.5)
+
+    def test_gradient_shrinks_on_latency_growth(self):
+        limiter = GradientLimiter(initial_limit=20, max_limit=50)
+        for _ in range(20):
+            limiter.acquire(0)
+            limiter.release(0.01)
+        stable = limiter.limit
+        for _ in range(20):
+            limiter.acquire(0)
+            limiter.release(1.0)
+        self.assertTrue(limiter.limit < stable)
+
+    def test_breaker_opens_on_failures(self):
+        states = []
+        breaker = CircuitBreaker(window_size=10, min_calls=4, open_timeout=0.05, half_open_calls=1,
+                                 on_state_change=lambda old, new: states.append(new))
+        for _ in range(4):
+            breaker.before_call()
+            breaker.record(0.01, failed=True)
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        time.sleep(0.06)
+        breaker.before_call()
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state)
+        breaker.record(0.01)
+        self.assertEqual(CircuitState.CLOSED, breaker.state)
+        self.assertEqual([CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED], states)
+        self.assertEqual(1, breaker.stats()["rejected"])
+
+    def test_breaker_opens_on_slow_calls(self):
+        breaker = CircuitBreaker(slow_call_threshold=0.1, window_size=10, min_calls=5)
+        for _ in range(5):
+            breaker.before_call()
+            breaker.record(0.5)
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+        breaker.reset()
+        self.assertEqual(CircuitState.CLOSED, breaker.state)
+
+    def test_breaker_half_open_fails(self):
+        breaker = CircuitBreaker(window_size=2, min_calls=2, open_timeout=0.01)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record(0.01, failed=True)
+        time.sleep(0.02)
+        breaker.before_call()
+        breaker.record(0.01, failed=True)
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+        self.assertEqual(2, breaker.stats()["times_opened"])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main
+
+from surrealist.loader import RecordLoader
+from surrealist.record_id import RecordId
+from surrealist.result import SurrealResult
+from tests.unit_tests.utils import FakeConnection
+
+
+class TableConnection(FakeConnection):
+    """
+    Answers SELECT * FROM [ids] with known records, or with the error
+    """
+
+    def __init__(self, records, error=None):
+        super().__init__()
+        self.records = {record["id"]: record for record in records}
+        self.error = error
+
+    def answer(self, query, variables):
+        if self.error:
+            return SurrealResult(error=self.error)
+        ids = query[query.index("[") + 1:query.index("]")].split(", ")
+        return [self.records[e] for e in ids if e in self.records]
+
+
+PEOPLE = [{"id": f"person:{i}", "name": f"John {i}"} for i in range(10)] + [{"id": "book:1", "title": "Book"}]
+
+
+class TestLoader(TestCase):
+    def test_batch_and_deduplicate(self):
+        connection = TableConnection(PEOPLE)
+        loader = RecordLoader(connection, max_delay=0.01)
+        futures = loader.load_many(["person:1", "person:2", RecordId("person:1"), "person:99", "book:1"])
+        self.assertEqual("John 1", futures[0].result(1)["name"])
+        self.assertIs(futures[0], futures[2])
+        self.assertIsNone(futures[3].result(1))
+        self.assertEqual("Book", futures[4].result(1)["title"])
+        self.assertEqual(["SELECT * FROM [person:1, person:2, person:99];", "SELECT * FROM [book:1];"],
+                         connection.queries)
+
+    def test_threads(self):
+        connection = TableConnection(PEOPLE)
+        loader = RecordLoader(connection, max_delay=0.05)
+        with ThreadPoolExecutor(10) as executor:
+            names = list(executor.map(lambda i: loader.get(f"person:{i}", timeout=1)["name"], range(10)))
+        self.assertEqual([f"John {i}" for i in range(10)], names)
+        self.assertEqual(1, len(connection.queries))
+
+    def test_cache(self):
+        connection = TableConnection(PEOPLE)
+        loader = RecordLoader(connection)
+        self.assertEqual(["John 1", None], [e and e["name"] for e in loader.get_many(["person:1", "person:99"])])
+        self.assertEqual("John 1", loader.get("person:1")["name"])
+        self.assertEqual(1, len(connection.queries))
+        loader.prime("person:1", {"id": "person:1", "name": "Jack"})
+        self.assertEqual("Jack", loader.get("person:1")["name"])
+        loader.clear("person:1")
+        self.assertEqual("John 1", loader.get("person:1", timeout=1)["name"])
+        self.assertEqual({"loads": 5, "cache_hits": 2, "queries": 2, "records": 2}, loader.stats())
+
+    def test_no_cache(self):
+        connection = TableConnection(PEOPLE)
+        loader = RecordLoader(connection, cache=False)
+        loader.get_many(["person:1"])
+        loader.get_many(["person:1"])
+        self.assertEqual(2, len(connection.queries))
+
+    def test_max_batch(self):
+        connection = TableConnection(PEOPLE)
+        loader = RecordLoader(connection, max_delay=10, max_batch=3)
+        futures = loader.load_many(f"person:{i}" for i in range(3))
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(["SELECT * FROM [person:0, person:1, person:2];"], connection.queries)
+
+    def test_error(self):
+        connection = TableConnection(PEOPLE, error="no access")
+        loader = RecordLoader(connection)
+        with self.assertRaises(ValueError):
+            loader.get_many(["person:1"])
+        connection.error = None
+        self.assertEqual("John 1", loader.get_many(["person:1"])[0]["name"])
+
+    def test_timer(self):
+        loader = RecordLoader(TableConnection(PEOPLE), max_delay=0.01)
+        future = loader.load("person:1")
+        time.sleep(0.2)
+        self.assertTrue(future.done())
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            RecordLoader(None, max_batch=0)
+
+
+if __name__ == '__main__':
+    main()
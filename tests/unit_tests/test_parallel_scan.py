@@ -0,0 +1,107 @@
+import re
+from unittest import TestCase, main
+
+from surrealist.ql.parallel_scan import ParallelScan, _split
+from tests.unit_tests.utils import FakeConnection
+
+
+class TableConnection(FakeConnection):
+    """
+    Table of records with numeric field n, understands only queries of the parallel scan
+    """
+
+    def __init__(self, size):
+        super().__init__()
+        self.records = [{"n": i, "name": f"user{i:04}"} for i in range(size)]
+
+    def answer(self, query, variables):
+        selected = re.match(r"SELECT VALUE (\w+) FROM", query)
+        if selected:
+            values = sorted(e[selected.group(1)] for e in self.records)
+            if "DESC" in query:
+                values.reverse()
+            if "rand()" not in query:
+                values = values[:1]
+            return values
+        low = re.search(r"n >= (\d+)", query)
+        high = re.search(r"n < (\d+)", query)
+        last = re.search(r"n > (\d+)", query)
+        limit = int(re.search(r"LIMIT (\d+)", query).group(1))
+        found = [e for e in self.records if (not low or e["n"] >= int(low.group(1))) and
+                 (not high or e["n"] < int(high.group(1))) and (not last or e["n"] > int(last.group(1)))]
+        return found[:limit]
+
+
+class TestParallelScan(TestCase):
+    def test_boundaries(self):
+        scan = ParallelScan(TableConnection(100), "person", 4, key="n")
+        self.assertEqual([25, 50, 75], scan.boundaries())
+        self.assertEqual([(None, 25), (25, 50), (50, 75), (75, None)], scan.ranges())
+        self.assertEqual("n >= 25 AND n < 50", scan.condition(1))
+
+    def test_boundaries_by_min_and_max(self):
+        connection = TableConnection(100)
+        ParallelScan(connection, "person", 4, key="n").boundaries()
+        self.assertEqual(["SELECT VALUE n FROM person ORDER BY n LIMIT 1;",
+                          "SELECT VALUE n FROM person ORDER BY n DESC LIMIT 1;"], connection.queries)
+
+    def test_boundaries_by_sample(self):
+        connection = TableConnection(100)
+        scan = ParallelScan(connection, "person", 4, key="name", where="age > 18")
+        self.assertEqual(["user0025", "user0050", "user0075"], scan.boundaries())
+        self.assertEqual("SELECT VALUE name FROM (SELECT name FROM person WHERE age > 18 ORDER BY rand() LIMIT 400) "
+                         "ORDER BY name;", connection.queries[-1])
+
+    def test_boundaries_of_record_ids(self):
+        self.assertEqual(["person:26", "person:51", "person:76"], _split("person:1", "person:100", 4))
+        self.assertEqual([2.5, 5.0, 7.5], _split(0.0, 10.0, 4))
+        self.assertIsNone(_split("person:1", "person:john", 4))
+        self.assertEqual([], _split(5, 5, 4))
+
+    def test_small_table(self):
+        scan = ParallelScan(TableConnection(2), "person", 4, key="n")
+        self.assertEqual([1], scan.boundaries())
+        scan = ParallelScan(TableConnection(0), "person", 4, key="n")
+        self.assertEqual([], scan.boundaries())
+        self.assertIsNone(scan.condition(0))
+        self.assertEqual([], list(scan))
+
+    def test_merged_iterator(self):
+        connection = TableConnection(1000)
+        reports = []
+        scan = ParallelScan(connection, "person", 4, key="n", page_size=100, progress=reports.append)
+        self.assertEqual(list(range(1000)), sorted(e["n"] for e in scan))
+        self.assertEqual({"partitions": 4, "finished": 4, "records": 1000, "per_partition": [250] * 4},
+                         scan.stats())
+        self.assertEqual(reports[-1], scan.stats())
+
+    def test_callbacks(self):
+        pages = {}
+        scan = ParallelScan(TableConnection(100), "person", 3, key="n", page_size=10, boundaries=[20, 60])
+        stats = scan.run(lambda index, records: pages.setdefault(index, []).extend(e["n"] for e in records))
+        self.assertEqual(list(range(20)), pages[0])
+        self.assertEqual(list(range(20, 60)), pages[1])
+        self.assertEqual(list(range(60, 100)), pages[2])
+        self.assertEqual(100, stats["records"])
+
+    def test_where_and_record_ids(self):
+        scan = ParallelScan(None, "person", 2, boundaries=["person:5"], where="age > 18")
+        self.assertEqual("(age > 18) AND id < person:5", scan.condition(0))
+        self.assertEqual("(age > 18) AND id >= person:5", scan.condition(1))
+
+    def test_error(self):
+        def fail(_index, _records):
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            ParallelScan(TableConnection(10), "person", 2, key="n", boundaries=[5]).run(fail)
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            ParallelScan(None, "person", 0)
+        with self.assertRaises(ValueError):
+            ParallelScan(None, "person", 2, page_size=0)
+
+
+if __name__ == '__main__':
+    main()
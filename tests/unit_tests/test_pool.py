@@ -0,0 +1,61 @@
+import threading
+import time
+from unittest import TestCase, main
+
+from surrealist import OperationOnClosedConnectionError
+from surrealist.connections.pool import Pool
+from tests.unit_tests.utils import FakeConnection
+
+
+def echo(query, _variables):
+    return query
+
+
+class OneConnectionPool(Pool):
+    def _start(self):
+        pass  # no new connections for tests
+
+
+class TestPool(TestCase):
+    def test_close_idle(self):
+        conn = FakeConnection(echo)
+        pool = OneConnectionPool(conn, "http://127.0.0.1:8000")
+        self.assertEqual("x", pool.query("x").result)
+        report = pool.close()
+        self.assertEqual({"drained": True, "closed_connections": 1, "running": []}, report)
+        self.assertTrue(conn.closed)
+        self.assertFalse(pool.is_connected())
+        with self.assertRaises(OperationOnClosedConnectionError):
+            pool.query("x")
+        self.assertEqual(0, pool.close()["closed_connections"])
+
+    def test_close_waits_in_flight(self):
+        conn = FakeConnection(echo, delay=0.1)
+        pool = OneConnectionPool(conn, "http://127.0.0.1:8000")
+        results = []
+        thread = threading.Thread(target=lambda: results.append(pool.query("x")))
+        thread.start()
+        time.sleep(0.02)
+        report = pool.close(timeout=1)
+        thread.join()
+        self.assertTrue(report["drained"])
+        self.assertEqual(1, len(results))
+        self.assertTrue(conn.closed)
+
+    def test_close_deadline_closes_busy(self):
+        conn = FakeConnection(echo, delay=0.3)
+        pool = OneConnectionPool(conn, "http://127.0.0.1:8000")
+        thread = threading.Thread(target=lambda: pool.query("x"), name="slow-one")
+        thread.start()
+        time.sleep(0.02)
+        report = pool.close(timeout=0.05)
+        self.assertFalse(report["drained"])
+        self.assertEqual(1, report["closed_connections"])
+        self.assertEqual("query", report["running"][0]["method"])
+        self.assertEqual("slow-one", report["running"][0]["thread"])
+        self.assertTrue(conn.closed)
+        thread.join()
+
+
+if __name__ == '__main__':
+    main()
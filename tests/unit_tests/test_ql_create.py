@@ -1,5 +1,7 @@
+import datetime
 from unittest import TestCase, main
 
+from surrealist import to_surreal_datetime_str
 from surrealist.ql.statements.create import Create
 
 
@@ -51,6 +53,15 @@ class TestCreate(TestCase):
         self.assertEqual('CREATE person SET age = 46, username = "john-smith" RETURN interests;',
                          Create(None, "person").set(age=46, username="john-smith").returns("interests").to_str())
 
+    def test_datetime_literals(self):
+        created = datetime.datetime(2024, 10, 23, 16, 6, 51, 322496)
+        text = "CREATE person CONTENT {\"name\": \"xxx\", \"created\": d'2024-10-23T16:06:51.322496Z'};"
+        self.assertEqual(text, Create(None, "person").content({"name": "xxx", "created": created}).to_str())
+        self.assertEqual(text, Create(None, "person").content({"name": "xxx",
+                                                               "created": to_surreal_datetime_str(created)}).to_str())
+        text = "CREATE person SET created = d'2024-10-23T16:06:51.322496Z';"
+        self.assertEqual(text, Create(None, "person").set(created=created).to_str())
+
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,7 @@ from unittest import TestCase, main
 from surrealist import RecordId
 from surrealist.ql.statements.insert import Insert
 from surrealist.ql.statements.select import Select
+from tests.unit_tests.utils import FakeConnection
 
 
 class TestInsert(TestCase):
@@ -56,6 +57,14 @@ class TestInsert(TestCase):
         self.assertEqual(text, insert.to_str())
         self.assertTrue(insert.is_valid())
 
+    def test_ignore(self):
+        text = 'INSERT IGNORE INTO product {"name": "Salesforce"};'
+        self.assertEqual(text, Insert(None, "product", {"name": "Salesforce"}).ignore().to_str())
+
+    def test_relation(self):
+        text = 'INSERT RELATION IGNORE INTO likes [{"in": "user:1", "out": "post:1"}];'
+        self.assertEqual(text, Insert(None, "likes", [{"in": "user:1", "out": "post:1"}]).relation().ignore().to_str())
+
     def test_duplicate(self):
         text = 'INSERT INTO product (name, url) VALUES ("Salesforce", "salesforce.com") ON DUPLICATE KEY UPDATE tags += \'crm\';'
         insert = Insert(None, "product", ("name", "url"), ('Salesforce', 'salesforce.com')).on_duplicate(
@@ -86,6 +95,25 @@ class TestInsert(TestCase):
         self.assertEqual(text, insert.to_str())
         self.assertTrue(insert.is_valid())
 
+    def test_compile(self):
+        records = [{"name": "John"}, {"name": "Jane"}]
+        self.assertEqual(("INSERT INTO person $__p1;", {"__p1": records}), Insert(None, "person", records).compile())
+        query, variables = Insert(None, "person", ("name", "age"), ("John", 1), ("Jane", RecordId("age:2"))).compile()
+        self.assertEqual('INSERT INTO person (name, age) VALUES ($__p1, $__p2), (\"Jane\", age:2);', query)
+        self.assertEqual({"__p1": "John", "__p2": 1}, variables)
+        self.assertEqual(Insert(None, "person", {"name": "John"}).compile()[0],
+                         Insert(None, "person", {"name": "Jane"}).compile()[0])
+
+    def test_compile_with_record_id(self):
+        data = {"name": "John", "author": RecordId("user:john")}
+        self.assertEqual(('INSERT INTO person {"name": "John", "author": user:john};', {}),
+                         Insert(None, "person", data).compile())
+
+    def test_run_parameterized(self):
+        insert = Insert(FakeConnection(lambda query, variables: [query, variables]), "person", {"name": "John"})
+        self.assertEqual(["INSERT INTO person $__p1;", {"__p1": {"name": "John"}}], insert.run(parameterized=True).result)
+        self.assertEqual(['INSERT INTO person {"name": "John"};', None], insert.run().result)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,60 @@
+from unittest import TestCase, main
+
+from surrealist.errors import WrongCallError
+from surrealist.ql.statements.select import Select
+from tests.unit_tests.utils import FakeConnection
+
+
+class TestKeyset(TestCase):
+    def test_pages(self):
+        connection = FakeConnection(pages=[[{"id": "person:1"}, {"id": "person:2"}], [{"id": "person:⟨a-b⟩"}]])
+        iterator = Select(connection, "person").where("age > 10").OR("admin = true").iter(limit=2, key="id")
+        self.assertIsNone(iterator.cursor)
+        self.assertEqual([2, 1], [result.count() for result in iterator])
+        self.assertEqual(["SELECT * FROM person WHERE (age > 10 OR admin = true) ORDER BY id LIMIT 2;",
+                          "SELECT * FROM person WHERE (age > 10 OR admin = true) AND id > person:2 ORDER BY id "
+                          "LIMIT 2;"], connection.queries)
+
+    def test_cursor(self):
+        connection = FakeConnection(pages=[[{"name": "a", "age": 1}], []])
+        select = Select(connection, "person", "name", "age").fetch("friends")
+        iterator = select.iter(limit=1, key="age")
+        next(iterator)
+        cursor = iterator.cursor
+        connection.pages = [[{"name": "b", "age": 2}]]
+        resumed = select.iter(limit=1, key="age", cursor=cursor)
+        self.assertEqual("b", next(resumed).result[0]["name"])
+        self.assertEqual("SELECT name, age FROM person WHERE age > 1 ORDER BY age LIMIT 1 FETCH friends;",
+                         connection.queries[-1])
+        with self.assertRaises(ValueError):
+            select.iter(limit=1, key="name", cursor=cursor)
+        with self.assertRaises(ValueError):
+            select.iter(limit=1, key="age", cursor="wrong")
+        with self.assertRaises(ValueError):
+            select.iter(limit=1, cursor=cursor)
+
+    def test_empty_and_missing_key(self):
+        self.assertEqual([], list(Select(FakeConnection(pages=[]), "person").iter(key="id")))
+        with self.assertRaises(ValueError):
+            list(Select(FakeConnection(pages=[[{"name": "a"}]]), "person", "name").iter(key="id"))
+
+    def test_not_moving_cursor(self):
+        page = [{"id": "person:1"}, {"id": "person:⟨2⟩"}]
+        connection = FakeConnection(pages=[page, page, page])
+        with self.assertRaises(ValueError) as error:
+            list(Select(connection, "person").iter(limit=2, key="id"))
+        self.assertIn("key id", str(error.exception))
+        self.assertEqual(2, len(connection.queries))
+        connection = FakeConnection(pages=[[{"n": 1}, {"n": 5}], [{"n": 6}, {"n": 3}]])
+        with self.assertRaises(ValueError):
+            list(Select(connection, "person").iter(limit=2, key="n"))
+
+    def test_wrong_clauses(self):
+        with self.assertRaises(WrongCallError):
+            Select(None, "person").order_by("name").iter(key="id")
+        with self.assertRaises(WrongCallError):
+            Select(None, "person").limit(10).iter(key="id")
+
+
+if __name__ == '__main__':
+    main()
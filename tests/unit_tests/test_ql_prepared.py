@@ -0,0 +1,44 @@
+from unittest import TestCase, main
+
+from surrealist.errors import WrongParameterError
+from surrealist.ql.statements import PreparedStatement
+from surrealist.ql.statements.insert import Insert
+from surrealist.ql.statements.select import Select
+from tests.unit_tests.utils import FakeConnection
+
+
+def variables_connection():
+    return FakeConnection(lambda _query, variables: variables)
+
+
+class TestPrepared(TestCase):
+    def test_prepare_select(self):
+        connection = variables_connection()
+        prepared = Select(connection, "person", "name").where("age > $age").prepare()
+        self.assertEqual("SELECT name FROM person WHERE age > $age;", prepared.query)
+        self.assertEqual({"age": 18}, prepared.run(age=18).result)
+        self.assertEqual([{"age": 1}, {"age": 2}], [e.result for e in prepared.run_many([{"age": 1}, {"age": 2}])])
+        self.assertEqual(3, len(connection.queries))
+        self.assertEqual({prepared.query}, set(connection.queries))
+
+    def test_prepare_values(self):
+        connection = variables_connection()
+        prepared = Insert(connection, "person", {"name": "John"}).prepare()
+        self.assertEqual("INSERT INTO person $__p1;", str(prepared))
+        self.assertEqual({"__p1": {"name": "John"}}, prepared.run().result)
+        self.assertEqual({"__p1": [{"name": "Jane"}]}, prepared.run(__p1=[{"name": "Jane"}]).result)
+        self.assertEqual({"__p1": {"name": "John"}}, prepared.variables)
+
+    def test_not_parameterized(self):
+        prepared = Insert(variables_connection(), "person", {"name": "John"}).prepare(parameterized=False)
+        self.assertEqual('INSERT INTO person {"name": "John"};', prepared.query)
+        self.assertEqual({}, prepared.run().result)
+
+    def test_unknown_variable(self):
+        prepared = PreparedStatement(variables_connection(), "SELECT * FROM person WHERE age > $age;")
+        with self.assertRaises(WrongParameterError):
+            prepared.run(name="John")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import time
+from unittest import TestCase, main
+
+from surrealist.ql.statements.select import Select
+from tests.unit_tests.utils import FakeConnection
+
+
+class TestStream(TestCase):
+    def test_records(self):
+        connection = FakeConnection(pages=[[{"id": 1}, {"id": 2}], [{"id": 3}]])
+        records = list(Select(connection, "person").stream(page_size=2))
+        self.assertEqual([1, 2, 3], [record["id"] for record in records])
+        self.assertEqual(2, len(connection.queries))
+
+    def test_prefetch_is_bounded(self):
+        connection = FakeConnection(pages=[[{"id": i}] for i in range(20)])
+        stream = Select(connection, "person").stream(page_size=1, prefetch=2)
+        self.assertEqual({"id": 0}, next(stream))
+        time.sleep(0.3)
+        self.assertLessEqual(len(connection.queries), 4)
+        stream.close()
+        time.sleep(0.3)
+        self.assertLessEqual(len(connection.queries), 5)
+
+    def test_error(self):
+        connection = FakeConnection(pages=[[{"id": 1}], ValueError("boom")])
+        stream = Select(connection, "person").stream(page_size=1)
+        self.assertEqual({"id": 1}, next(stream))
+        with self.assertRaises(ValueError):
+            next(stream)
+
+    def test_wrong_prefetch(self):
+        with self.assertRaises(ValueError):
+            Select(None, "person").stream(prefetch=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -93,6 +93,19 @@ class TestUpdate(TestCase):
         self.assertEqual(text, upd.to_str())
         self.assertTrue(upd.is_valid())
 
+    def test_compile(self):
+        query, variables = Update(None, "person").set(name="John", age=30).where("age > 20").compile()
+        self.assertEqual("UPDATE person SET name = $__p1, age = $__p2 WHERE age > 20;", query)
+        self.assertEqual({"__p1": "John", "__p2": 30}, variables)
+        query, variables = Update(None, "person", "tobie").merge({"tags": ["a"]}).compile()
+        self.assertEqual(("UPDATE person:tobie MERGE $__p1;", {"__p1": {"tags": ["a"]}}), (query, variables))
+        self.assertEqual("UPDATE person SET name = \"John\";", Update(None, "person").set(name="John").to_str())
+
+    def test_compile_with_own_variables(self):
+        query, variables = Update(None, "person").set(name="John").where("age > $p1").compile()
+        self.assertEqual("UPDATE person SET name = $__p1 WHERE age > $p1;", query)
+        self.assertEqual({"__p1": "John"}, variables)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,151 @@
+import time
+from unittest import TestCase, main
+
+from surrealist.errors import CompatibilityError
+from surrealist.ql.table import Table
+from surrealist.query_cache import QueryCache, read_tables
+from surrealist.result import SurrealResult
+from tests.unit_tests.utils import FakeConnection
+
+
+class LiveConnection(FakeConnection):
+    """
+    Answers each query with its number, keeps callbacks of live queries
+    """
+
+    def __init__(self, live=True):
+        super().__init__()
+        self.live = live
+        self.callbacks = {}
+        self.killed = []
+
+    def answer(self, query, variables):
+        return [{"n": len(self.queries)}]
+
+    def custom_live(self, query, callback):
+        if not self.live:
+            raise CompatibilityError("no live")
+        table = query.split(" FROM ")[1][:-1]
+        self.callbacks[table] = callback
+        return SurrealResult(result=f"live-{table}")
+
+    def kill(self, live_id):
+        self.killed.append(live_id)
+        return SurrealResult(result=None)
+
+    def count(self, table):
+        return SurrealResult(result=7)
+
+
+class TestQueryCache(TestCase):
+    def test_read_tables(self):
+        self.assertEqual({"person"}, read_tables("SELECT * FROM person WHERE age > 18"))
+        self.assertEqual({"person", "book"}, read_tables("SELECT * FROM person:john, book"))
+        self.assertEqual({"person"}, read_tables("SELECT * FROM ONLY person:john"))
+        self.assertIsNone(read_tables("SELECT * FROM (SELECT * FROM person)"))
+        self.assertIsNone(read_tables("SELECT ->likes->post FROM person"))
+        self.assertIsNone(read_tables("SELECT * FROM person FETCH author"))
+        self.assertIsNone(read_tables("SELECT time::now() FROM person"))
+        self.assertIsNone(read_tables("SELECT author.name FROM post"))
+        self.assertIsNone(read_tables("SELECT * FROM post WHERE author.age > 18"))
+        self.assertIsNone(read_tables("SELECT * FROM post WHERE id IN (SELECT VALUE post FROM likes)"))
+        self.assertIsNone(read_tables("SELECT fn::score(id) FROM post"))
+        self.assertIsNone(read_tables("SELECT * FROM post ORDER BY rand()"))
+
+    def test_other_sources_not_cached(self):
+        self.assertIsNone(read_tables("SELECT * FROM type::table($tb)"))
+        self.assertIsNone(read_tables("SELECT * FROM $records"))
+        self.assertIsNone(read_tables("SELECT * FROM person, $records"))
+        self.assertIsNone(read_tables("SELECT * FROM a, (b)"))
+        self.assertIsNone(read_tables("SELECT * FROM [person:john, person:jane]"))
+        self.assertIsNone(read_tables("SELECT * FROM a WHERE id IN [SELECT VALUE id FROM b]"))
+        self.assertIsNone(read_tables("SELECT * FROM a WHERE id IN SELECT VALUE id FROM b"))
+        self.assertEqual({"person"}, read_tables("SELECT * FROM person WHERE age > $age"))
+
+    def test_pure_functions_cached(self):
+        self.assertEqual({"person"}, read_tables("SELECT count() FROM person GROUP ALL"))
+        self.assertEqual({"person"}, read_tables("SELECT string::lowercase(name) FROM person WHERE age > 1.5"))
+        self.assertEqual({"person"}, read_tables("SELECT * FROM person WHERE (age > 18 OR admin = true)"))
+
+    def test_hit_and_miss(self):
+        connection = LiveConnection()
+        cache = QueryCache(connection)
+        first = cache.query("SELECT * FROM person;")
+        self.assertIs(first, cache.query("SELECT *  FROM person"))
+        cache.query("SELECT * FROM person;", {"x": 1})
+        self.assertEqual(2, len(connection.queries))
+        stats = cache.stats()
+        self.assertEqual((1, 2, 2), (stats["hits"], stats["misses"], stats["entries"]))
+        self.assertEqual(["person"], stats["live_tables"])
+
+    def test_live_invalidation(self):
+        connection = LiveConnection()
+        cache = QueryCache(connection)
+        cache.query("SELECT * FROM person;")
+        cache.query("SELECT * FROM book;")
+        connection.callbacks["person"]({"action": "UPDATE"})
+        cache.query("SELECT * FROM person;")
+        cache.query("SELECT * FROM book;")
+        self.assertEqual(3, len(connection.queries))
+        self.assertEqual(1, cache.stats()["invalidations"])
+
+    def test_writes_invalidate(self):
+        connection = LiveConnection(live=False)
+        cache = QueryCache(connection)
+        cache.query("SELECT * FROM person;")
+        cache.query("UPDATE person SET age = 1;")
+        cache.query("SELECT * FROM person;")
+        self.assertEqual(3, len(connection.queries))
+        self.assertEqual([], cache.stats()["live_tables"])
+        self.assertEqual(1, cache.stats()["uncached"])
+
+    def test_ttl(self):
+        connection = LiveConnection()
+        cache = QueryCache(connection, ttl=0.05)
+        cache.query("SELECT * FROM person;")
+        time.sleep(0.1)
+        cache.query("SELECT * FROM person;")
+        self.assertEqual(2, len(connection.queries))
+        self.assertEqual(1, cache.stats()["expirations"])
+
+    def test_lru(self):
+        connection = LiveConnection()
+        cache = QueryCache(connection, max_entries=2)
+        cache.query("SELECT * FROM a;")
+        cache.query("SELECT * FROM b;")
+        cache.query("SELECT * FROM a;")
+        cache.query("SELECT * FROM c;")
+        cache.query("SELECT * FROM a;")
+        cache.query("SELECT * FROM b;")
+        self.assertEqual(["SELECT * FROM a;", "SELECT * FROM b;", "SELECT * FROM c;", "SELECT * FROM b;"],
+                         connection.queries)
+        self.assertEqual(2, cache.stats()["evictions"])
+
+    def test_bytes(self):
+        connection = LiveConnection()
+        cache = QueryCache(connection, max_bytes=15)
+        cache.query("SELECT * FROM a;")
+        cache.query("SELECT * FROM b;")
+        stats = cache.stats()
+        self.assertEqual((1, 1), (stats["entries"], stats["evictions"]))
+        self.assertLessEqual(stats["bytes"], 15)
+
+    def test_table_and_close(self):
+        connection = LiveConnection()
+        cache = QueryCache(connection)
+        table = Table("person", connection).cached(cache)
+        table.select().where("age > 18").run()
+        table.select().where("age > 18").run()
+        self.assertEqual(1, len(connection.queries))
+        self.assertEqual(7, table.count())
+        cache.close()
+        self.assertEqual(["live-person"], connection.killed)
+        self.assertEqual(0, cache.stats()["entries"])
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            QueryCache(None, max_entries=0)
+
+
+if __name__ == '__main__':
+    main()
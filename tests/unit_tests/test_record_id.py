@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase, main
 
 from surrealist.errors import SurrealRecordIdError
@@ -44,6 +45,56 @@ class TestRecordId(TestCase):
         record_id = RecordId('person:8424486b-85b3-4448-ac8d-5d51083391c7')
         self.assertEqual(record_id.to_valid_string(), "person:⟨8424486b-85b3-4448-ac8d-5d51083391c7⟩")
 
+    def test_equality_and_hash(self):
+        self.assertEqual(RecordId("person:tobie"), RecordId("tobie", table="person"))
+        self.assertEqual(RecordId("person:⟨a-b⟩"), RecordId("person:`a-b`"))
+        self.assertNotEqual(RecordId("person:tobie"), "person:tobie")
+        self.assertEqual(2, len({RecordId("person:1"), RecordId("person:1"), RecordId("person:2")}))
+        self.assertEqual([RecordId("a:1"), RecordId("a:2")], sorted([RecordId("a:2"), RecordId("a:1")]))
+
+    def test_ordering(self):
+        self.assertLess(RecordId("person:9"), RecordId("person:10"))
+        self.assertLess(RecordId("person:-5"), RecordId("person:2"))
+        self.assertLess(RecordId("person:10"), RecordId("person:john"))
+        self.assertLess(RecordId("book:john"), RecordId("person:1"))
+        self.assertLessEqual(RecordId("person:1"), RecordId("person:1"))
+        self.assertGreater(RecordId("person:b"), RecordId("person:a"))
+        ids = RecordId.parse_many(["a:10", "b:1", "a:x", "a:9"])
+        self.assertEqual(["a:9", "a:10", "a:x", "b:1"], [record_id.naive_id for record_id in sorted(ids)])
+
+    def test_slots_and_immutable(self):
+        record_id = RecordId("person:tobie")
+        self.assertFalse(hasattr(record_id, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record_id._id_part = "other"
+
+    def test_colon_in_id_part(self):
+        record_id = RecordId("time:⟨12:30⟩")
+        self.assertEqual("time", record_id.table_part)
+        self.assertEqual("12:30", record_id.id_part)
+        self.assertEqual("time:⟨12:30⟩", record_id.to_valid_string())
+
+    def test_valid_string_cached(self):
+        record_id = RecordId("person:a-b")
+        self.assertIs(record_id.to_valid_string(), record_id.to_valid_string())
+
+    def test_parse_many(self):
+        self.assertEqual([RecordId("person:1"), RecordId("person:2")], RecordId.parse_many(["1", "person:2"], "person"))
+        self.assertEqual([RecordId("person:1"), RecordId("user:⟨a⟩")], RecordId.parse_many(["person:1", "user:⟨a⟩"]))
+        with self.assertRaises(SurrealRecordIdError):
+            RecordId.parse_many(["user:1"], table="person")
+        with self.assertRaises(SurrealRecordIdError):
+            RecordId.parse_many(["1"])
+
+    def test_intern(self):
+        self.assertIs(RecordId.intern("person:1"), RecordId.intern("1", table="person"))
+        first, second = RecordId.parse_many(["person:5", "person:5"], intern=True)
+        self.assertIs(first, second)
+
+    def test_pickle(self):
+        record_id = RecordId("person:⟨a-b⟩")
+        self.assertEqual(record_id, pickle.loads(pickle.dumps(record_id)))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,65 @@
+from unittest import TestCase, main
+
+from surrealist import RecordId, RecordIdArray
+from surrealist.errors import SurrealRecordIdError
+
+
+class TestRecordIdArray(TestCase):
+    def test_create(self):
+        ids = RecordIdArray("person", ["1", "person:2", RecordId("person:⟨a-b⟩"), "person:`c:d`"])
+        self.assertEqual(4, len(ids))
+        self.assertEqual(["1", "2", "a-b", "c:d"], list(ids.id_parts()))
+        self.assertEqual(RecordId("person:a-b"), ids[2])
+        self.assertEqual(RecordId("person:c:d"), ids[-1])
+        self.assertEqual([RecordId("person:1"), RecordId("person:2")], list(ids)[:2])
+        self.assertIn("person:2", ids)
+        self.assertIn(RecordId("person:c:d"), ids)
+        self.assertNotIn("user:2", ids)
+        with self.assertRaises(IndexError):
+            ids[4]
+
+    def test_wrong_table(self):
+        with self.assertRaises(SurrealRecordIdError):
+            RecordIdArray("person", ["user:1"])
+        with self.assertRaises(SurrealRecordIdError):
+            RecordIdArray("person", [RecordId("user:1")])
+        with self.assertRaises(SurrealRecordIdError):
+            RecordIdArray.from_ids(["person:1", "user:1"])
+        with self.assertRaises(SurrealRecordIdError):
+            RecordIdArray("person") | RecordIdArray("user")
+
+    def test_from_ids(self):
+        ids = RecordIdArray.from_ids(["person:1", "person:2"])
+        self.assertEqual("person", ids.table)
+        self.assertEqual(RecordIdArray("person", ["1", "2"]), ids)
+
+    def test_set_operations(self):
+        first = RecordIdArray("person", ["3", "1", "2", "1"])
+        second = RecordIdArray("person", ["2", "4"])
+        self.assertEqual(["3", "1", "2"], list(first.unique().id_parts()))
+        self.assertEqual(["3", "1", "2", "4"], list((first | second).id_parts()))
+        self.assertEqual(["2"], list((first & second).id_parts()))
+        self.assertEqual(["3", "1"], list((first - second).id_parts()))
+
+    def test_sort_and_slices(self):
+        ids = RecordIdArray("person", ["c", "a", "b"]).sort()
+        self.assertEqual(["a", "b", "c"], list(ids.id_parts()))
+        self.assertEqual(["b", "c"], list(ids[1:].id_parts()))
+        self.assertEqual(["a", "c"], list(ids[::2].id_parts()))
+        self.assertEqual(["c", "b", "a"], list(ids.sort(reverse=True).id_parts()))
+        self.assertEqual([["c", "b"], ["a"]], [list(chunk.id_parts()) for chunk in ids.chunks(2)])
+
+    def test_to_queries(self):
+        ids = RecordIdArray("person", ["1", "a-b", "c"])
+        self.assertEqual(["SELECT * FROM [person:1, person:⟨a-b⟩];", "SELECT * FROM [person:c];"],
+                         list(ids.to_queries(batch_size=2)))
+        self.assertEqual(["SELECT name FROM [person:1, person:⟨a-b⟩, person:c];"], list(ids.to_queries("name")))
+        self.assertEqual([], list(RecordIdArray("person").to_queries()))
+
+    def test_compact(self):
+        ids = RecordIdArray("person", (str(i) for i in range(1000)))
+        self.assertLess(ids.nbytes, 1000 * 12)
+
+
+if __name__ == '__main__':
+    main()
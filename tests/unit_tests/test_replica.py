@@ -0,0 +1,165 @@
+import time
+from unittest import TestCase, main
+
+from surrealist.ql.replica import TableReplica, _patched
+from surrealist.result import SurrealResult
+from tests.unit_tests.utils import FakeConnection
+
+
+class TableConnection(FakeConnection):
+    """
+    Table of records with one live query, selects of ids fail while reselect_failures is positive
+    """
+
+    def __init__(self, records):
+        super().__init__()
+        self.records = {record["id"]: record for record in records}
+        self.callback = None
+        self.killed = []
+        self.reselect_failures = 0
+
+    def custom_live(self, query, callback):
+        self.queries.append(query)
+        self.callback = callback
+        return SurrealResult(result="live-id")
+
+    def answer(self, query, variables):
+        if query.startswith("SELECT * FROM ["):
+            if self.reselect_failures:
+                self.reselect_failures -= 1
+                return ConnectionError("no connection")
+            keys = query[len("SELECT * FROM ["):-2].split(", ")
+            return [dict(self.records[key]) for key in keys if key in self.records]
+        return [dict(record) for record in self.records.values()]
+
+    def kill(self, live_id):
+        self.killed.append(live_id)
+        return SurrealResult(result=None)
+
+    def event(self, action, result, record=None):
+        payload = {"action": action, "id": "live-id", "result": result}
+        if record:
+            payload["record"] = record
+        self.callback({"result": payload})
+
+
+def records():
+    return [{"id": "currency:usd", "code": "USD", "rate": 1.0, "tags": ["main"]},
+            {"id": "currency:eur", "code": "EUR", "rate": 0.9, "tags": ["main"]},
+            {"id": "currency:gbp", "code": "GBP", "rate": 0.8, "tags": []}]
+
+
+def wait(replica):
+    for _ in range(100):
+        if not replica.stats()["dirty"] and replica._thread is None:
+            return
+        time.sleep(0.01)
+
+
+class TestReplica(TestCase):
+    def test_load_and_lookups(self):
+        connection = TableConnection(records())
+        with TableReplica(connection, "currency", indexes=["code"]).start() as replica:
+            self.assertEqual(["LIVE SELECT DIFF FROM currency;", "SELECT * FROM currency;"], connection.queries)
+            self.assertEqual(3, len(replica))
+            self.assertEqual("USD", replica.get("currency:usd")["code"])
+            self.assertEqual("EUR", replica.get("eur")["code"])
+            self.assertIn("gbp", replica)
+            self.assertIsNone(replica.get("currency:jpy"))
+            self.assertEqual("currency:gbp", replica.find_one(code="GBP")["id"])
+            self.assertEqual(2, len(replica.find(tags=["main"])))
+            self.assertEqual([], replica.find(code="USD", rate=0.5))
+            self.assertIsNone(replica.find_one(code="JPY"))
+        self.assertEqual(["live-id"], connection.killed)
+        self.assertEqual(2, len(connection.queries))
+
+    def test_events(self):
+        connection = TableConnection(records())
+        replica = TableReplica(connection, "currency", indexes=["code"]).start()
+        connection.event("CREATE", [{"op": "replace", "path": "/", "value": {"id": "currency:jpy", "code": "JPY"}}])
+        connection.event("UPDATE", [{"op": "replace", "path": "/code", "value": "US$"},
+                                    {"op": "add", "path": "/tags/-", "value": "old"}], "currency:usd")
+        connection.event("DELETE", None, "currency:gbp")
+        self.assertEqual("JPY", replica.find_one(code="JPY")["code"])
+        self.assertIsNone(replica.find_one(code="USD"))
+        self.assertEqual(["main", "old"], replica.find_one(code="US$")["tags"])
+        self.assertIsNone(replica.get("currency:gbp"))
+        self.assertEqual(2, len(connection.queries))
+        stats = replica.stats()
+        self.assertEqual((3, 3, 3), (stats["events"], stats["applied"], stats["records"]))
+
+    def test_patch_does_not_change_shared_record(self):
+        connection = TableConnection(records())
+        replica = TableReplica(connection, "currency").start()
+        old = replica.get("usd")
+        connection.event("UPDATE", [{"op": "remove", "path": "/tags/0"}], "currency:usd")
+        self.assertEqual(["main"], old["tags"])
+        self.assertEqual([], replica.get("usd")["tags"])
+
+    def test_reselect_unknown_patch(self):
+        connection = TableConnection(records())
+        replica = TableReplica(connection, "currency").start()
+        connection.records["currency:usd"]["code"] = "USD!"
+        connection.event("UPDATE", [{"op": "change", "path": "/code", "value": "@@ -1 +1 @@"}], "currency:usd")
+        wait(replica)
+        self.assertEqual("USD!", replica.get("usd")["code"])
+        self.assertIn("SELECT * FROM [currency:usd];", connection.queries)
+        self.assertEqual(1, replica.stats()["reselected"])
+
+    def test_retry_failed_sync(self):
+        connection = TableConnection(records())
+        replica = TableReplica(connection, "currency", retry_delay=0.01).start()
+        connection.records["currency:usd"]["code"] = "USD!"
+        connection.reselect_failures = 2
+        connection.event("UPDATE", [{"op": "change", "path": "/code", "value": "@@ -1 +1 @@"}], "currency:usd")
+        self.assertTrue(replica.stats()["stale"])
+        wait(replica)
+        stats = replica.stats()
+        self.assertEqual("USD!", replica.get("usd")["code"])
+        self.assertEqual((2, False, None), (stats["errors"], stats["stale"], stats["last_error"]))
+
+    def test_event_during_reselect(self):
+        connection = TableConnection(records())
+        replica = TableReplica(connection, "currency").start()
+        answer = connection.answer
+
+        def changed_while_selected(query, variables):
+            result = answer(query, variables)
+            if connection.queries.count(query) == 1:
+                connection.records["currency:usd"]["code"] = "USD!!"
+                connection.event("UPDATE", [{"op": "change", "path": "/code", "value": "@@"}], "currency:usd")
+            return result
+
+        connection.answer = changed_while_selected
+        connection.records["currency:usd"]["code"] = "USD!"
+        connection.event("UPDATE", [{"op": "change", "path": "/code", "value": "@@"}], "currency:usd")
+        wait(replica)
+        self.assertEqual("USD!!", replica.get("usd")["code"])
+        self.assertEqual(2, replica.stats()["reselected"])
+        connection.event("DELETE", None, "currency:usd")
+        self.assertEqual({}, replica._versions)
+
+    def test_reload_without_id(self):
+        connection = TableConnection(records())
+        replica = TableReplica(connection, "currency").start()
+        del connection.records["currency:eur"]
+        connection.event("UPDATE", [{"op": "replace", "path": "/rate", "value": 1}])
+        wait(replica)
+        self.assertIsNone(replica.get("eur"))
+        self.assertEqual(2, replica.stats()["reloads"])
+
+    def test_patched(self):
+        record = {"id": "a:1", "n": {"x": [1, 2]}, "s/t": 1}
+        self.assertEqual({"id": "a:1", "n": {"x": [0, 1], "y": 3}},
+                         _patched(record, [{"op": "add", "path": "/n/x/0", "value": 0},
+                                           {"op": "remove", "path": "/n/x/2"},
+                                           {"op": "add", "path": "/n/y", "value": 3},
+                                           {"op": "remove", "path": "/s~1t"}]))
+        with self.assertRaises(KeyError):
+            _patched(None, [{"op": "replace", "path": "/n", "value": 1}])
+        with self.assertRaises(ValueError):
+            _patched({}, [{"op": "move", "path": "/n", "from": "/m"}])
+
+
+if __name__ == '__main__':
+    main()
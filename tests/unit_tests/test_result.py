@@ -1,7 +1,7 @@
 from unittest import TestCase, main
 
 from surrealist import ResultHasNoValuesError
-from surrealist.result import SurrealResult, to_result
+from surrealist.result import LazySurrealResult, SurrealResult, to_lazy_result, to_result
 
 params = (
     (
@@ -174,6 +174,84 @@ class TestResult(TestCase):
         self.assertEqual("80a0d6cf-d5ff-41ce-a29a-27f04fb2e3df", res.ws_id)
         self.assertEqual('There was a problem with authentication', res.result)
 
+    def test_from_response_same_as_init(self):
+        params = (
+            {'result': [{'id': 'person:john'}], 'status': 'OK', 'time': '3.208µs'},
+            {'result': 'There was a problem with the database: some', 'status': 'ERR', 'time': '3.208µs'},
+            {'id': 'abc', 'result': [1, 2]},
+            {'id': 'abc', 'error': {'code': -32000, 'message': 'There was a problem with the database: some'}},
+            {'id': 123, 'status': 'ERR', 'result': 'token', 'time': '12s'},
+            {'code': 403, 'information': 'text'},
+        )
+        for in_ in params:
+            with self.subTest(f"from response {in_}"):
+                self.assertEqual(SurrealResult(**dict(in_)).to_dict(), SurrealResult.from_response(in_).to_dict())
+
+    def test_slots(self):
+        res = SurrealResult(result=1)
+        self.assertFalse(hasattr(res, "__dict__"))
+        with self.assertRaises(AttributeError):
+            res.other = 1
+
+    def test_to_result_single_value_list(self):
+        res = to_result({"id": "abc", "result": [5]})
+        self.assertEqual([5], res.result)
+        self.assertEqual("abc", res.ws_id)
+
+    def test_lazy_same_as_to_result(self):
+        params = (
+            '{"id":"abc","result":[{"id":"person:1","name":"a"},{"id":"person:2","name":"b"}]}',
+            '{"id":"abc","result":[{"result":[{"id":"person:1"}],"status":"OK","time":"10.2\u00b5s"}]}',
+            '{"id":"abc","result":[{"result":[],"status":"OK","time":"1ms"},{"result":[1],"status":"OK","time":"1ms"}]}',
+            '{"id":"abc","result":[{"result":"There was a problem with the database: x","status":"ERR","time":"1ms"}]}',
+            '{"id":"abc","error":{"code":-32000,"message":"There was a problem with the database: some"}}',
+            '{"id":"abc","result":"token"}',
+            '{"id":"abc","result":null}',
+            '{"id":"abc","result":{"id":"person:1","address":{"city":"Paris"}}}',
+            '{"result":[{"id":"person:1"}]}',
+            '[{"result":[{"id":"person:1"}],"status":"OK","time":"1ms"}]',
+        )
+        for in_ in params:
+            with self.subTest(f"lazy {in_}"):
+                self.assertEqual(to_result(in_).to_dict(), to_lazy_result(in_).to_dict())
+
+    def test_lazy_envelope_only(self):
+        res = to_lazy_result('{"id":"abc","result":[{"result":[{"id":"person:1","name":"a"},{"id":"person:\u27e8b\u27e9",'
+                             '"name":"b"}],"status":"OK","time":"10ms"}]}')
+        self.assertIsInstance(res, LazySurrealResult)
+        self.assertFalse(res.is_error())
+        self.assertFalse(res.is_empty())
+        self.assertEqual("10ms", res.time)
+        self.assertEqual("abc", res.ws_id)
+        self.assertEqual(2, res.count())
+        self.assertEqual(["person:1", "person:\u27e8b\u27e9"], res.ids)
+        self.assertFalse(res.is_decoded())
+        self.assertEqual("a", res.result[0]["name"])
+        self.assertTrue(res.is_decoded())
+        self.assertIsNone(res.raw())
+
+    def test_lazy_single_id(self):
+        res = to_lazy_result('{"id":"abc","result":{"id":"person:1","age":3}}')
+        self.assertEqual("person:1", res.id)
+        self.assertFalse(res.is_decoded())
+        res.result = [1]
+        self.assertEqual([1], res.result)
+
+    def test_lazy_ids_of_nested_records(self):
+        payloads = (
+            '[{"id":"person:1","friend":{"id":"person:2"}}]',
+            '[{"id":"person:1","tags":[{"id":"tag:1"}]}]',
+            '[{"id":"person:1","tags":[1,{"id":"tag:1"}]}]',
+            '[{"id":"person:1","text":"},{"}]',
+            '[{"id":"person:1","friend": {"id":"person:2"}}]',
+            '[{"id":"person:1"},{"name":"no id"}]',
+        )
+        for payload in payloads:
+            with self.subTest(f"nested {payload}"):
+                res = to_lazy_result(f'{{"id":"abc","result":{payload}}}')
+                self.assertEqual(to_result(f'{{"id":"abc","result":{payload}}}').ids, res.ids)
+                self.assertTrue(res.is_decoded())
+
 
 if __name__ == '__main__':
     main()
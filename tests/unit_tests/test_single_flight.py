@@ -0,0 +1,123 @@
+import threading
+import time
+from unittest import TestCase, main
+
+from surrealist.connections.pool import Pool
+from surrealist.connections.single_flight import SingleFlight, is_read, normalize
+from surrealist.errors import OperationOnClosedConnectionError
+from tests.unit_tests.utils import FakeConnection
+
+
+def slow_connection(delay=0.1):
+    return FakeConnection(lambda query, _variables: [query], delay=delay)
+
+
+class OneConnectionPool(Pool):
+    def _start(self):
+        pass  # no new connections for tests
+
+
+def in_threads(count, func):
+    results = [None] * count
+
+    def run(i):
+        results[i] = func(i)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(TestCase):
+    def test_normalize(self):
+        self.assertEqual("SELECT * FROM person WHERE name = 'a  b'",
+                         normalize("  SELECT *\n  FROM person\tWHERE name = 'a  b' ; "))
+        self.assertEqual('SELECT * FROM ⟨a  b⟩', normalize("SELECT  * FROM ⟨a  b⟩"))
+
+    def test_is_read(self):
+        self.assertTrue(is_read("SELECT * FROM person"))
+        self.assertTrue(is_read("select * FROM person WHERE name = 'a;b'"))
+        self.assertTrue(is_read("INFO FOR DB"))
+        self.assertFalse(is_read("SELECT * FROM person; DELETE person"))
+        self.assertFalse(is_read("UPDATE person SET a = 1"))
+        self.assertFalse(is_read("LIVE SELECT * FROM person"))
+
+    def test_keys(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.key("SELECT * FROM a;", {"x": 1, "y": 2}),
+                         flight.key("SELECT *  FROM a", {"y": 2, "x": 1}))
+        self.assertNotEqual(flight.key("SELECT * FROM a", {"x": 1}), flight.key("SELECT * FROM a", {"x": 2}))
+        self.assertIsNone(flight.key("DELETE a"))
+        self.assertIsNone(flight.key("SELECT * FROM a", {"x": object()}))
+
+    def test_shared(self):
+        connection = slow_connection()
+        flight = SingleFlight()
+        results = in_threads(5, lambda _: flight.call(lambda: connection.query("SELECT * FROM a"), "SELECT * FROM a"))
+        self.assertEqual(1, len(connection.queries))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({"calls": 5, "shared": 4, "executed": 1, "in_flight": 0}, flight.stats())
+        flight.call(lambda: connection.query("SELECT * FROM a"), "SELECT * FROM a")
+        self.assertEqual(2, len(connection.queries))
+
+    def test_writes_are_not_shared(self):
+        connection = slow_connection()
+        flight = SingleFlight()
+        in_threads(3, lambda _: flight.call(lambda: connection.query("DELETE a"), "DELETE a"))
+        self.assertEqual(3, len(connection.queries))
+        self.assertEqual(0, flight.stats()["shared"])
+
+    def test_error_is_shared(self):
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        def call(_):
+            try:
+                flight.call(fail, "SELECT * FROM a")
+            except ValueError as e:
+                return e
+
+        errors = in_threads(3, call)
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+        self.assertEqual(1, flight.stats()["executed"])
+
+    def test_timeout(self):
+        flight = SingleFlight()
+        leader = threading.Thread(target=flight.call, args=(lambda: time.sleep(0.3), "SELECT * FROM a"))
+        leader.start()
+        time.sleep(0.05)
+        with self.assertRaises(TimeoutError):
+            flight.call(lambda: None, "SELECT * FROM a", timeout=0.05)
+        leader.join()
+
+    def test_closed_pool_is_not_joined(self):
+        connection = slow_connection(delay=0.3)
+        pool = OneConnectionPool(connection, "http://127.0.0.1:8000", single_flight=SingleFlight())
+        leader = threading.Thread(target=pool.query, args=("SELECT * FROM a;",))
+        leader.start()
+        time.sleep(0.05)
+        closing = threading.Thread(target=pool.close)
+        closing.start()
+        time.sleep(0.05)
+        with self.assertRaises(OperationOnClosedConnectionError):
+            pool.query("SELECT * FROM a;")
+        leader.join()
+        closing.join()
+        self.assertEqual(1, len(connection.queries))
+
+    def test_pool(self):
+        connection = slow_connection()
+        pool = OneConnectionPool(connection, "http://127.0.0.1:8000", single_flight=SingleFlight())
+        in_threads(4, lambda _: pool.query("SELECT * FROM a;", {"x": 1}))
+        self.assertEqual(1, len(connection.queries))
+        self.assertEqual(3, pool.stats()["single_flight"]["shared"])
+
+
+if __name__ == '__main__':
+    main()
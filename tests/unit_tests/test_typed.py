@@ -0,0 +1,135 @@
+import datetime
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase, main, skipUnless
+
+from surrealist import RecordId, SurrealResult
+from surrealist.ql.statements.select import Select
+from surrealist.typed import decoder_for
+from surrealist.utils import parse_datetime
+from tests.unit_tests.utils import FakeConnection
+
+try:
+    import attr
+except ImportError:
+    attr = None
+
+
+@dataclass
+class Address:
+    city: str
+
+
+@dataclass
+class Person:
+    id: RecordId
+    name: str
+    created: Optional[datetime.datetime] = None
+    tags: List[str] = field(default_factory=list)
+    friends: List[RecordId] = field(default_factory=list)
+    address: Optional[Address] = None
+
+
+@dataclass
+class RenamedPerson:
+    id: RecordId
+    full_name: str = "unknown"
+    __surreal_fields__ = {"full_name": "name"}
+
+
+class SlotsPerson:
+    __slots__ = ("id", "name", "created")
+    id: RecordId
+    created: datetime.datetime
+
+
+class TestTyped(TestCase):
+    def test_dataclass(self):
+        result = SurrealResult(result=[{"id": "person:1", "name": "John", "created": "2024-01-24T11:31:06.347880800Z",
+                                        "friends": ["person:2"], "address": {"city": "Paris"}, "other": 1}])
+        person = result.as_type(Person)[0]
+        self.assertEqual("person:1", person.id.naive_id)
+        self.assertEqual(datetime.datetime(2024, 1, 24, 11, 31, 6, 347880), person.created)
+        self.assertEqual([], person.tags)
+        self.assertEqual("person:2", person.friends[0].naive_id)
+        self.assertEqual(Address("Paris"), person.address)
+
+    def test_dict_and_empty(self):
+        self.assertEqual("John", SurrealResult(result={"id": "person:1", "name": "John"}).as_type(Person).name)
+        self.assertIsNone(SurrealResult(result=None).as_type(Person))
+        self.assertEqual([], SurrealResult(result=[]).as_type(Person))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            SurrealResult(result=[{"name": "John"}]).as_type(Person)
+        with self.assertRaises(ValueError):
+            SurrealResult(error="some").as_type(Person)
+        with self.assertRaises(ValueError):
+            SurrealResult(result=[1]).as_type(Person)
+        with self.assertRaises(TypeError):
+            SurrealResult(result=[{"a": 1}]).as_type(int)
+
+    def test_rename(self):
+        person = SurrealResult(result=[{"id": "person:1", "name": "John"}]).as_type(RenamedPerson)[0]
+        self.assertEqual("John", person.full_name)
+        self.assertEqual("unknown", SurrealResult(result={"id": "person:1"}).as_type(RenamedPerson).full_name)
+
+    @skipUnless(sys.version_info >= (3, 10), "X | None is supported since python 3.10")
+    def test_union_type(self):
+        @dataclass
+        class Post:
+            author: "RecordId | None"
+            created: "datetime.datetime | None" = None
+
+        post = SurrealResult(result={"author": "person:1", "created": "2024-01-24T11:31:06Z"}).as_type(Post)
+        self.assertEqual(RecordId("person:1"), post.author)
+        self.assertEqual(datetime.datetime(2024, 1, 24, 11, 31, 6), post.created)
+
+    def test_errors_of_init_are_not_hidden(self):
+        @dataclass
+        class Checked:
+            name: str
+
+            def __post_init__(self):
+                raise KeyError("inner")
+
+        with self.assertRaises(KeyError):
+            SurrealResult(result={"name": "John"}).as_type(Checked)
+
+    @skipUnless(attr, "attrs is not installed")
+    def test_attrs(self):
+        @attr.s(auto_attribs=True)
+        class AttrsPerson:
+            id: RecordId
+            _name: str = "unknown"
+            tags: List[str] = attr.Factory(list)
+
+        person = SurrealResult(result={"id": "person:1", "name": "John"}).as_type(AttrsPerson)
+        self.assertEqual(("person:1", "John", []), (person.id.naive_id, person._name, person.tags))
+
+    def test_slots(self):
+        person = SurrealResult(result={"id": "person:1", "created": "2024-01-24T11:31:06Z"}).as_type(SlotsPerson)
+        self.assertEqual("person:1", person.id.naive_id)
+        self.assertIsNone(person.name)
+        self.assertEqual(datetime.datetime(2024, 1, 24, 11, 31, 6), person.created)
+
+    def test_decoder_cached(self):
+        self.assertIs(decoder_for(Person), decoder_for(Person))
+
+    def test_run_as(self):
+        connection = FakeConnection(lambda _query, _variables: [{"id": "person:1", "name": "John"}])
+        self.assertEqual("John", Select(connection, "person").run_as(RenamedPerson)[0].full_name)
+
+    def test_parse_datetime(self):
+        self.assertEqual(datetime.datetime(2024, 1, 24, 11, 31, 6, 300000), parse_datetime("2024-01-24T11:31:06.3Z"))
+        self.assertEqual(datetime.timezone(datetime.timedelta(hours=3)),
+                         parse_datetime("2024-01-24T11:31:06+03:00").tzinfo)
+        for wrong in ("abc", "2024-01-24", "2024-13-24T11:31:06Z", "2024-01-24T11:31:06.x1Z"):
+            with self.subTest(f"wrong {wrong}"):
+                with self.assertRaises(ValueError):
+                    parse_datetime(wrong)
+
+
+if __name__ == '__main__':
+    main()
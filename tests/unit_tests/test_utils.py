@@ -3,7 +3,7 @@ from unittest import TestCase, main
 
 from surrealist.utils import (to_datetime, to_surreal_datetime_str, mask_pass, clean_dates,
                               dict_to_json_str,
-                              RecordId, list_to_json_str, tuple_to_json_str)
+                              RecordId, list_to_json_str, tuple_to_json_str, safe_dumps, parse_duration)
 
 
 class TestUtils(TestCase):
@@ -14,12 +14,21 @@ class TestUtils(TestCase):
 
     def test_to_surreal_datetime_str(self):
         self.assertEqual(to_surreal_datetime_str(datetime.datetime(2018, 1, 1, 0, 0)), "d'2018-01-01T00:00:00.000000Z'")
+        moscow = datetime.timezone(datetime.timedelta(hours=3))
+        self.assertEqual(to_surreal_datetime_str(datetime.datetime(2018, 1, 1, 3, 0, tzinfo=moscow)), "d'2018-01-01T00:00:00.000000Z'")
+
+    def test_safe_dumps_datetime(self):
+        date = datetime.datetime(2018, 1, 1, 0, 0)
+        self.assertEqual("d'2018-01-01T00:00:00.000000Z'", safe_dumps(date))
+        self.assertEqual("[1, d'2018-01-01T00:00:00.000000Z', d'2018-01-01T00:00:00.000000Z']", safe_dumps([date, 1, to_surreal_datetime_str(date)]))
+        self.assertEqual("(\"d'x'\", d'2018-01-01T00:00:00.000000Z')", safe_dumps(("d'x'", date)))
 
     def test_mask_pass(self):
         self.assertEqual(mask_pass(
             "{'method': 'signin', 'params': [{'user': 'root', 'pass': '******', 'NS': 'test', 'DB': 'test'}]}"),
             "{'method': 'signin', 'params': [{'user': 'root', 'pass': '******', 'NS': 'test', 'DB': 'test'}]}")
         self.assertEqual(mask_pass('{"user":"user", "pass": "123123"}'), '{"user":"user", "pass": "******"}')
+        self.assertEqual(mask_pass('{"user":"user"}'), '{"user":"user"}')
 
     def test_clean_dates(self):
         text = ""
@@ -57,6 +66,28 @@ class TestUtils(TestCase):
         self.assertEqual(tuple_to_json_str((RecordId("person:john"), RecordId("person:tobie"))), '(person:john, person:tobie)')
         self.assertEqual(tuple_to_json_str((1, [RecordId("person:john"), RecordId("person:tobie")])), '(1, [person:john, person:tobie])')
 
+    def test_safe_dumps_order_and_keys(self):
+        self.assertEqual('[1, "a", {"b": 2}, [3]]', safe_dumps([{"b": 2}, 1, [3], "a"]))
+        self.assertEqual('{"a": 1, "t": [1, 2], "b": [2], "c": {"d": 3}}', safe_dumps({"b": [2], "a": 1, "c": {"d": 3}, "t": (1, 2)}))
+        self.assertEqual('{"\\u00fc": 1, "\u00e9": [1]}', safe_dumps({"\u00e9": [1], "\u00fc": 1}))
+        self.assertEqual('{"2": 1, "True": [1]}', safe_dumps({True: [1], 2: 1}))
+        self.assertEqual('[(1, person:john), {"a": [person:tobie]}]', safe_dumps([(1, RecordId("person:john")), {"a": [RecordId("person:tobie")]}]))
+
+    def test_safe_dumps_bulk(self):
+        records = [{"name": f"John {i}", "tags": ["a"], "author": RecordId(f"user:{i % 3}") if i % 2 else None} for i in range(1000)]
+        text = safe_dumps(records)
+        self.assertTrue(text.startswith('[{"name": "John 0", "author": null, "tags": ["a"]}, {"name": "John 1", "tags": ["a"], "author": user:1}'))
+        self.assertEqual(1000, text.count('"tags": ["a"]'))
+
+    def test_parse_duration(self):
+        self.assertAlmostEqual(0.0015, parse_duration("1.5ms"))
+        self.assertAlmostEqual(0.00012, parse_duration("120µs"))
+        self.assertAlmostEqual(90.0, parse_duration("1m30s"))
+        self.assertAlmostEqual(2e-7, parse_duration("200ns"))
+        with self.assertRaises(ValueError):
+            parse_duration("fast")
+        with self.assertRaises(ValueError):
+            parse_duration("1.5ms and more")
 
 
 if __name__ == '__main__':
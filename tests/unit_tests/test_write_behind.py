@@ -0,0 +1,103 @@
+import time
+from unittest import TestCase, main
+
+from surrealist.errors import OperationOnClosedConnectionError
+from surrealist.result import SurrealResult
+from surrealist.write_behind import WriteBehindBuffer
+from tests.unit_tests.utils import FakeConnection
+
+
+class TestWriteBehind(TestCase):
+    def test_coalesce(self):
+        connection = FakeConnection()
+        buffer = WriteBehindBuffer(connection, max_delay=10)
+        buffer.merge("counter:a", {"views": 1, "meta": {"x": 1}})
+        buffer.merge("counter:a", {"views": 2, "meta": {"y": 2}})
+        buffer.upsert("counter:b", {"views": 1})
+        buffer.merge("counter:b", {"likes": 1})
+        self.assertEqual(2, buffer.pending)
+        buffer.close()
+        self.assertEqual(['UPSERT counter:a MERGE {"views": 2, "meta": {"x": 1, "y": 2}};'
+                          'UPSERT counter:b CONTENT {"views": 1, "likes": 1};'], connection.queries)
+        stats = buffer.stats()
+        self.assertEqual(4, stats["calls"])
+        self.assertEqual(2, stats["coalesced"])
+        self.assertEqual(2, stats["flushed_records"])
+        self.assertEqual(0, stats["pending"])
+
+    def test_upsert_replaces(self):
+        connection = FakeConnection()
+        with WriteBehindBuffer(connection, max_delay=10) as buffer:
+            buffer.merge("counter:a", {"views": 1})
+            buffer.upsert("counter:a", {"likes": 1})
+        self.assertEqual(['UPSERT counter:a CONTENT {"likes": 1};'], connection.queries)
+
+    def test_data_is_copied(self):
+        connection = FakeConnection()
+        data = {"views": 1}
+        with WriteBehindBuffer(connection, max_delay=10) as buffer:
+            buffer.merge("counter:a", data)
+            data["views"] = 2
+        self.assertEqual(['UPSERT counter:a MERGE {"views": 1};'], connection.queries)
+
+    def test_flush_by_time(self):
+        connection = FakeConnection()
+        buffer = WriteBehindBuffer(connection, max_delay=0.05)
+        buffer.merge("counter:a", {"views": 1})
+        time.sleep(0.3)
+        self.assertEqual(1, len(connection.queries))
+        buffer.close()
+        self.assertEqual(1, len(connection.queries))
+
+    def test_flush_by_size(self):
+        connection = FakeConnection()
+        flushed = []
+        buffer = WriteBehindBuffer(connection, max_delay=10, max_records=2, on_flush=flushed.append)
+        buffer.merge("counter:a", {"views": 1})
+        buffer.merge("counter:b", {"views": 1})
+        time.sleep(0.3)
+        self.assertEqual([2], flushed)
+        buffer.close()
+
+    def test_bounded(self):
+        connection = FakeConnection()
+        buffer = WriteBehindBuffer(connection, max_delay=0.05, max_records=2, max_pending=2)
+        for i in range(10):
+            buffer.merge(f"counter:{i}", {"views": 1})
+            self.assertLessEqual(buffer.pending, 2)
+        buffer.close()
+        self.assertEqual(10, buffer.stats()["flushed_records"])
+
+    def test_errors(self):
+        failed = []
+        connection = FakeConnection(lambda _query, _variables: ConnectionError("lost"))
+        with WriteBehindBuffer(connection, max_delay=10, on_error=lambda records, error: failed.append(
+                (records, error))) as buffer:
+            buffer.merge("counter:a", {"views": 1})
+        self.assertEqual([({"counter:a": ("MERGE", {"views": 1})}, "ConnectionError: lost")], failed)
+        self.assertEqual(1, buffer.stats()["failed_records"])
+
+    def test_failed_statements(self):
+        failed = []
+        result = SurrealResult(result=[{"status": "OK", "result": [], "time": "1ms"},
+                                       {"status": "ERR", "result": "wrong field", "time": "1ms"}])
+        with WriteBehindBuffer(FakeConnection(lambda _query, _variables: result), max_delay=10,
+                               on_error=lambda records, error: failed.append((records, error))) as buffer:
+            buffer.merge("counter:a", {"views": 1})
+            buffer.merge("counter:b", {"views": 1})
+        self.assertEqual([({"counter:b": ("MERGE", {"views": 1})}, "wrong field")], failed)
+        self.assertEqual(1, buffer.stats()["flushed_records"])
+
+    def test_closed(self):
+        buffer = WriteBehindBuffer(FakeConnection())
+        buffer.close()
+        with self.assertRaises(OperationOnClosedConnectionError):
+            buffer.merge("counter:a", {"views": 1})
+
+    def test_wrong_parameters(self):
+        with self.assertRaises(ValueError):
+            WriteBehindBuffer(None, max_records=10, max_pending=5)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from surrealist.result import SurrealResult
+
+
+class FakeConnection:
+    """
+    Connection for unit tests without SurrealDB: it keeps sent queries and their variables, and answers with the
+    answer function of a query and variables, or with the given pages one by one (an empty list after them).
+    An answer can be a SurrealResult, an exception to raise or any value for the result. Tests with their own tables
+    override the answer method
+    """
+
+    def __init__(self, answer: Optional[Callable[[str, Optional[Dict]], Any]] = None, pages: Optional[List] = None,
+                 delay: float = 0.0, failures: int = 0, error: type = ConnectionError):
+        """
+        :param answer: function of the query and variables
+        :param pages: answers for queries in order
+        :param delay: seconds to sleep on each query, to imitate network
+        :param failures: number of the first queries, which raise the error
+        :param error: class of the error for failures
+        """
+        self.queries = []
+        self.variables = []
+        self.pages = pages
+        self.delay = delay
+        self.failures = failures
+        self.error = error
+        self.closed = False
+        self.lock = Lock()
+        self._answer = answer
+
+    def query(self, query: str, variables: Optional[Dict] = None) -> SurrealResult:
+        with self.lock:
+            self.queries.append(query)
+            self.variables.append(variables)
+            if self.failures:
+                self.failures -= 1
+                raise self.error("connection lost")
+        if self.delay:
+            time.sleep(self.delay)
+        answer = self.answer(query, variables)
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer if isinstance(answer, SurrealResult) else SurrealResult(result=answer)
+
+    def answer(self, query: str, variables: Optional[Dict]) -> Any:
+        if self._answer is not None:
+            return self._answer(query, variables)
+        with self.lock:
+            return self.pages.pop(0) if self.pages else []
+
+    def close(self):
+        self.closed = True